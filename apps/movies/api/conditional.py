@@ -0,0 +1,71 @@
+import hashlib
+from functools import wraps
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from apps.movies.models import DataVersion
+
+from .renderers import FastJSONRenderer
+
+
+def request_data_version(request) -> DataVersion:
+    """
+    Reads the DataVersion once per request; the ETag, Last-Modified and cache
+    keys of a response all derive from the same read.
+    """
+    if not hasattr(request, "_movies_data_version"):
+        request._movies_data_version = DataVersion.current()
+    return request._movies_data_version
+
+
+def _is_json(request) -> bool:
+    # Only JSON responses are byte-stable; the browsable API renders per-request
+    # HTML (forms, CSRF tokens), which a strong ETag must not cover.
+    renderer = getattr(request, "accepted_renderer", None)
+    return renderer is not None and renderer.format == "json"
+
+
+def data_version_etag(request, *args, **kwargs):
+    if not _is_json(request):
+        return None
+    version = request_data_version(request)
+    key = f"{version.token}:{request.get_full_path()}:{request.accepted_media_type}"
+    return '"{}"'.format(hashlib.sha1(key.encode()).hexdigest())
+
+
+def data_version_last_modified(request, *args, **kwargs):
+    if not _is_json(request):
+        return None
+    return request_data_version(request).updated_at
+
+
+# Conditional GET for viewset methods: a matching If-None-Match or
+# If-Modified-Since returns 304 after a single DataVersion read, before the
+# handler runs any query or serializer.
+conditional_on_data_version = method_decorator(
+    condition(
+        etag_func=data_version_etag, last_modified_func=data_version_last_modified
+    )
+)
+
+
+def async_conditional_on_data_version(view):
+    """
+    Conditional GET for async JSON views.
+
+    The DataVersion is read with the async ORM before condition() runs, since its
+    ETag and Last-Modified functions are synchronous.
+    """
+    conditional_view = condition(
+        etag_func=data_version_etag, last_modified_func=data_version_last_modified
+    )(view)
+
+    @wraps(view)
+    async def inner(request, *args, **kwargs):
+        request._movies_data_version = await DataVersion.acurrent()
+        request.accepted_renderer = FastJSONRenderer()
+        request.accepted_media_type = FastJSONRenderer.media_type
+        return await conditional_view(request, *args, **kwargs)
+
+    return inner
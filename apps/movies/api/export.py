@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from itertools import islice
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from .serializers import MovieSerializer
+
+EXPORT_CHUNK_SIZE = 2000
+
+CSV_HEADER = ["year", "title", "studios", "producers", "winner"]
+
+
+def _chunks(queryset, chunk_size):
+    # iterator() with a chunk_size still honours prefetch_related, one batch of
+    # related rows per chunk, so memory stays bounded by the chunk.
+    movies = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(movies, chunk_size)):
+        yield chunk
+
+
+def iter_ndjson(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields movies as newline-delimited JSON, one MovieSerializer object per line.
+    """
+    for chunk in _chunks(queryset, chunk_size):
+        yield "".join(
+            json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+            + "\n"
+            for data in MovieSerializer(chunk, many=True).data
+        )
+
+
+def iter_csv(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields movies in the `;`-delimited movielist.csv format.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\n")
+
+    writer.writerow(CSV_HEADER)
+    for chunk in _chunks(queryset, chunk_size):
+        for movie in chunk:
+            writer.writerow(
+                [
+                    movie.year,
+                    movie.title,
+                    ", ".join(studio.name for studio in movie.studio.all()),
+                    ", ".join(producer.name for producer in movie.producer.all()),
+                    "yes" if movie.winner else "",
+                ]
+            )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
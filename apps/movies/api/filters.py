@@ -0,0 +1,179 @@
+from django.db import router
+from django.db.models.expressions import RawSQL
+from django.http import Http404
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from django_filters.utils import translate_validation
+from rest_framework.filters import SearchFilter
+
+from apps.movies.models import Movie
+from apps.movies.services.search import (
+    TITLE_INDEX,
+    match_expression,
+    title_index_available,
+    title_ranks,
+)
+
+
+class MovieFilterSet(filters.FilterSet):
+    """
+    FilterSet for movies; every filter is backed by an index.
+
+    Attributes:
+        year (int): Exact release year.
+        year_from (int): Minimum release year, inclusive.
+        year_to (int): Maximum release year, inclusive.
+        winner (bool): Award winners only (true) or nominees only (false).
+        producer (int): Id of an associated producer.
+        producer_name (str): Exact name of an associated producer.
+        studio (int): Id of an associated studio.
+        studio_name (str): Exact name of an associated studio.
+    """
+
+    year = filters.NumberFilter()
+    year_from = filters.NumberFilter(field_name="year", lookup_expr="gte")
+    year_to = filters.NumberFilter(field_name="year", lookup_expr="lte")
+    winner = filters.BooleanFilter(method="filter_winner")
+    producer = filters.NumberFilter(field_name="producer")
+    producer_name = filters.CharFilter(field_name="producer__name")
+    studio = filters.NumberFilter(field_name="studio")
+    studio_name = filters.CharFilter(field_name="studio__name")
+
+    class Meta:
+        model = Movie
+        fields = []
+
+    def filter_winner(self, queryset, name, value):
+        # `winner=True` compiles to a bare `WHERE winner`, which SQLite cannot match
+        # to the (winner, year) index; `IN (...)` keeps an indexable comparison.
+        return queryset.filter(winner__in=[value])
+
+
+class MovieSearchFilter(SearchFilter):
+    """
+    Title search backed by the SQLite FTS5 index when it is available.
+
+    Every search term matches as a token prefix (`?search=fri 13` finds "Friday the
+    13th") and results are ordered by FTS5 rank, best match first. On databases
+    without the index it falls back to DRF's `LIKE`-based SearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or not title_index_available(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        match = match_expression(terms)
+        matches = RawSQL(
+            f"SELECT rowid FROM {TITLE_INDEX} WHERE {TITLE_INDEX} MATCH %s", [match]
+        )
+        rank = RawSQL(
+            f"SELECT rank FROM {TITLE_INDEX} WHERE {TITLE_INDEX} MATCH %s "
+            f"AND rowid = {Movie._meta.db_table}.id",
+            [match],
+        )
+        return (
+            queryset.filter(id__in=matches)
+            .annotate(search_rank=rank)
+            .order_by("search_rank", "year", "id")
+        )
+
+
+def search_ranks(request):
+    """
+    FTS5 ranks by movie id of the MovieSearchFilter terms of a request, or None
+      without search terms.
+    """
+    terms = MovieSearchFilter().get_search_terms(request)
+    if not terms:
+        return None
+    return title_ranks(terms, router.db_for_read(Movie))
+
+
+def snapshot_movies(snapshot, request, ranks=None, pk=None, rank_order=True) -> list:
+    """
+    Applies MovieFilterSet and the title search to an in-memory snapshot.
+
+    Matches the SQL of MovieFilterSet and MovieSearchFilter: the same validation
+    errors, lookups (decimal values truncated to integers) and order, and a movie
+    repeated once per matching producer or studio name, as the joins return it.
+
+    Args:
+        snapshot (apps.movies.snapshot.Snapshot): Data to filter.
+        request (Request): Request holding the filter parameters.
+        ranks (dict, optional): FTS5 ranks of the search, from `search_ranks`.
+        pk (str, optional): Only considers the movie with this id, a URL lookup
+          value.
+        rank_order (bool): Orders search results by rank, as list does, instead of
+          by (year, id).
+
+    Returns:
+        list of MovieRecord: Matching movies.
+    """
+    filterset = MovieFilterSet(
+        request.query_params, queryset=Movie.objects.none(), request=request
+    )
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+    values = {
+        name: value
+        for name, value in filterset.form.cleaned_data.items()
+        if value not in EMPTY_VALUES
+    }
+
+    # IntegerField lookups truncate decimals with int().
+    low = [int(values[name]) for name in ("year", "year_from") if name in values]
+    high = [int(values[name]) for name in ("year", "year_to") if name in values]
+    low, high = max(low, default=None), min(high, default=None)
+    winner = values.get("winner")
+    producer = int(values["producer"]) if "producer" in values else None
+    studio = int(values["studio"]) if "studio" in values else None
+    producer_ids = studio_ids = None
+    if "producer_name" in values:
+        producer_ids = set(snapshot.producer_ids(values["producer_name"]))
+    if "studio_name" in values:
+        studio_ids = set(snapshot.studio_ids(values["studio_name"]))
+
+    if pk is not None:
+        try:
+            movie = snapshot.get(int(pk))
+        except (TypeError, ValueError):
+            # As rest_framework.generics.get_object_or_404.
+            raise Http404
+        candidates = [movie] if movie is not None else []
+    elif producer is not None:
+        candidates = snapshot.producer_movies(producer)
+    elif studio is not None:
+        candidates = snapshot.studio_movies(studio)
+    elif ranks is not None:
+        candidates = sorted(
+            filter(None, map(snapshot.get, ranks)), key=lambda m: (m.year, m.id)
+        )
+    else:
+        candidates = snapshot.between(low, high, winner)
+        if producer_ids is None and studio_ids is None:
+            # The year and winner indexes answered every filter.
+            return candidates
+
+    movies = []
+    for movie in candidates:
+        if (
+            (low is not None and movie.year < low)
+            or (high is not None and movie.year > high)
+            or (winner is not None and movie.winner != winner)
+            or (producer is not None and producer not in movie.producers)
+            or (studio is not None and studio not in movie.studios)
+            or (ranks is not None and movie.id not in ranks)
+        ):
+            continue
+        repeat = 1
+        if producer_ids is not None:
+            repeat *= sum(related in producer_ids for related in movie.producers)
+        if studio_ids is not None:
+            repeat *= sum(related in studio_ids for related in movie.studios)
+        movies.extend([movie] * repeat)
+
+    if ranks is not None and rank_order:
+        # Stable: ties stay in (year, id) order.
+        movies.sort(key=lambda movie: ranks[movie.id])
+    return movies
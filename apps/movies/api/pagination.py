@@ -0,0 +1,112 @@
+import base64
+import binascii
+from bisect import bisect_right
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class MovieKeysetPagination(BasePagination):
+    """
+    Forward-only keyset (cursor) pagination over `(year, id)`.
+
+    The cursor encodes the `(year, id)` of the last movie of a page; the next page
+    seeks past it through the `(year, id)` index. Unlike page numbers it runs no
+    COUNT query and no OFFSET, so every page costs the same as the first one.
+    Pages may hold model instances, `values_list(named=True)` rows or snapshot
+    records.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if isinstance(queryset, list):
+            return self.set_page(self.get_page_list(queryset, request))
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    def get_page_queryset(self, queryset, request):
+        """
+        Returns the unevaluated query of the page, plus one row to detect a next page.
+        """
+        self.request = request
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by("year", "id")
+        if position is not None:
+            year, pk = position
+            # `year >= ?` lets the database seek on the index; the second term only
+            # skips the movies of that same year already returned.
+            queryset = queryset.filter(
+                Q(year__gte=year) & (Q(year__gt=year) | Q(id__gt=pk))
+            )
+
+        return queryset[: self.page_size + 1]
+
+    def get_page_list(self, movies: list, request) -> list:
+        """
+        Same page as `get_page_queryset`, from a list sorted by (year, id).
+        """
+        self.request = request
+        position = self.decode_cursor(request)
+        start = 0
+        if position is not None:
+            start = bisect_right(movies, position, key=lambda m: (m.year, m.id))
+        return movies[start : start + self.page_size + 1]
+
+    def set_page(self, results: list) -> list:
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(last.year, last.id),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            }
+        ]
+
+    def encode_cursor(self, year, pk) -> str:
+        return base64.urlsafe_b64encode(f"{year}:{pk}".encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            year, pk = base64.urlsafe_b64decode(encoded.encode("ascii")).split(b":")
+            return int(year), int(pk)
+        except (binascii.Error, TypeError, UnicodeEncodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
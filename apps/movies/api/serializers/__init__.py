@@ -1,4 +1,31 @@
-from .movie import MovieSerializer
+from .aggregate import (
+    AggregatesQuerySerializer,
+    AggregatesSerializer,
+    EntityAggregateSerializer,
+    YearAggregateSerializer,
+)
+from .interval import (
+    WinIntervalSerializer,
+    WinIntervalsQuerySerializer,
+    WinIntervalsSerializer,
+)
+from .movie import (
+    MovieBatchRequestSerializer,
+    MovieBatchSerializer,
+    MovieSerializer,
+)
 from .producer import AwardsIntervalSerializer
 
-__all__ = ["MovieSerializer", "AwardsIntervalSerializer"]
+__all__ = [
+    "AggregatesQuerySerializer",
+    "AggregatesSerializer",
+    "EntityAggregateSerializer",
+    "MovieBatchRequestSerializer",
+    "MovieBatchSerializer",
+    "MovieSerializer",
+    "AwardsIntervalSerializer",
+    "WinIntervalSerializer",
+    "WinIntervalsQuerySerializer",
+    "WinIntervalsSerializer",
+    "YearAggregateSerializer",
+]
@@ -0,0 +1,67 @@
+from rest_framework import serializers
+
+# Largest number of producers and studios a query may ask for.
+MAX_LIMIT = 100
+
+
+class AggregatesQuerySerializer(serializers.Serializer):
+    """
+    Serializer validating the query parameters of the aggregates endpoint.
+
+    Attributes:
+        year_from (int): First year of the `years` facet, inclusive.
+        year_to (int): Last year of the `years` facet, inclusive.
+        limit (int): Number of producers and studios to return.
+    """
+
+    year_from = serializers.IntegerField(required=False)
+    year_to = serializers.IntegerField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_LIMIT, default=10)
+
+
+class YearAggregateSerializer(serializers.Serializer):
+    """
+    Serializer for representing the award counts of a year.
+
+    Attributes:
+        year (int): Release year.
+        nominations (int): Movies of the year.
+        wins (int): Winning movies of the year.
+    """
+
+    year = serializers.IntegerField()
+    nominations = serializers.IntegerField()
+    wins = serializers.IntegerField()
+
+
+class EntityAggregateSerializer(serializers.Serializer):
+    """
+    Serializer for representing the award counts of a producer or studio.
+
+    Attributes:
+        id (int): Id of the producer or studio.
+        name (str): Name of the producer or studio.
+        nominations (int): Movies of the producer or studio.
+        wins (int): Winning movies of the producer or studio.
+    """
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    nominations = serializers.IntegerField()
+    wins = serializers.IntegerField()
+
+
+class AggregatesSerializer(serializers.Serializer):
+    """
+    Serializer for representing the dashboard facets.
+
+    Attributes:
+        years (list of YearAggregateSerializer): Counts of each year, in year order.
+        producers (list of EntityAggregateSerializer): Producers with the most
+         wins.
+        studios (list of EntityAggregateSerializer): Studios with the most wins.
+    """
+
+    years = YearAggregateSerializer(many=True)
+    producers = EntityAggregateSerializer(many=True)
+    studios = EntityAggregateSerializer(many=True)
@@ -0,0 +1,160 @@
+"""
+Serialization fast path for the read endpoints.
+
+Builds the same dicts as MovieSerializer, ProducerWinnerIntervalSerializer,
+WinIntervalSerializer and AggregatesSerializer straight from `values_list()` rows,
+skipping model instantiation and the DRF field machinery. The serializers stay the
+source of truth for the API schema; these functions must produce exactly their
+output.
+"""
+
+from collections import defaultdict
+
+from django.conf import settings
+
+from apps.movies.models import Producer, Studio
+
+MOVIE_FIELDS = ("id", "year", "title", "winner")
+
+
+def movie_rows(queryset):
+    """
+    Turns a Movie queryset into one of `(id, year, title, winner)` named rows, plus
+      `lookups` with settings.MOVIES_DENORMALIZED_LOOKUPS.
+    """
+    fields = MOVIE_FIELDS
+    if settings.MOVIES_DENORMALIZED_LOOKUPS:
+        fields += ("lookups",)
+    return queryset.prefetch_related(None).values_list(*fields, named=True)
+
+
+def _lookup_rows(model, movie_ids):
+    # Same query (and so the same row order) as prefetch_related on the
+    # Movie -> model relation.
+    return model.objects.filter(movies__in=movie_ids).values_list(
+        "movies", "id", "name"
+    )
+
+
+def _group_lookups(rows) -> dict:
+    lookups = defaultdict(list)
+    for movie_id, pk, name in rows:
+        lookups[movie_id].append({"id": pk, "name": name})
+    return lookups
+
+
+def _movie_dicts(rows, studios, producers) -> list:
+    movies = []
+    for row in rows:
+        lookups = getattr(row, "lookups", None)
+        if lookups is None:
+            lookups = {
+                "studios": studios.get(row.id, []),
+                "producers": producers.get(row.id, []),
+            }
+        movies.append(
+            {
+                "id": row.id,
+                "year": row.year,
+                "title": row.title,
+                "winner": row.winner,
+                "studios": lookups["studios"],
+                "producers": lookups["producers"],
+            }
+        )
+    return movies
+
+
+def _missing_lookups(rows) -> list:
+    # Movies without denormalized lookups, read from the relations instead.
+    return [row.id for row in rows if getattr(row, "lookups", None) is None]
+
+
+def serialize_movies(rows) -> list:
+    """
+    Serializes movie rows as MovieSerializer does, with one query per relation
+      unless every row carries its denormalized lookups.
+    """
+    rows = list(rows)
+    ids = _missing_lookups(rows)
+    if not ids:
+        return _movie_dicts(rows, {}, {})
+    studios = _group_lookups(_lookup_rows(Studio, ids))
+    producers = _group_lookups(_lookup_rows(Producer, ids))
+    return _movie_dicts(rows, studios, producers)
+
+
+async def aserialize_movies(rows: list) -> list:
+    """
+    Async version of `serialize_movies`, for already fetched rows.
+    """
+    ids = _missing_lookups(rows)
+    if not ids:
+        return _movie_dicts(rows, {}, {})
+    studios = _group_lookups([row async for row in _lookup_rows(Studio, ids)])
+    producers = _group_lookups([row async for row in _lookup_rows(Producer, ids)])
+    return _movie_dicts(rows, studios, producers)
+
+
+def serialize_awards_intervals(intervals: dict) -> dict:
+    """
+    Serializes `{"min": [...], "max": [...]}` as AwardsIntervalSerializer does.
+    """
+    return {
+        key: [
+            {
+                "producer": str(item["name"]),
+                "interval": int(item["interval"]),
+                "previousWin": int(item["award_last_year"]),
+                "followingWin": int(item["award_year"]),
+            }
+            for item in intervals[key]
+        ]
+        for key in ("min", "max")
+    }
+
+
+def serialize_win_intervals(intervals: dict) -> dict:
+    """
+    Serializes `WinIndex.extremes` as WinIntervalsSerializer does.
+    """
+    return {
+        key: [
+            {
+                "name": str(item["name"]),
+                "interval": int(item["interval"]),
+                "previousWin": int(item["award_last_year"]),
+                "followingWin": int(item["award_year"]),
+            }
+            for item in intervals[key]
+        ]
+        for key in ("min", "max")
+    }
+
+
+def serialize_aggregates(data: dict) -> dict:
+    """
+    Serializes `rollups.aggregates` as AggregatesSerializer does.
+    """
+    return {
+        "years": [
+            {
+                "year": int(row["year"]),
+                "nominations": int(row["nominations"]),
+                "wins": int(row["wins"]),
+            }
+            for row in data["years"]
+        ],
+        **{
+            key: [
+                {
+                    "id": int(row["id"]),
+                    "name": str(row["name"]),
+                    "nominations": int(row["nominations"]),
+                    "wins": int(row["wins"]),
+                }
+                for row in data[key]
+            ]
+            for key in ("producers", "studios")
+        },
+    }
@@ -0,0 +1,56 @@
+from rest_framework import serializers
+
+from apps.movies.services.intervals import WIN_ENTITIES
+
+# Largest number of interval lengths a query may ask for at each end.
+MAX_K = 100
+
+
+class WinIntervalsQuerySerializer(serializers.Serializer):
+    """
+    Serializer validating the query parameters of the awards intervals endpoint.
+
+    Attributes:
+        entity (str): Whose wins to pair, `producer` or `studio`.
+        year_from (int): First year of the window, inclusive.
+        year_to (int): Last year of the window, inclusive.
+        k (int): Number of interval lengths to return at each end.
+    """
+
+    entity = serializers.ChoiceField(choices=list(WIN_ENTITIES), default="producer")
+    year_from = serializers.IntegerField(required=False)
+    year_to = serializers.IntegerField(required=False)
+    k = serializers.IntegerField(min_value=1, max_value=MAX_K, default=1)
+
+
+class WinIntervalSerializer(serializers.Serializer):
+    """
+    Serializer for representing the interval between two consecutive 'Worst
+      Picture' awards of a producer or studio.
+
+    Attributes:
+        name (str): Name of the producer or studio.
+        interval (int): Number of years between consecutive awards.
+        previousWin (int): Year of the previous award.
+        followingWin (int): Year of the following award.
+    """
+
+    name = serializers.CharField()
+    interval = serializers.IntegerField()
+    previousWin = serializers.IntegerField(source="award_last_year")
+    followingWin = serializers.IntegerField(source="award_year")
+
+
+class WinIntervalsSerializer(serializers.Serializer):
+    """
+    Serializer for representing the shortest and longest intervals between awards.
+
+    Attributes:
+        min (list of WinIntervalSerializer): Intervals of the k shortest lengths,
+         shortest first.
+        max (list of WinIntervalSerializer): Intervals of the k longest lengths,
+         longest first.
+    """
+
+    min = WinIntervalSerializer(many=True)
+    max = WinIntervalSerializer(many=True)
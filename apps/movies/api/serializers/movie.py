@@ -38,3 +38,35 @@ class MovieSerializer(serializers.ModelSerializer):
             "studios",
             "producers",
         ]
+
+
+# Largest number of movies a batch request may ask for.
+MAX_BATCH_SIZE = 200
+
+
+class MovieBatchRequestSerializer(serializers.Serializer):
+    """
+    Serializer validating the ids of a batch retrieve.
+
+    Attributes:
+        ids (list of int): Ids of the movies to return, at most MAX_BATCH_SIZE.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+class MovieBatchSerializer(serializers.Serializer):
+    """
+    Serializer for representing the result of a batch retrieve.
+
+    Attributes:
+        results (list of MovieSerializer): Movies found, in the requested order.
+        notFound (list of int): Requested ids that match no movie.
+    """
+
+    results = MovieSerializer(many=True)
+    notFound = serializers.ListField(child=serializers.IntegerField())
@@ -1,15 +1,52 @@
 from http import HTTPMethod
 
-from django.db.models import ExpressionWrapper, F, IntegerField, Max, Min, Window
-from django.db.models.functions import Lag
-from drf_spectacular.utils import extend_schema
+from django.conf import settings
+from django.db import router
+from django.http import Http404, StreamingHttpResponse
+from django.utils.functional import cached_property
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
-from apps.movies.models import Movie, Producer
+from apps.movies import timing
+from apps.movies.cache import cached
+from apps.movies.models import Movie
+from apps.movies.services.intervals import (
+    stored_producer_intervals,
+    win_indexes,
+)
+from apps.movies.services.rollups import aggregates
+from apps.movies.services.search import title_index_available
+from apps.movies.snapshot import snapshots
 
-from ..serializers import AwardsIntervalSerializer, MovieSerializer
+from ..conditional import conditional_on_data_version, request_data_version
+from ..export import iter_csv, iter_ndjson
+from ..filters import (
+    MovieFilterSet,
+    MovieSearchFilter,
+    search_ranks,
+    snapshot_movies,
+)
+from ..pagination import MovieKeysetPagination
+from ..renderers import FastJSONRenderer
+from ..serializers import (
+    AggregatesQuerySerializer,
+    AggregatesSerializer,
+    AwardsIntervalSerializer,
+    MovieBatchRequestSerializer,
+    MovieBatchSerializer,
+    MovieSerializer,
+    WinIntervalsQuerySerializer,
+    WinIntervalsSerializer,
+    fast,
+)
+from ..serializers.movie import MAX_BATCH_SIZE
 
 
 class MovieViewSet(ReadOnlyModelViewSet):
@@ -17,20 +54,216 @@ class MovieViewSet(ReadOnlyModelViewSet):
     ViewSet for read-only operations on movies.
 
     Actions:
-        list (MovieSerializer): Returns a paginated list of movies.
+        list (MovieSerializer): Returns a paginated list of movies, filtered by
+         MovieFilterSet. Page numbers by default; `?pagination=cursor` switches to
+         keyset pagination.
         retrieve (MovieSerializer): Returns details of a specific movie.
+        batch (MovieBatchSerializer): Returns the movies of a list of ids, in one
+         response.
         awards_interval_by_producer (AwardsIntervalSerializer): Calculates intervals
          between 'Worst Picture' awards for producers.
+        awards_intervals (WinIntervalsSerializer): Shortest and longest intervals
+         between awards of producers or studios, within a year window.
+        aggregates (AggregatesSerializer): Nomination and win counts per year and
+         of the producers and studios with the most wins.
+        export: Streams every movie matching the list filters as NDJSON or CSV.
     """
 
-    queryset = Movie.objects.all()
+    # studios and producers are fetched with one batched query each per page; the
+    # denormalized lookups are only read through `fast.movie_rows`
+    queryset = Movie.objects.defer("lookups").prefetch_related("studio", "producer")
     serializer_class = MovieSerializer
+    filter_backends = [DjangoFilterBackend, MovieSearchFilter]
+    filterset_class = MovieFilterSet
     search_fields = ["title"]
+    # With MOVIES_FAST_SERIALIZATION, list, retrieve and the awards interval build
+    # their responses from values_list() rows, skipping the serializers (which
+    # still describe the schema), and render them with orjson when installed.
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    @property
+    def fast_serialization(self) -> bool:
+        # Denormalized lookups are read through the values_list() rows.
+        return (
+            settings.MOVIES_FAST_SERIALIZATION or settings.MOVIES_DENORMALIZED_LOOKUPS
+        )
+
+    @cached_property
+    def snapshot(self):
+        """
+        In-memory snapshot to answer list, retrieve and the awards interval from,
+          with MOVIES_SNAPSHOT_SERVING; None while it loads. Searches need the FTS5
+          index, the LIKE fallback only runs on the database.
+        """
+        if not settings.MOVIES_SNAPSHOT_SERVING:
+            return None
+        terms = MovieSearchFilter().get_search_terms(self.request)
+        if terms and not title_index_available(router.db_for_read(Movie)):
+            return None
+        return snapshots.get(request_data_version(self.request))
+
+    @property
+    def paginator(self):
+        """
+        Keyset pagination when requested with `?pagination=cursor` (or when
+          following one of its `cursor` links), page numbers otherwise.
+        """
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            params = request.query_params if request is not None else {}
+            if params.get("pagination") == "cursor" or "cursor" in params:
+                self._paginator = MovieKeysetPagination()
+            else:
+                return super().paginator
+        return self._paginator
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "pagination",
+                str,
+                enum=["cursor"],
+                description=(
+                    "Use keyset pagination ordered by (year, id): no total count, "
+                    "constant cost per page, `next` links only."
+                ),
+            ),
+            OpenApiParameter(
+                "cursor", str, description="Cursor from a keyset `next` link."
+            ),
+        ]
+    )
+    @conditional_on_data_version
+    def list(self, request, *args, **kwargs):
+        if self.snapshot is not None:
+            # Keyset pages are ordered by (year, id), even when searching.
+            queryset = snapshot_movies(
+                self.snapshot,
+                request,
+                search_ranks(request),
+                rank_order=not isinstance(self.paginator, MovieKeysetPagination),
+            )
+        else:
+            queryset = self.filter_queryset(self.get_queryset())
+            if self.fast_serialization:
+                queryset = fast.movie_rows(queryset)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_movies(page))
+        return Response(self.serialize_movies(queryset))
+
+    @conditional_on_data_version
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if self.snapshot is not None:
+            movies = snapshot_movies(
+                self.snapshot,
+                request,
+                search_ranks(request),
+                pk=self.kwargs[lookup_url_kwarg],
+            )
+            if not movies:
+                raise Http404("No Movie matches the given query.")
+            return Response(self.serialize_movies(movies[:1])[0])
+
+        if not self.fast_serialization:
+            movie = self.get_object()
+            return Response(self.serialize_movies([movie])[0])
+
+        # Same lookup as get_object(), on rows instead of model instances.
+        row = get_object_or_404(
+            fast.movie_rows(self.filter_queryset(self.get_queryset())),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        return Response(self.serialize_movies([row])[0])
+
+    @extend_schema(
+        methods=[HTTPMethod.GET],
+        parameters=[
+            OpenApiParameter(
+                "ids",
+                str,
+                required=True,
+                description=(
+                    f"Comma-separated movie ids, at most {MAX_BATCH_SIZE}, e.g. "
+                    "`1,2,3`."
+                ),
+            ),
+        ],
+        responses={200: MovieBatchSerializer},
+    )
+    @extend_schema(
+        methods=[HTTPMethod.POST],
+        request=MovieBatchRequestSerializer,
+        responses={200: MovieBatchSerializer},
+    )
+    @action(
+        detail=False,
+        methods=[HTTPMethod.GET, HTTPMethod.POST],
+        filter_backends=[],
+        pagination_class=None,
+    )
+    @conditional_on_data_version
+    def batch(self, request):
+        """
+        Returns many movies by id in one response, e.g. to resolve a watchlist.
+
+        Endpoint: GET /movies/batch/?ids=1,2,3 or POST /movies/batch/ with
+          `{"ids": [1, 2, 3]}`
+
+        Notes:
+            1. Movies come in the requested order, repeated ids once; ids that match
+               no movie are listed in `notFound` instead of failing the request.
+            2. Costs the same queries as a single retrieve (the movies, then one
+               batch per relation) whatever the number of ids.
+        """
+        if request.method == HTTPMethod.POST:
+            data = request.data
+        elif "ids" in request.query_params:
+            ids = request.query_params["ids"].split(",")
+            data = {"ids": [pk.strip() for pk in ids if pk.strip()]}
+        else:
+            data = {}
+        query = MovieBatchRequestSerializer(data=data)
+        query.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(query.validated_data["ids"]))
+
+        if self.snapshot is not None:
+            movies = [self.snapshot.get(pk) for pk in ids]
+            found = {movie.id: movie for movie in movies if movie is not None}
+        else:
+            # Reordered as requested below, so no ORDER BY.
+            queryset = self.get_queryset().filter(pk__in=ids).order_by()
+            if self.fast_serialization:
+                queryset = fast.movie_rows(queryset)
+            found = {movie.id: movie for movie in queryset}
+
+        movies = [found[pk] for pk in ids if pk in found]
+        return Response(
+            {
+                "results": self.serialize_movies(movies),
+                "notFound": [pk for pk in ids if pk not in found],
+            }
+        )
+
+    def serialize_movies(self, movies) -> list:
+        """
+        Serializes movies, `fast.movie_rows` rows or snapshot records, timed as
+          serialization.
+        """
+        with timing.span("serialize"):
+            if self.snapshot is not None:
+                return self.snapshot.serialize_movies(movies)
+            if self.fast_serialization:
+                return fast.serialize_movies(movies)
+            return self.get_serializer(movies, many=True).data
 
     @extend_schema(responses={200: AwardsIntervalSerializer})
     @action(
         detail=False, methods=[HTTPMethod.GET], url_path="awards-interval-by-producer"
     )
+    @conditional_on_data_version
     def awards_interval_by_producer(self, request):
         """
         Calculates the minimum and maximum intervals between consecutive 'Worst Picture'
@@ -47,36 +280,150 @@ class MovieViewSet(ReadOnlyModelViewSet):
 
         Notes:
             1. Only considers producers with at least two awards.
-            2. Uses window functions (LAG) to calculate consecutive award years.
-            3. Excludes records without a previous award.
-        """
-        qs = (
-            Producer.objects.filter(movies__winner=True)
-            .annotate(
-                award_year=F("movies__year"),  # Current year award
-                award_last_year=Window(
-                    expression=Lag("movies__year"),  # get the last year award
-                    partition_by=[F("id")],  # annotate by producer
-                    order_by=F("movies__year").asc(),
-                ),
-            )
-            .annotate(
-                interval=ExpressionWrapper(
-                    F("award_year") - F("award_last_year"), output_field=IntegerField()
-                )
-            )
-            .exclude(award_last_year__isnull=True)
-            .values("name", "interval", "award_last_year", "award_year")
+            2. Reads the ProducerWinInterval table, kept up to date on every write, so
+               both extremes are indexed lookups instead of a window function scan.
+            3. The response is cached per data generation, with concurrent misses
+               coalesced into a single computation.
+        """
+
+        if self.snapshot is not None:
+            with timing.span("serialize"):
+                intervals = self.snapshot.awards_intervals
+                return Response(fast.serialize_awards_intervals(intervals))
+
+        def compute():
+            intervals = stored_producer_intervals()
+            with timing.span("serialize"):
+                if self.fast_serialization:
+                    return fast.serialize_awards_intervals(intervals)
+                return AwardsIntervalSerializer(intervals).data
+
+        data = cached(
+            "awards-interval-by-producer", compute, request_data_version(request)
+        )
+        return Response(data)
+
+    @extend_schema(
+        parameters=[WinIntervalsQuerySerializer],
+        responses={200: WinIntervalsSerializer},
+    )
+    @action(detail=False, methods=[HTTPMethod.GET], url_path="awards-intervals")
+    @conditional_on_data_version
+    def awards_intervals(self, request):
+        """
+        Finds the intervals between consecutive 'Worst Picture' awards of producers
+          or studios with the k shortest and k longest lengths, within a year window.
+
+        Endpoint: GET /movies/awards-intervals/?entity=studio&year_from=1990&k=3
+
+        Notes:
+            1. Both awards of an interval must fall within `year_from` and `year_to`.
+            2. Every interval of a selected length is returned, so `k=1` gives the
+               same extremes as awards-interval-by-producer.
+            3. The consecutive award pairs of every producer or studio are indexed
+               once per data generation in process memory, sorted by first award
+               year; each query bisects them to the window and keeps the extreme
+               lengths in bounded heaps. Responses are cached per data generation
+               and parameters.
+        """
+        query = WinIntervalsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        entity = params["entity"]
+
+        version = request_data_version(request)
+        year_from, year_to, k = (
+            params.get("year_from"),
+            params.get("year_to"),
+            params["k"],
         )
 
-        # using window and lag, isn't possible annotate min and max interval
-        interval = qs.aggregate(
-            max_interval=Max("interval"),
-            min_interval=Min("interval"),
+        def compute():
+            index = win_indexes.get(entity, version)
+            intervals = index.extremes(year_from, year_to, k)
+            with timing.span("serialize"):
+                if self.fast_serialization:
+                    return fast.serialize_win_intervals(intervals)
+                return WinIntervalsSerializer(intervals).data
+
+        data = cached(
+            f"awards-intervals:{entity}:{year_from}:{year_to}:{k}", compute, version
         )
-        data = {
-            "min": qs.filter(interval=interval["min_interval"]),
-            "max": qs.filter(interval=interval["max_interval"]),
-        }
+        return Response(data)
 
-        return Response(AwardsIntervalSerializer(data).data)
+    @extend_schema(
+        parameters=[AggregatesQuerySerializer],
+        responses={200: AggregatesSerializer},
+    )
+    @action(detail=False, methods=[HTTPMethod.GET])
+    @conditional_on_data_version
+    def aggregates(self, request):
+        """
+        Returns the dashboard facets: nominations and wins per year, and the
+          producers and studios with the most wins.
+
+        Endpoint: GET /movies/aggregates/?year_from=1990&limit=10
+
+        Notes:
+            1. `year_from` and `year_to` restrict the `years` facet; the producer and
+               studio counts cover every year.
+            2. Reads the YearRollup, ProducerRollup and StudioRollup tables, kept up
+               to date on every write, so each facet is an indexed read of a few
+               rows instead of a GROUP BY over the movie joins.
+        """
+        query = AggregatesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        data = aggregates(
+            params.get("year_from"), params.get("year_to"), params["limit"]
+        )
+        with timing.span("serialize"):
+            if self.fast_serialization:
+                return Response(fast.serialize_aggregates(data))
+            return Response(AggregatesSerializer(data).data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "output",
+                str,
+                enum=["ndjson", "csv"],
+                default="ndjson",
+                description=(
+                    "`ndjson`: one movie object per line. `csv`: the `;`-delimited "
+                    "movielist.csv format."
+                ),
+            ),
+        ],
+        responses={
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
+    )
+    @action(detail=False, methods=[HTTPMethod.GET], pagination_class=None)
+    def export(self, request):
+        """
+        Streams the whole catalogue, honouring the same filters and search as list.
+
+        Endpoint: GET /movies/export/?output=ndjson|csv
+
+        Notes:
+            1. Rows are read in chunks through a server-side iterator, so memory
+               stays constant whatever the size of the catalogue.
+            2. No pagination and no COUNT query.
+        """
+        output = request.query_params.get("output", "ndjson")
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if output == "ndjson":
+            return StreamingHttpResponse(
+                iter_ndjson(queryset), content_type="application/x-ndjson"
+            )
+        if output == "csv":
+            response = StreamingHttpResponse(
+                iter_csv(queryset), content_type="text/csv; charset=utf-8"
+            )
+            response["Content-Disposition"] = 'attachment; filename="movielist.csv"'
+            return response
+        raise ValidationError({"output": ["Must be one of: ndjson, csv."]})
@@ -0,0 +1,242 @@
+"""
+Native async versions of the read endpoints of MovieViewSet.
+
+DRF views are synchronous, so under an ASGI server each of their requests holds a
+worker thread. These views query through the async ORM instead and return the
+same JSON documents as their MovieViewSet counterparts (the fast serialization
+path); they accept the same filters, search and pagination parameters.
+"""
+
+import math
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import router
+from django.http import HttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.movies import timing
+from apps.movies.cache import acached
+from apps.movies.models import Movie
+from apps.movies.services.intervals import astored_producer_intervals
+from apps.movies.services.search import title_index_available
+from apps.movies.snapshot import snapshots
+
+from ..conditional import async_conditional_on_data_version
+from ..filters import (
+    MovieFilterSet,
+    MovieSearchFilter,
+    search_ranks,
+    snapshot_movies,
+)
+from ..pagination import MovieKeysetPagination
+from ..renderers import FastJSONRenderer
+from ..serializers import fast
+from .movie import MovieViewSet
+
+
+def _render(data, status=200) -> HttpResponse:
+    return HttpResponse(
+        FastJSONRenderer().render(data),
+        content_type=FastJSONRenderer.media_type,
+        status=status,
+    )
+
+
+def _render_error(exc: APIException) -> HttpResponse:
+    # Same body as DRF's exception handler.
+    detail = exc.detail
+    data = detail if isinstance(detail, (list, dict)) else {"detail": detail}
+    return _render(data, exc.status_code)
+
+
+async def _filter_movies(request: Request):
+    """
+    Applies MovieFilterSet and the title search, as MovieViewSet.filter_queryset.
+    """
+    queryset = Movie.objects.all()
+    filterset = MovieFilterSet(request.query_params, queryset=queryset, request=request)
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+    queryset = filterset.qs
+
+    search = MovieSearchFilter()
+    if search.get_search_terms(request):
+        # Introspects the database on its first call, so it runs in a thread.
+        await sync_to_async(title_index_available)(queryset.db)
+        queryset = search.filter_queryset(request, queryset, MovieViewSet)
+    return queryset
+
+
+async def _snapshot(request: Request):
+    """
+    As `MovieViewSet.snapshot`.
+    """
+    if not settings.MOVIES_SNAPSHOT_SERVING:
+        return None
+    if MovieSearchFilter().get_search_terms(request):
+        using = router.db_for_read(Movie)
+        if not await sync_to_async(title_index_available)(using):
+            return None
+    return snapshots.get(request._movies_data_version)
+
+
+async def _snapshot_movies(snapshot, request: Request, **kwargs) -> list:
+    ranks = None
+    if MovieSearchFilter().get_search_terms(request):
+        ranks = await sync_to_async(search_ranks)(request)
+    return snapshot_movies(snapshot, request, ranks, **kwargs)
+
+
+def _snapshot_page(snapshot, request: Request, movies: list, keyset: bool) -> dict:
+    if keyset:
+        paginator = MovieKeysetPagination()
+        page = paginator.paginate_queryset(movies, request)
+        data = {"next": paginator.get_next_link()}
+    else:
+        paginator = PageNumberPagination()
+        page = paginator.paginate_queryset(movies, request)
+        data = {
+            "count": paginator.page.paginator.count,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }
+    with timing.span("serialize"):
+        data["results"] = snapshot.serialize_movies(page)
+    return data
+
+
+async def _serialize(rows: list) -> list:
+    with timing.span("serialize"):
+        return await fast.aserialize_movies(rows)
+
+
+async def _page_number_page(request: Request, queryset) -> dict:
+    """
+    Async counterpart of DRF's PageNumberPagination with its default settings.
+    """
+    page_size = api_settings.PAGE_SIZE
+    count = await queryset.acount()
+    num_pages = math.ceil(max(count, 1) / page_size)
+
+    page_number = request.query_params.get("page", 1)
+    if page_number == "last":
+        page_number = num_pages
+    try:
+        page_number = int(page_number)
+    except (TypeError, ValueError):
+        raise NotFound("Invalid page.")
+    if not 1 <= page_number <= num_pages:
+        raise NotFound("Invalid page.")
+
+    offset = (page_number - 1) * page_size
+    rows = [row async for row in fast.movie_rows(queryset)[offset : offset + page_size]]
+
+    url = request.build_absolute_uri()
+    next_link = previous_link = None
+    if page_number < num_pages:
+        next_link = replace_query_param(url, "page", page_number + 1)
+    if page_number == 2:
+        previous_link = remove_query_param(url, "page")
+    elif page_number > 2:
+        previous_link = replace_query_param(url, "page", page_number - 1)
+    return {
+        "count": count,
+        "next": next_link,
+        "previous": previous_link,
+        "results": await _serialize(rows),
+    }
+
+
+async def _keyset_page(request: Request, queryset) -> dict:
+    paginator = MovieKeysetPagination()
+    page_queryset = fast.movie_rows(paginator.get_page_queryset(queryset, request))
+    rows = paginator.set_page([row async for row in page_queryset])
+    return {
+        "next": paginator.get_next_link(),
+        "results": await _serialize(rows),
+    }
+
+
+@require_safe
+@async_conditional_on_data_version
+async def movie_list(request):
+    """
+    Async counterpart of `MovieViewSet.list`.
+
+    Endpoint: GET /movies/async/movie/
+    """
+    request = Request(request)
+    params = request.query_params
+    keyset = params.get("pagination") == "cursor" or "cursor" in params
+    try:
+        snapshot = await _snapshot(request)
+        if snapshot is not None:
+            movies = await _snapshot_movies(snapshot, request, rank_order=not keyset)
+            data = _snapshot_page(snapshot, request, movies, keyset)
+        elif keyset:
+            data = await _keyset_page(request, await _filter_movies(request))
+        else:
+            data = await _page_number_page(request, await _filter_movies(request))
+    except APIException as e:
+        return _render_error(e)
+    return _render(data)
+
+
+@require_safe
+@async_conditional_on_data_version
+async def movie_detail(request, pk):
+    """
+    Async counterpart of `MovieViewSet.retrieve`.
+
+    Endpoint: GET /movies/async/movie/{id}/
+    """
+    request = Request(request)
+    try:
+        snapshot = await _snapshot(request)
+        if snapshot is not None:
+            movies = await _snapshot_movies(snapshot, request, pk=pk)
+            if not movies:
+                raise Movie.DoesNotExist
+            with timing.span("serialize"):
+                data = snapshot.serialize_movies(movies[:1])[0]
+            return _render(data)
+
+        queryset = await _filter_movies(request)
+        row = await fast.movie_rows(queryset).aget(pk=pk)
+    except APIException as e:
+        return _render_error(e)
+    except Movie.DoesNotExist:
+        return _render_error(NotFound("No Movie matches the given query."))
+    return _render((await _serialize([row]))[0])
+
+
+@require_safe
+@async_conditional_on_data_version
+async def awards_interval_by_producer(request):
+    """
+    Async counterpart of `MovieViewSet.awards_interval_by_producer`.
+
+    Endpoint: GET /movies/async/movie/awards-interval-by-producer/
+    """
+
+    snapshot = await _snapshot(Request(request))
+    if snapshot is not None:
+        with timing.span("serialize"):
+            data = fast.serialize_awards_intervals(snapshot.awards_intervals)
+        return _render(data)
+
+    async def compute():
+        intervals = await astored_producer_intervals()
+        with timing.span("serialize"):
+            return fast.serialize_awards_intervals(intervals)
+
+    data = await acached(
+        "awards-interval-by-producer", compute, request._movies_data_version
+    )
+    return _render(data)
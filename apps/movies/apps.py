@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 class MoviesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.movies"
+
+    def ready(self):
+        from . import db, signals, timing
+
+        post_migrate.connect(signals.install_search_index, sender=self)
+        connection_created.connect(db.apply_sqlite_pragmas)
+        connection_created.connect(timing.install_query_timer)
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.movies.models import DataVersion
+
+LOCK_TIMEOUT = 30
+LOCK_POLL_INTERVAL = 0.05
+
+
+def get_cache():
+    return caches[settings.MOVIES_CACHE_ALIAS]
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single computation.
+
+    The first caller of a key runs the function; callers arriving while it runs
+    wait for, and share, its result (or its exception).
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.value = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = function()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+
+single_flight = SingleFlight()
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines: concurrent awaits of the same key on an event loop
+    share one task.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    async def do(self, key, function):
+        key = (asyncio.get_running_loop(), key)
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda done: self._tasks.pop(key, None))
+        # A cancelled waiter must not cancel the computation the others wait on.
+        return await asyncio.shield(task)
+
+
+async_single_flight = AsyncSingleFlight()
+
+
+def versioned_key(key: str, token: str) -> str:
+    return f"movies:{key}:{token}"
+
+
+def cached(key: str, compute, version: DataVersion = None):
+    """
+    Returns the cached result of `compute`, computing it once per data generation.
+
+    The cache key embeds the current DataVersion token, so any write to the
+    award data makes previous entries unreachable. On a miss, concurrent requests
+    of this process share one computation, and processes sharing the cache backend
+    wait on a cache lock instead of computing in parallel.
+
+    Args:
+        key (str): Name of the cached value.
+        compute (callable): Computes the value; it must not return None.
+        version (DataVersion): Already read version, saving a query; defaults to
+          the current one.
+    """
+    cache = get_cache()
+    version = version or DataVersion.current()
+    full_key = versioned_key(key, version.token)
+    value = cache.get(full_key)
+    if value is not None:
+        return value
+    return single_flight.do(full_key, lambda: _fill(cache, full_key, compute))
+
+
+def _fill(cache, full_key: str, compute):
+    value = cache.get(full_key)
+    if value is not None:
+        return value
+
+    lock_key = f"{full_key}:lock"
+    if not cache.add(lock_key, True, LOCK_TIMEOUT):
+        # Another process is computing the value; wait for it up to the lock
+        # timeout, then compute it here rather than failing the request.
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            value = cache.get(full_key)
+            if value is not None:
+                return value
+
+    try:
+        value = compute()
+        cache.set(full_key, value, settings.MOVIES_CACHE_TIMEOUT)
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+async def acached(key: str, compute, version: DataVersion):
+    """
+    Async version of `cached`, for a coroutine function `compute`.
+    """
+    cache = get_cache()
+    full_key = versioned_key(key, version.token)
+    value = await cache.aget(full_key)
+    if value is not None:
+        return value
+    return await async_single_flight.do(
+        full_key, lambda: _afill(cache, full_key, compute)
+    )
+
+
+async def _afill(cache, full_key: str, compute):
+    value = await cache.aget(full_key)
+    if value is not None:
+        return value
+
+    lock_key = f"{full_key}:lock"
+    if not await cache.aadd(lock_key, True, LOCK_TIMEOUT):
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            value = await cache.aget(full_key)
+            if value is not None:
+                return value
+
+    try:
+        value = await compute()
+        await cache.aset(full_key, value, settings.MOVIES_CACHE_TIMEOUT)
+    finally:
+        await cache.adelete(lock_key)
+    return value
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections, transaction
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    Connected to connection_created; tunes every new SQLite connection with
+    MOVIES_SQLITE_PRAGMAS, and makes the MOVIES_READ_DATABASE alias read-only.
+    """
+    if connection.vendor != "sqlite":
+        return
+    pragmas = dict(settings.MOVIES_SQLITE_PRAGMAS)
+    if connection.alias == settings.MOVIES_READ_DATABASE:
+        pragmas["query_only"] = "ON"
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+@contextmanager
+def read_transaction(using):
+    """
+    Runs the block's reads in one transaction on the `using` alias.
+
+    On SQLite, `transaction.atomic()` begins with the alias's transaction_mode,
+    IMMEDIATE under the production profile, which takes the write lock and blocks
+    imports until the block ends. A plain BEGIN is deferred: it only holds a read
+    snapshot. Inside an atomic block the reads already share its transaction.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        with transaction.atomic(using=using):
+            yield
+        return
+    if connection.in_atomic_block:
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("BEGIN")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("COMMIT")
+
+
+class ReadReplicaRouter:
+    """
+    Sends reads to the MOVIES_READ_DATABASE alias and everything else to default.
+
+    With WAL both aliases open the same file: readers on their own connections
+    keep reading the last committed data while an import writes. Reads made
+    inside a transaction on default stay there, so they see its uncommitted
+    writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        if connections["default"].in_atomic_block:
+            return "default"
+        return settings.MOVIES_READ_DATABASE
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from movies_awards.schema import generate_schema, read_artifact
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the OpenAPI schema artifact served at /api/v1/schema/, or with "
+        "--check fails if it is out of date with the code."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the artifact with the schema generated from the code.",
+        )
+
+    def handle(self, *args, **options):
+        path = settings.OPENAPI_SCHEMA_PATH
+        schema = generate_schema()
+        if options["check"]:
+            if read_artifact() != schema:
+                raise CommandError(
+                    f"O schema em {path} está desatualizado; gere-o novamente com "
+                    "`python manage.py build_schema`."
+                )
+            self.stdout.write(
+                self.style.SUCCESS(f"O schema em {path} está atualizado.")
+            )
+            return
+
+        with open(path, "wb") as file:
+            file.write(schema)
+        self.stdout.write(self.style.SUCCESS(f"Schema gerado em {path}."))
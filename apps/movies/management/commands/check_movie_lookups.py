@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.movies.models import DataVersion, Movie
+from apps.movies.services.lookups import check_lookups, fill_lookups
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the denormalized Movie.lookups with the producer and studio "
+        "relations, or with --fix recomputes the movies that differ."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute outdated and missing lookups instead of failing.",
+        )
+
+    def handle(self, *args, **options):
+        stale, missing = check_lookups(Movie.objects.all())
+        if missing:
+            self.stdout.write(f"{len(missing)} filmes sem nomes desnormalizados.")
+
+        if options["fix"]:
+            count = fill_lookups(Movie.objects.filter(pk__in=stale + missing))
+            if count:
+                DataVersion.bump()
+            self.stdout.write(self.style.SUCCESS(f"{count} filmes recalculados."))
+            return
+
+        if stale:
+            raise CommandError(
+                f"{len(stale)} filmes com nomes desnormalizados desatualizados (ex.: "
+                f"{', '.join(map(str, stale[:10]))}); corrija-os com "
+                "`python manage.py check_movie_lookups --fix`."
+            )
+        self.stdout.write(
+            self.style.SUCCESS("Os nomes desnormalizados dos filmes estão em dia.")
+        )
@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.movies.services import SyntheticSpec, generate_rows, import_rows, write_csv
+from apps.movies.services.ingestion import DEFAULT_CHUNK_SIZE
+
+MAX_MOVIES = 10_000_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a seeded synthetic movie list, written as a `;`-delimited CSV "
+        "file or loaded straight into the database."
+    )
+
+    def add_arguments(self, parser):
+        defaults = SyntheticSpec()
+        parser.add_argument(
+            "--movies",
+            type=int,
+            default=defaults.movies,
+            help=f"Number of movies, up to {MAX_MOVIES}.",
+        )
+        parser.add_argument(
+            "--producers-per-movie",
+            type=float,
+            default=defaults.producers_per_movie,
+            help="Average number of producers of a movie.",
+        )
+        parser.add_argument(
+            "--winner-ratio",
+            type=float,
+            default=defaults.winner_ratio,
+            help="Fraction of the movies that won the award.",
+        )
+        parser.add_argument("--year-from", type=int, default=defaults.year_from)
+        parser.add_argument("--year-to", type=int, default=defaults.year_to)
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument(
+            "--output",
+            help="CSV file to write. Without it the movies are added to the database.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows committed per transaction when loading.",
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options["movies"] <= MAX_MOVIES:
+            raise CommandError(f"--movies deve estar entre 1 e {MAX_MOVIES}.")
+        if options["producers_per_movie"] < 1:
+            raise CommandError("--producers-per-movie deve ser pelo menos 1.")
+        if not 0 <= options["winner_ratio"] <= 1:
+            raise CommandError("--winner-ratio deve estar entre 0 e 1.")
+        if options["year_from"] > options["year_to"]:
+            raise CommandError("--year-from deve ser menor ou igual a --year-to.")
+
+        spec = SyntheticSpec(
+            movies=options["movies"],
+            producers_per_movie=options["producers_per_movie"],
+            winner_ratio=options["winner_ratio"],
+            year_from=options["year_from"],
+            year_to=options["year_to"],
+            seed=options["seed"],
+        )
+        rows = generate_rows(spec)
+
+        if options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as file:
+                count = write_csv(rows, file)
+            self.stdout.write(
+                self.style.SUCCESS(f"{count} filmes gravados em {options['output']}.")
+            )
+            return
+
+        result = import_rows(rows, chunk_size=options["chunk_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.rows} filmes gerados em {result.elapsed:.2f}s "
+                f"({result.rows_per_second:.0f} linhas/s)."
+            )
+        )
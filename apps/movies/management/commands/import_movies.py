@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.movies.services import CheckpointError, import_csv, sync_csv
+from apps.movies.services.ingestion import DEFAULT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports the `;`-delimited movie list in chunks, committing a checkpoint "
+        "after each one so an interrupted run resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "csv_path",
+            nargs="?",
+            default=str(settings.MOVIES_CSV_PATH),
+            help="File to import. Defaults to settings.MOVIES_CSV_PATH.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows committed per transaction.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Delete the imported catalogue and import the file from the first row.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes parsing the file in parallel byte ranges.",
+        )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            help=(
+                "Compare row fingerprints with the stored movies and only insert, "
+                "update or delete the rows that changed."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["delta"]:
+            self.handle_delta(options)
+            return
+
+        try:
+            result = import_csv(
+                options["csv_path"],
+                chunk_size=options["chunk_size"],
+                restart=options["restart"],
+                workers=options["workers"],
+            )
+        except (CheckpointError, FileNotFoundError) as e:
+            raise CommandError(e)
+
+        if result is None:
+            self.stdout.write("Arquivo já importado, nada a fazer.")
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.rows} linhas importadas em {result.elapsed:.2f}s "
+                f"({result.rows_per_second:.0f} linhas/s)."
+            )
+        )
+
+    def handle_delta(self, options):
+        try:
+            result = sync_csv(options["csv_path"], chunk_size=options["chunk_size"])
+        except FileNotFoundError as e:
+            raise CommandError(e)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.inserted} inseridos, {result.updated} atualizados, "
+                f"{result.deleted} removidos, {result.unchanged} inalterados em "
+                f"{result.elapsed:.2f}s."
+            )
+        )
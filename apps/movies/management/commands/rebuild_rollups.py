@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.movies.models import DataVersion
+from apps.movies.services.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the year, producer and studio rollup tables from the movies, "
+        "e.g. after writes that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_rollups()
+        # Invalidates the cached responses computed from the drifted rows.
+        DataVersion.bump()
+        self.stdout.write(self.style.SUCCESS(f"{count} agregados recalculados."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.movies.models import DataVersion
+from apps.movies.services.intervals import rebuild_producer_intervals
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the ProducerWinInterval table from the winning movies, e.g. "
+        "after writes that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_producer_intervals()
+        # Invalidates the cached responses computed from the drifted rows.
+        DataVersion.bump()
+        self.stdout.write(self.style.SUCCESS(f"{count} intervalos recalculados."))
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.movies.timing import SWITCH_TTL, switch
+
+
+class Command(BaseCommand):
+    help = (
+        "Turns the Server-Timing instrumentation on or off at runtime, for every "
+        "process sharing the movies cache. Fails when that cache is local to each "
+        "process, as the default LocMemCache is."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "state",
+            choices=["on", "off", "default", "status"],
+            help="`default` goes back to settings.MOVIES_SERVER_TIMING.",
+        )
+
+    def handle(self, *args, **options):
+        state = options["state"]
+        if state != "status" and not switch.is_shared():
+            # The value would only reach this command's own process.
+            raise CommandError(
+                f"O cache {settings.MOVIES_CACHE_ALIAS} é local a cada processo, "
+                "então a mudança não chegaria aos servidores. Aponte "
+                "MOVIES_CACHE_ALIAS para um backend compartilhado ou use "
+                "MOVIES_SERVER_TIMING."
+            )
+        if state == "default":
+            switch.reset()
+        elif state != "status":
+            switch.set(state == "on")
+
+        enabled = "ligada" if switch.is_enabled() else "desligada"
+        self.stdout.write(f"Instrumentação Server-Timing {enabled}.")
+        if state != "status":
+            self.stdout.write(
+                f"Os processos aplicam a mudança em até {SWITCH_TTL:.0f}s."
+            )
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 09:06
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def fill_movie_fingerprints(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    movies = []
+    for movie in (
+        Movie.objects.filter(fingerprint="")
+        .prefetch_related("producer", "studio")
+        .iterator(chunk_size=5000)
+    ):
+        # Same digest as `movie_fingerprint` at the time of this migration.
+        parts = [
+            str(movie.year),
+            movie.title,
+            "\x1e".join(sorted({producer.name for producer in movie.producer.all()})),
+            "\x1e".join(sorted({studio.name for studio in movie.studio.all()})),
+        ]
+        movie.fingerprint = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+        movies.append(movie)
+    Movie.objects.bulk_update(movies, ["fingerprint"], batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0003_importcheckpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="fingerprint",
+            field=models.CharField(blank=True, db_index=True, max_length=40),
+        ),
+        migrations.RunPython(
+            fill_movie_fingerprints, reverse_code=migrations.RunPython.noop
+        ),
+    ]
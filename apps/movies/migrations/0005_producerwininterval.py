@@ -0,0 +1,74 @@
+# Generated by Django 5.2 on 2026-10-18 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_win_intervals(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    ProducerWinInterval = apps.get_model("movies", "ProducerWinInterval")
+    wins = (
+        Movie.producer.through.objects.filter(movie__winner=True)
+        .order_by("producer_id", "movie__year")
+        .values_list("producer_id", "movie__year")
+    )
+    intervals = []
+    previous_id = previous_win = None
+    for producer_id, year in wins.iterator():
+        if producer_id == previous_id:
+            intervals.append(
+                ProducerWinInterval(
+                    producer_id=producer_id,
+                    previous_win=previous_win,
+                    following_win=year,
+                    interval=year - previous_win,
+                )
+            )
+        previous_id, previous_win = producer_id, year
+    ProducerWinInterval.objects.bulk_create(intervals, batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0004_movie_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProducerWinInterval",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("previous_win", models.IntegerField()),
+                ("following_win", models.IntegerField()),
+                ("interval", models.IntegerField()),
+                (
+                    "producer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="win_intervals",
+                        to="movies.producer",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["producer", "previous_win"],
+                "indexes": [
+                    models.Index(
+                        fields=["interval"], name="movies_prod_interva_6080ff_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            fill_win_intervals, reverse_code=migrations.RunPython.noop
+        ),
+    ]
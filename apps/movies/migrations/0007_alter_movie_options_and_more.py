@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0006_dataversion"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="movie",
+            options={"ordering": ["year", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["year", "id"], name="movies_movi_year_59138e_idx"
+            ),
+        ),
+    ]
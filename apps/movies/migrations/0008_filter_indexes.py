@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-18 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0007_alter_movie_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="producer",
+            name="name",
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name="studio",
+            name="name",
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["winner", "year"], name="movies_movi_winner_993a23_idx"
+            ),
+        ),
+        # The M2M through tables are auto-created, so their composite indexes are
+        # managed here instead of in model Meta. Leading with the related id they
+        # cover "movies of producer/studio X" lookups without touching the table.
+        migrations.RunSQL(
+            "CREATE INDEX movies_movie_producer_producer_movie_idx "
+            "ON movies_movie_producer (producer_id, movie_id)",
+            reverse_sql="DROP INDEX movies_movie_producer_producer_movie_idx",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX movies_movie_studio_studio_movie_idx "
+            "ON movies_movie_studio (studio_id, movie_id)",
+            reverse_sql="DROP INDEX movies_movie_studio_studio_movie_idx",
+        ),
+    ]
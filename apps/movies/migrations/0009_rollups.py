@@ -0,0 +1,108 @@
+# Generated by Django 5.2 on 2026-10-18 09:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def fill_rollups(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    YearRollup = apps.get_model("movies", "YearRollup")
+    YearRollup.objects.bulk_create(
+        [
+            YearRollup(**row)
+            for row in Movie.objects.order_by()
+            .values("year")
+            .annotate(nominations=Count("id"), wins=Count("id", filter=Q(winner=True)))
+        ],
+        batch_size=5000,
+    )
+    for entity, model_name in (
+        ("producer", "ProducerRollup"),
+        ("studio", "StudioRollup"),
+    ):
+        model = apps.get_model("movies", model_name)
+        through = Movie._meta.get_field(entity).remote_field.through
+        rows = (
+            through.objects.order_by()
+            .values(f"{entity}_id")
+            .annotate(
+                nominations=Count("movie_id"),
+                wins=Count("movie_id", filter=Q(movie__winner=True)),
+            )
+        )
+        model.objects.bulk_create(
+            [model(**row) for row in rows.iterator()], batch_size=5000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0008_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="YearRollup",
+            fields=[
+                ("year", models.IntegerField(primary_key=True, serialize=False)),
+                ("nominations", models.PositiveIntegerField(default=0)),
+                ("wins", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["year"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ProducerRollup",
+            fields=[
+                (
+                    "producer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="movies.producer",
+                    ),
+                ),
+                ("nominations", models.PositiveIntegerField(default=0)),
+                ("wins", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-wins", "producer"],
+                "indexes": [
+                    models.Index(
+                        fields=["-wins", "producer"], name="movies_prod_wins_d19ff9_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="StudioRollup",
+            fields=[
+                (
+                    "studio",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="movies.studio",
+                    ),
+                ),
+                ("nominations", models.PositiveIntegerField(default=0)),
+                ("wins", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-wins", "studio"],
+                "indexes": [
+                    models.Index(
+                        fields=["-wins", "studio"], name="movies_stud_wins_68edad_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_rollups, reverse_code=migrations.RunPython.noop),
+    ]
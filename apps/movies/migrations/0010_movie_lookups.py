@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 09:50
+
+from django.db import migrations, models
+
+
+def fill_movie_lookups(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    lookups = {
+        pk: {"studios": [], "producers": []}
+        for pk in Movie.objects.values_list("pk", flat=True)
+    }
+    for key, field in (("studios", "studio"), ("producers", "producer")):
+        through = Movie._meta.get_field(field).remote_field.through
+        rows = through.objects.order_by(f"{field}_id").values_list(
+            "movie_id", f"{field}_id", f"{field}__name"
+        )
+        for movie_id, pk, name in rows.iterator():
+            lookups[movie_id][key].append({"id": pk, "name": name})
+    Movie.objects.bulk_update(
+        [Movie(pk=pk, lookups=value) for pk, value in lookups.items()],
+        ["lookups"],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0009_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="lookups",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(
+            fill_movie_lookups, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -1,5 +1,19 @@
+from .data_version import DataVersion
+from .import_checkpoint import ImportCheckpoint
 from .movie import Movie
 from .producer import Producer
+from .producer_win_interval import ProducerWinInterval
+from .rollup import ProducerRollup, StudioRollup, YearRollup
 from .studio import Studio
 
-__all__ = ["Movie", "Producer", "Studio"]
+__all__ = [
+    "DataVersion",
+    "ImportCheckpoint",
+    "Movie",
+    "Producer",
+    "ProducerRollup",
+    "ProducerWinInterval",
+    "Studio",
+    "StudioRollup",
+    "YearRollup",
+]
@@ -0,0 +1,48 @@
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+
+class DataVersion(models.Model):
+    """
+    Single-row counter bumped on every write to the award data.
+
+    Caches and conditional responses derive their keys from it, so they never
+    outlive the data they were computed from.
+
+    Attributes:
+        generation (int): Incremented on every write.
+        updated_at (datetime): Time of the last write.
+    """
+
+    SINGLETON_ID = 1
+
+    generation = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return self.token
+
+    @property
+    def token(self) -> str:
+        # The timestamp keeps tokens unique even if the counter goes back, e.g.
+        # after restoring a backup.
+        return f"{self.generation}.{int(self.updated_at.timestamp() * 1_000_000)}"
+
+    @classmethod
+    def current(cls) -> "DataVersion":
+        version, created = cls.objects.get_or_create(pk=cls.SINGLETON_ID)
+        return version
+
+    @classmethod
+    async def acurrent(cls) -> "DataVersion":
+        version, created = await cls.objects.aget_or_create(pk=cls.SINGLETON_ID)
+        return version
+
+    @classmethod
+    def bump(cls):
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(
+            generation=F("generation") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            cls.objects.get_or_create(pk=cls.SINGLETON_ID, defaults={"generation": 1})
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Tracks the progress of a CSV import so an interrupted run can resume.
+
+    Attributes:
+        source (str): Absolute path of the imported file.
+        signature (str): Size and modification time of the file when the import
+          started.
+        rows (int): Number of rows already committed.
+        finished (bool): Indicates if the whole file was imported.
+        updated_at (datetime): Last time a chunk was committed.
+    """
+
+    source = models.CharField(max_length=1024, unique=True)
+    signature = models.CharField(max_length=64)
+    rows = models.PositiveBigIntegerField(default=0)
+    finished = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return self.source
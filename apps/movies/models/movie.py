@@ -11,6 +11,12 @@ class Movie(models.Model):
         producer (ManyToMany): Producers associated with the movie.
         studio (ManyToMany): Studios associated with the movie.
         winner (bool): Indicates if the movie is an award winner.
+        fingerprint (str): Hash of the year, title, producers and studios, used to
+          match CSV rows on incremental imports.
+        lookups (dict): Denormalized copy of the studios and producers,
+          `{"studios": [{"id", "name"}, ...], "producers": [...]}` in id order, so
+          list reads need no joins. The relations stay the source of truth; None
+          until computed.
     """
 
     year = models.IntegerField()
@@ -19,9 +25,15 @@ class Movie(models.Model):
     studio = models.ManyToManyField("movies.Studio", related_name="movies")
 
     winner = models.BooleanField(default=False)
+    fingerprint = models.CharField(max_length=40, blank=True, db_index=True)
+    lookups = models.JSONField(null=True, blank=True, editable=False)
 
     class Meta:
-        ordering = ["year"]
+        ordering = ["year", "id"]
+        indexes = [
+            models.Index(fields=["year", "id"]),
+            models.Index(fields=["winner", "year"]),
+        ]
 
     def __str__(self) -> str:
         return self.title
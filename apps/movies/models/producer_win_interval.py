@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class ProducerWinInterval(models.Model):
+    """
+    Interval between two consecutive 'Worst Picture' wins of a producer.
+
+    Rows are maintained by the signals in `apps.movies.signals` and can be rebuilt
+    with the `rebuild_win_intervals` management command.
+
+    Attributes:
+        producer (ForeignKey): Producer that won both awards.
+        previous_win (int): Year of the previous award.
+        following_win (int): Year of the following award.
+        interval (int): Number of years between both awards.
+    """
+
+    producer = models.ForeignKey(
+        "movies.Producer", on_delete=models.CASCADE, related_name="win_intervals"
+    )
+    previous_win = models.IntegerField()
+    following_win = models.IntegerField()
+    interval = models.IntegerField()
+
+    class Meta:
+        ordering = ["producer", "previous_win"]
+        indexes = [models.Index(fields=["interval"])]
+
+    def __str__(self) -> str:
+        return f"{self.producer_id}: {self.previous_win}-{self.following_win}"
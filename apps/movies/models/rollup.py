@@ -0,0 +1,79 @@
+from django.db import models
+
+
+class YearRollup(models.Model):
+    """
+    Number of nominated and winning movies of a year.
+
+    Rows are maintained by the signals in `apps.movies.signals` and can be rebuilt
+    with the `rebuild_rollups` management command.
+
+    Attributes:
+        year (int): Release year.
+        nominations (int): Movies of the year.
+        wins (int): Winning movies of the year.
+    """
+
+    year = models.IntegerField(primary_key=True)
+    nominations = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["year"]
+
+    def __str__(self) -> str:
+        return f"{self.year}: {self.wins}/{self.nominations}"
+
+
+class ProducerRollup(models.Model):
+    """
+    Number of nominated and winning movies of a producer.
+
+    Attributes:
+        producer (OneToOneField): Producer the counts belong to.
+        nominations (int): Movies of the producer.
+        wins (int): Winning movies of the producer.
+    """
+
+    producer = models.OneToOneField(
+        "movies.Producer",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rollup",
+    )
+    nominations = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-wins", "producer"]
+        indexes = [models.Index(fields=["-wins", "producer"])]
+
+    def __str__(self) -> str:
+        return f"{self.producer_id}: {self.wins}/{self.nominations}"
+
+
+class StudioRollup(models.Model):
+    """
+    Number of nominated and winning movies of a studio.
+
+    Attributes:
+        studio (OneToOneField): Studio the counts belong to.
+        nominations (int): Movies of the studio.
+        wins (int): Winning movies of the studio.
+    """
+
+    studio = models.OneToOneField(
+        "movies.Studio",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rollup",
+    )
+    nominations = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-wins", "studio"]
+        indexes = [models.Index(fields=["-wins", "studio"])]
+
+    def __str__(self) -> str:
+        return f"{self.studio_id}: {self.wins}/{self.nominations}"
@@ -9,7 +9,7 @@ class Studio(models.Model):
         name (str): Name of the studio.
     """
 
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
 
     def __str__(self) -> str:
         return self.name
@@ -0,0 +1,154 @@
+"""
+Query plan regression checks.
+
+Captures the SQLite `EXPLAIN QUERY PLAN` of every query a request runs and
+compares it with a golden plan: a table read through an index (SEARCH, or SCAN
+USING INDEX) that the new plan reads through a full scan is a regression.
+"""
+
+import json
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connection
+
+WATCHED_TABLES = {
+    "movies_movie",
+    "movies_movie_producer",
+    "movies_movie_studio",
+    "movies_producer",
+    "movies_studio",
+    "movies_producerwininterval",
+    "movies_yearrollup",
+    "movies_producerrollup",
+    "movies_studiorollup",
+}
+
+# Access kinds, best first.
+SEARCH, INDEX_SCAN, SCAN = "search", "index-scan", "scan"
+RANKS = {SEARCH: 0, INDEX_SCAN: 1, SCAN: 2}
+
+_ACCESS = re.compile(r"^(SCAN|SEARCH) (\w+)(.*)$")
+_ALIAS = re.compile(r'"(\w+)" ([A-Z]\d+)\b')
+_TABLE = re.compile(r'"(\w+)"')
+
+
+@contextmanager
+def capture_queries():
+    """
+    Collects the `(sql, params)` of every query run on the connection in the block.
+    """
+    queries = []
+
+    def wrapper(execute, sql, params, many, context):
+        if not many:
+            queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        yield queries
+
+
+def watched(sql: str) -> bool:
+    return bool(WATCHED_TABLES.intersection(_TABLE.findall(sql)))
+
+
+def explain(sql: str, params) -> list:
+    """
+    Returns the detail lines of the SQLite query plan of a query.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row[3] for row in cursor.fetchall()]
+
+
+def table_accesses(sql: str, plan: list) -> Counter:
+    """
+    Counts the accesses to watched tables of a plan, by table and access kind.
+
+    Subquery aliases (`U0`, `T3`...) are resolved to their tables from the SQL.
+    """
+    aliases = dict((alias, table) for table, alias in _ALIAS.findall(sql))
+    accesses = Counter()
+    for line in plan:
+        match = _ACCESS.match(line)
+        if match is None:
+            continue
+        operation, name, rest = match.groups()
+        table = aliases.get(name, name)
+        if table not in WATCHED_TABLES:
+            continue
+        if operation == "SEARCH":
+            kind = SEARCH
+        elif " USING " in rest:
+            kind = INDEX_SCAN
+        else:
+            kind = SCAN
+        accesses[table, kind] += 1
+    return accesses
+
+
+def regressions(golden: dict, current: dict) -> list:
+    """
+    Compares two captured plans, `{"sql": ..., "plan": [...]}`.
+
+    Returns:
+        list of str: One message per table that gained a scan.
+    """
+    before = table_accesses(golden["sql"], golden["plan"])
+    after = table_accesses(current["sql"], current["plan"])
+    messages = []
+    for table in sorted({table for table, kind in before | after}):
+        for kind in (SCAN, INDEX_SCAN):
+            # Accesses at least as bad as `kind`.
+            worse = [k for k in RANKS if RANKS[k] >= RANKS[kind]]
+            old = sum(before[table, k] for k in worse)
+            new = sum(after[table, k] for k in worse)
+            if new > old:
+                messages.append(
+                    f"{table}: {new - old} more {kind} access(es)\n"
+                    f"  golden: {golden['plan']}\n  current: {current['plan']}"
+                )
+                break
+    return messages
+
+
+def capture_plans(request) -> list:
+    """
+    Runs `request()` and returns the plans of the queries it ran on watched
+    tables, in order.
+    """
+    with capture_queries() as queries:
+        request()
+    return [
+        {"sql": sql, "plan": explain(sql, params)}
+        for sql, params in queries
+        if watched(sql)
+    ]
+
+
+def compare_plans(golden_plans: list, current_plans: list) -> list:
+    """
+    Compares the plans captured for one request with its golden plans.
+    """
+    if len(golden_plans) != len(current_plans):
+        return [
+            f"ran {len(current_plans)} queries on watched tables, golden plans have "
+            f"{len(golden_plans)}"
+        ]
+    messages = []
+    for golden, current in zip(golden_plans, current_plans):
+        messages.extend(regressions(golden, current))
+    return messages
+
+
+def load_golden(path) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def write_golden(path, plans: dict):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(plans, file, indent=2, sort_keys=True)
+        file.write("\n")
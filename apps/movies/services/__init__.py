@@ -0,0 +1,38 @@
+from .delta import DeltaIngestor, DeltaResult
+from .importer import (
+    CheckpointError,
+    import_csv,
+    import_rows,
+    start_background_import,
+    sync_csv,
+)
+from .ingestion import (
+    BulkIngestor,
+    IngestionResult,
+    MovieRow,
+    ParsedBatch,
+    movie_fingerprint,
+    split_names,
+)
+from .parsing import parse_csv_parallel
+from .synthetic import SyntheticSpec, generate_rows, write_csv
+
+__all__ = [
+    "BulkIngestor",
+    "CheckpointError",
+    "DeltaIngestor",
+    "DeltaResult",
+    "IngestionResult",
+    "MovieRow",
+    "ParsedBatch",
+    "SyntheticSpec",
+    "generate_rows",
+    "import_csv",
+    "import_rows",
+    "movie_fingerprint",
+    "parse_csv_parallel",
+    "split_names",
+    "start_background_import",
+    "sync_csv",
+    "write_csv",
+]
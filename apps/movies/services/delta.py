@@ -0,0 +1,190 @@
+import csv
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from .ingestion import DEFAULT_CHUNK_SIZE, BulkIngestor, MovieRow, movie_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeltaResult:
+    """
+    Summary of an incremental import.
+
+    Attributes:
+        inserted (int): Rows present in the file but not in the database.
+        updated (int): Stored movies whose winner flag changed.
+        deleted (int): Stored movies no longer present in the file.
+        unchanged (int): Rows that were already up to date.
+        elapsed (float): Wall-clock duration in seconds.
+        producer_ids (set of int): Producers of the inserted, updated or deleted
+          movies, whose derived data must be refreshed.
+        studio_ids (set of int): Studios of those movies.
+        years (set of int): Release years of those movies.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    elapsed: float = 0.0
+    producer_ids: set = field(default_factory=set)
+    studio_ids: set = field(default_factory=set)
+    years: set = field(default_factory=set)
+
+    @property
+    def rows(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+
+def fill_fingerprints(queryset, chunk_size=DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Computes the fingerprint of the given movies from their stored relationships.
+
+    Returns:
+        int: Number of movies updated.
+    """
+    model = queryset.model
+    movies = []
+    for movie in queryset.prefetch_related("producer", "studio").iterator(
+        chunk_size=chunk_size
+    ):
+        movie.fingerprint = movie_fingerprint(
+            movie.year,
+            movie.title,
+            [producer.name for producer in movie.producer.all()],
+            [studio.name for studio in movie.studio.all()],
+        )
+        movies.append(movie)
+    model.objects.bulk_update(movies, ["fingerprint"], batch_size=chunk_size)
+    return len(movies)
+
+
+class DeltaIngestor:
+    """
+    Brings the database in line with a movie list by touching only changed rows.
+
+    Each CSV row is identified by its fingerprint (year, title, producers and
+    studios). Rows whose fingerprint is not stored are inserted, stored movies whose
+    fingerprint is gone are deleted and matching movies only get their winner flag
+    updated, so the write cost is proportional to the delta.
+    """
+
+    def __init__(
+        self, movie_model, producer_model, studio_model, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        self.movie_model = movie_model
+        self.producer_model = producer_model
+        self.studio_model = studio_model
+        self.chunk_size = chunk_size
+
+    def sync_csv(self, csv_path) -> DeltaResult:
+        """
+        Applies the differences between a `;`-delimited file and the database.
+        """
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file, delimiter=";")
+            return self.sync(MovieRow.from_csv(row) for row in reader)
+
+    def sync(self, rows) -> DeltaResult:
+        """
+        Applies the differences between the given rows and the database.
+        """
+        result = DeltaResult()
+        started = time.perf_counter()
+
+        incoming = defaultdict(list)
+        for row in rows:
+            incoming[row.fingerprint].append(row)
+
+        with transaction.atomic():
+            fill_fingerprints(self.movie_model.objects.filter(fingerprint=""))
+
+            stored = defaultdict(list)
+            for fingerprint, pk, winner in self.movie_model.objects.values_list(
+                "fingerprint", "id", "winner"
+            ).order_by("id"):
+                stored[fingerprint].append((pk, winner))
+
+            inserts = []
+            winners = {True: [], False: []}
+            deletes = []
+            for fingerprint, new_rows in incoming.items():
+                movies = stored.pop(fingerprint, [])
+                for row, (pk, winner) in zip(new_rows, movies):
+                    if row.winner == winner:
+                        result.unchanged += 1
+                    else:
+                        winners[row.winner].append(pk)
+                inserts.extend(new_rows[len(movies) :])
+                deletes.extend(pk for pk, winner in movies[len(new_rows) :])
+            deletes.extend(pk for movies in stored.values() for pk, winner in movies)
+
+            for winner, pks in winners.items():
+                self._update_winner(pks, winner, result)
+            self._delete(deletes, result)
+            ingestor = BulkIngestor(
+                self.movie_model,
+                self.producer_model,
+                self.studio_model,
+                chunk_size=self.chunk_size,
+            )
+            ingestor.ingest(inserts)
+            for row in inserts:
+                result.producer_ids.update(
+                    ingestor.producer_ids[name] for name in row.producers
+                )
+                result.studio_ids.update(
+                    ingestor.studio_ids[name] for name in row.studios
+                )
+                result.years.add(row.year)
+
+        result.inserted = len(inserts)
+        result.updated = len(winners[True]) + len(winners[False])
+        result.deleted = len(deletes)
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            f"Importação incremental: {result.inserted} inseridos, {result.updated} "
+            f"atualizados, {result.deleted} removidos, {result.unchanged} inalterados "
+            f"em {result.elapsed:.2f}s."
+        )
+        return result
+
+    def _touched(self, movies, result: DeltaResult):
+        # Records the years, producers and studios whose derived data changes.
+        result.years.update(movies.values_list("year", flat=True))
+        result.producer_ids.update(movies.values_list("producer", flat=True))
+        result.studio_ids.update(movies.values_list("studio", flat=True))
+        result.producer_ids.discard(None)
+        result.studio_ids.discard(None)
+
+    def _update_winner(self, pks: list, winner: bool, result: DeltaResult):
+        for start in range(0, len(pks), self.chunk_size):
+            movies = self.movie_model.objects.filter(
+                pk__in=pks[start : start + self.chunk_size]
+            )
+            self._touched(movies, result)
+            movies.update(winner=winner)
+
+    def _delete(self, pks: list, result: DeltaResult):
+        if not pks:
+            return
+        for start in range(0, len(pks), self.chunk_size):
+            movies = self.movie_model.objects.filter(
+                pk__in=pks[start : start + self.chunk_size]
+            )
+            self._touched(movies, result)
+            movies.delete()
+
+        # A full rebuild would not recreate names that only the deleted movies used.
+        self.producer_model.objects.filter(
+            pk__in=result.producer_ids, movies__isnull=True
+        ).delete()
+        self.studio_model.objects.filter(
+            pk__in=result.studio_ids, movies__isnull=True
+        ).delete()
@@ -0,0 +1,222 @@
+import logging
+import os
+import threading
+
+from django.db import close_old_connections, connection, transaction
+
+from apps.movies.models import (
+    DataVersion,
+    ImportCheckpoint,
+    Movie,
+    Producer,
+    ProducerRollup,
+    ProducerWinInterval,
+    Studio,
+    StudioRollup,
+    YearRollup,
+)
+
+from .delta import DeltaIngestor
+from .ingestion import DEFAULT_CHUNK_SIZE, BulkIngestor
+from .intervals import rebuild_producer_intervals, refresh_producer_intervals
+from .parsing import parse_csv_parallel
+from .rollups import rebuild_rollups, refresh_movie_rollups
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointError(Exception):
+    """
+    Raised when a checkpointed import cannot be started or resumed.
+    """
+
+
+def file_signature(csv_path) -> str:
+    stat = os.stat(csv_path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def clear_catalogue():
+    """
+    Deletes every movie, producer and studio, their links and derived rows, and
+    every import checkpoint.
+
+    Runs one DELETE per table: the model signals would refresh the derived tables
+    once per deleted row.
+    """
+    models = [
+        ProducerWinInterval,
+        YearRollup,
+        ProducerRollup,
+        StudioRollup,
+        Movie.producer.through,
+        Movie.studio.through,
+        Movie,
+        Producer,
+        Studio,
+        ImportCheckpoint,
+    ]
+    with connection.cursor() as cursor:
+        for model in models:
+            table = connection.ops.quote_name(model._meta.db_table)
+            cursor.execute(f"DELETE FROM {table}")
+
+
+def import_csv(csv_path, chunk_size=DEFAULT_CHUNK_SIZE, restart=False, workers=1):
+    """
+    Imports a movie list file, committing and checkpointing after every chunk.
+
+    An interrupted run resumes from the last committed chunk the next time it is
+    called with the same file. A finished import is not repeated.
+
+    Args:
+        csv_path (str): Path of the `;`-delimited file to import.
+        chunk_size (int): Number of rows committed per transaction.
+        restart (bool): Deletes every imported movie, producer, studio and
+          checkpoint, then imports the file from the first row.
+        workers (int): Number of processes parsing the file. With more than one,
+          rows are committed per parsed byte range instead of per `chunk_size`.
+
+    Returns:
+        IngestionResult: Rows written by this call, or None when the file was
+          already imported.
+
+    Raises:
+        CheckpointError: If the file changed since the checkpoint was recorded, or
+          the database has movies but no checkpoint for this path.
+    """
+    source = os.path.abspath(csv_path)
+    signature = file_signature(source)
+
+    if restart:
+        # Replaces the catalogue: the rows committed by the previous run would
+        # otherwise be imported a second time.
+        with transaction.atomic():
+            clear_catalogue()
+            checkpoint = ImportCheckpoint.objects.create(
+                source=source, signature=signature
+            )
+            DataVersion.bump()
+    elif (
+        Movie.objects.exists()
+        and not ImportCheckpoint.objects.filter(source=source).exists()
+    ):
+        # Databases loaded by the 0002 migration, before checkpoints existed, or
+        # imported from another path (a moved checkout, a symlink): appending the
+        # file would duplicate the rows already stored.
+        raise CheckpointError(
+            f"O banco já tem filmes importados sem checkpoint para {source}. Use "
+            "delta para aplicar apenas as diferenças do arquivo, ou restart para "
+            "substituir o catálogo."
+        )
+    else:
+        checkpoint, created = ImportCheckpoint.objects.get_or_create(
+            source=source, defaults={"signature": signature}
+        )
+        if checkpoint.signature != signature:
+            raise CheckpointError(
+                f"O arquivo {source} mudou desde a última importação (linha "
+                f"{checkpoint.rows}). Use restart para importá-lo do início."
+            )
+        if checkpoint.finished:
+            logger.info(f"Arquivo {source} já importado, nada a fazer.")
+            return None
+
+    skip = checkpoint.rows
+    if skip:
+        logger.info(f"Retomando a importação de {source} a partir da linha {skip}.")
+
+    def save_checkpoint(rows):
+        checkpoint.rows = skip + rows
+        checkpoint.save(update_fields=["rows", "updated_at"])
+        DataVersion.bump()
+
+    ingestor = BulkIngestor(Movie, Producer, Studio, chunk_size=chunk_size)
+    if workers > 1:
+        batches = parse_csv_parallel(source, workers=workers, skip=skip)
+        result = ingestor.ingest_batches(batches, on_chunk=save_checkpoint)
+    else:
+        result = ingestor.ingest_csv(source, skip=skip, on_chunk=save_checkpoint)
+
+    checkpoint.finished = True
+    checkpoint.save(update_fields=["finished", "updated_at"])
+
+    # Bulk inserts skip the model signals that maintain the derived tables.
+    rebuild_producer_intervals()
+    rebuild_rollups()
+    DataVersion.bump()
+    return result
+
+
+def import_rows(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Appends already parsed rows (e.g. generated ones), one transaction per chunk.
+
+    Unlike import_csv there is no checkpoint: an interrupted run is not resumable.
+
+    Args:
+        rows (iterable of MovieRow): Rows to write, consumed lazily.
+        chunk_size (int): Number of rows committed per transaction.
+
+    Returns:
+        IngestionResult: Rows written and elapsed time.
+    """
+    ingestor = BulkIngestor(Movie, Producer, Studio, chunk_size=chunk_size)
+    result = ingestor.ingest(rows, on_chunk=lambda written: DataVersion.bump())
+
+    # Bulk inserts skip the model signals that maintain the derived tables.
+    rebuild_producer_intervals()
+    rebuild_rollups()
+    DataVersion.bump()
+    return result
+
+
+def sync_csv(csv_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Applies only the rows that changed in a movie list file since it was imported.
+
+    The checkpoint of the file is marked as finished afterwards, so a regular
+    import does not load it again.
+
+    Args:
+        csv_path (str): Path of the `;`-delimited file to import.
+        chunk_size (int): Number of rows written per statement.
+
+    Returns:
+        DeltaResult: Counts of inserted, updated, deleted and unchanged rows.
+    """
+    source = os.path.abspath(csv_path)
+    signature = file_signature(source)
+    ingestor = DeltaIngestor(Movie, Producer, Studio, chunk_size=chunk_size)
+    result = ingestor.sync_csv(source)
+    refresh_producer_intervals(result.producer_ids)
+    refresh_movie_rollups(result.years, result.producer_ids, result.studio_ids)
+    DataVersion.bump()
+
+    ImportCheckpoint.objects.update_or_create(
+        source=source,
+        defaults={"signature": signature, "rows": result.rows, "finished": True},
+    )
+    return result
+
+
+def start_background_import(csv_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Runs `import_csv` in a daemon thread so the API can serve requests meanwhile.
+
+    Returns:
+        threading.Thread: The started thread.
+    """
+
+    def run():
+        close_old_connections()
+        try:
+            import_csv(csv_path, chunk_size=chunk_size)
+        except Exception:
+            logger.exception(f"Erro ao importar {csv_path} em segundo plano.")
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=run, name="import-movies", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,266 @@
+import csv
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def split_names(names: str) -> list:
+    names_list = re.split(r",\s*|\s+and\s+", names)
+    names_list = [name.strip().replace("and", "") for name in names_list]
+    return names_list
+
+
+def movie_fingerprint(year: int, title: str, producers, studios) -> str:
+    """
+    Identifies a movie by its year, title and normalized producer/studio names.
+
+    Names are deduplicated and sorted, so the fingerprint computed from a CSV row
+    matches the one computed from the rows stored for it.
+    """
+    parts = [
+        str(year),
+        title,
+        "\x1e".join(sorted(set(producers))),
+        "\x1e".join(sorted(set(studios))),
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def build_lookups(studios, producers) -> dict:
+    """
+    Builds the Movie.lookups of a movie from `(id, name)` pairs, sorted by id as the
+    prefetch queries return them.
+    """
+    return {
+        "studios": [{"id": pk, "name": name} for pk, name in sorted(studios)],
+        "producers": [{"id": pk, "name": name} for pk, name in sorted(producers)],
+    }
+
+
+class MovieRow(NamedTuple):
+    """
+    A parsed CSV row, ready to be written to the database.
+
+    Attributes:
+        year (int): Release year of the movie.
+        title (str): Title of the movie.
+        winner (bool): Indicates if the movie is an award winner.
+        studios (list of str): Normalized studio names.
+        producers (list of str): Normalized producer names.
+    """
+
+    year: int
+    title: str
+    winner: bool
+    studios: list
+    producers: list
+
+    @classmethod
+    def from_csv(cls, row: dict) -> "MovieRow":
+        return cls(
+            year=int(row["year"]),
+            title=row["title"],
+            winner=row["winner"] == "yes",
+            studios=split_names(row["studios"]),
+            producers=split_names(row["producers"]),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        return movie_fingerprint(self.year, self.title, self.producers, self.studios)
+
+
+class ParsedBatch(NamedTuple):
+    """
+    A chunk of parsed rows together with the distinct names they reference.
+
+    Attributes:
+        rows (list of MovieRow): Rows of the chunk, in file order.
+        studios (list of str): Distinct studio names, in first-appearance order.
+        producers (list of str): Distinct producer names, in first-appearance order.
+    """
+
+    rows: list
+    studios: list
+    producers: list
+
+    @classmethod
+    def from_rows(cls, rows: list) -> "ParsedBatch":
+        return cls(
+            rows=rows,
+            studios=list(dict.fromkeys(name for row in rows for name in row.studios)),
+            producers=list(
+                dict.fromkeys(name for row in rows for name in row.producers)
+            ),
+        )
+
+
+@dataclass
+class IngestionResult:
+    """
+    Summary of an ingestion run.
+
+    Attributes:
+        rows (int): Number of CSV rows written.
+        elapsed (float): Wall-clock duration in seconds.
+    """
+
+    rows: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+class BulkIngestor:
+    """
+    Writes movie rows using set-based inserts instead of per-row lookups.
+
+    Producer and studio names are resolved through in-memory name -> id maps, so
+    each chunk costs a handful of `bulk_create` calls regardless of its size. Every
+    chunk is written in its own transaction.
+
+    The model classes are received as arguments and must match the current schema,
+    Movie.lookups included: rows are written with their denormalized names.
+    """
+
+    def __init__(
+        self, movie_model, producer_model, studio_model, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        self.movie_model = movie_model
+        self.producer_model = producer_model
+        self.studio_model = studio_model
+        self.chunk_size = chunk_size
+        self.producer_through = movie_model.producer.through
+        self.studio_through = movie_model.studio.through
+        self.producer_ids = None
+        self.studio_ids = None
+
+    def ingest_csv(self, csv_path, skip=0, on_chunk=None) -> IngestionResult:
+        """
+        Streams a `;`-delimited movie list file into the database.
+
+        Args:
+            csv_path (str): Path of the file to import.
+            skip (int): Number of leading data rows to ignore, used to resume.
+            on_chunk (callable, optional): See `ingest`.
+        """
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file, delimiter=";")
+            rows = (MovieRow.from_csv(row) for row in islice(reader, skip, None))
+            return self.ingest(rows, on_chunk=on_chunk)
+
+    def ingest(
+        self,
+        rows: Iterable[MovieRow],
+        on_chunk: Optional[Callable[[int], None]] = None,
+    ) -> IngestionResult:
+        """
+        Writes the given rows, one transaction per chunk.
+
+        Args:
+            rows (iterable of MovieRow): Rows to write, consumed lazily.
+            on_chunk (callable, optional): Called inside each chunk transaction with
+              the number of rows written so far, so progress can be committed
+              atomically with the data.
+        """
+        batches = (ParsedBatch.from_rows(chunk) for chunk in self._chunks(rows))
+        return self.ingest_batches(batches, on_chunk=on_chunk)
+
+    def ingest_batches(
+        self,
+        batches: Iterable[ParsedBatch],
+        on_chunk: Optional[Callable[[int], None]] = None,
+    ) -> IngestionResult:
+        """
+        Writes already parsed batches, one transaction per batch.
+
+        Args:
+            batches (iterable of ParsedBatch): Batches to write, consumed lazily.
+            on_chunk (callable, optional): See `ingest`.
+        """
+        result = IngestionResult()
+        started = time.perf_counter()
+        self._load_names()
+
+        for batch in batches:
+            with transaction.atomic():
+                self._write_batch(batch)
+                result.rows += len(batch.rows)
+                if on_chunk is not None:
+                    on_chunk(result.rows)
+
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            f"{result.rows} linhas importadas em {result.elapsed:.2f}s "
+            f"({result.rows_per_second:.0f} linhas/s)."
+        )
+        return result
+
+    def _chunks(self, rows: Iterable[MovieRow]) -> Iterator[list]:
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield chunk
+
+    def _load_names(self):
+        self.producer_ids = dict(self.producer_model.objects.values_list("name", "id"))
+        self.studio_ids = dict(self.studio_model.objects.values_list("name", "id"))
+
+    def _resolve_names(self, model, ids: dict, names: list):
+        # Batch names keep their first-appearance order, matching the ids that
+        # per-row get_or_create calls would have assigned.
+        missing = [name for name in names if name not in ids]
+        if missing:
+            created = model.objects.bulk_create([model(name=name) for name in missing])
+            ids.update((obj.name, obj.pk) for obj in created)
+
+    def _lookups(self, row: MovieRow) -> dict:
+        return build_lookups(
+            [(self.studio_ids[name], name) for name in dict.fromkeys(row.studios)],
+            [(self.producer_ids[name], name) for name in dict.fromkeys(row.producers)],
+        )
+
+    def _write_batch(self, batch: ParsedBatch):
+        chunk = batch.rows
+        self._resolve_names(self.studio_model, self.studio_ids, batch.studios)
+        self._resolve_names(self.producer_model, self.producer_ids, batch.producers)
+
+        movies = self.movie_model.objects.bulk_create(
+            [
+                self.movie_model(
+                    year=row.year,
+                    title=row.title,
+                    winner=row.winner,
+                    fingerprint=row.fingerprint,
+                    lookups=self._lookups(row),
+                )
+                for row in chunk
+            ]
+        )
+
+        studio_links = []
+        producer_links = []
+        for movie, row in zip(movies, chunk):
+            studio_links.extend(
+                self.studio_through(movie_id=movie.pk, studio_id=self.studio_ids[name])
+                for name in dict.fromkeys(row.studios)
+            )
+            producer_links.extend(
+                self.producer_through(
+                    movie_id=movie.pk, producer_id=self.producer_ids[name]
+                )
+                for name in dict.fromkeys(row.producers)
+            )
+        self.studio_through.objects.bulk_create(studio_links)
+        self.producer_through.objects.bulk_create(producer_links)
@@ -0,0 +1,429 @@
+import heapq
+import math
+import threading
+from bisect import bisect_left, bisect_right
+
+from django.db import transaction
+from django.db.models import (
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    Q,
+    Subquery,
+    Window,
+)
+from django.db.models.functions import Lag
+
+from apps.movies.models import Movie, Producer, ProducerWinInterval
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    numpy = None
+
+
+def winning_years(producer_ids=None) -> list:
+    """
+    Fetches every (producer id, producer name, year) of a winning movie, sorted by
+      producer and year, in a single query.
+
+    Args:
+        producer_ids (iterable of int, optional): Restricts the result to these
+          producers.
+    """
+    qs = Movie.producer.through.objects.filter(movie__winner=True)
+    if producer_ids is not None:
+        qs = qs.filter(producer_id__in=producer_ids)
+    return list(
+        qs.order_by("producer_id", "movie__year").values_list(
+            "producer_id", "producer__name", "movie__year"
+        )
+    )
+
+
+def consecutive_intervals(wins) -> list:
+    """
+    Pairs each win with the previous win of the same producer.
+
+    Args:
+        wins (iterable): `(producer id, name, year)` tuples sorted by producer and
+          year, as returned by `winning_years`.
+
+    Returns:
+        list: `(producer id, previous year, following year)` tuples.
+    """
+    pairs = []
+    previous_id = previous_year = None
+    for producer_id, name, year in wins:
+        if producer_id == previous_id:
+            pairs.append((producer_id, previous_year, year))
+        previous_id, previous_year = producer_id, year
+    return pairs
+
+
+def _interval(name, previous_win, following_win) -> dict:
+    # Keys follow the sources of ProducerWinnerIntervalSerializer.
+    return {
+        "name": name,
+        "interval": following_win - previous_win,
+        "award_last_year": previous_win,
+        "award_year": following_win,
+    }
+
+
+def min_max_intervals(wins: list) -> dict:
+    """
+    Finds the shortest and longest intervals between consecutive wins in one pass.
+
+    Args:
+        wins (list): `(producer id, name, year)` tuples sorted by producer and year,
+          as returned by `winning_years`.
+
+    Returns:
+        dict: `min` and `max` lists of intervals, ties included, in producer and
+          year order.
+    """
+    if numpy is not None and len(wins) > 1:
+        return _min_max_intervals_numpy(wins)
+
+    shortest = longest = None
+    min_list, max_list = [], []
+    previous_id = previous_year = None
+    for producer_id, name, year in wins:
+        if producer_id == previous_id:
+            interval = year - previous_year
+            if shortest is None or interval < shortest:
+                shortest, min_list = interval, []
+            if longest is None or interval > longest:
+                longest, max_list = interval, []
+            if interval == shortest:
+                min_list.append(_interval(name, previous_year, year))
+            if interval == longest:
+                max_list.append(_interval(name, previous_year, year))
+        previous_id, previous_year = producer_id, year
+
+    return {"min": min_list, "max": max_list}
+
+
+def _min_max_intervals_numpy(wins: list) -> dict:
+    producer_ids = numpy.fromiter((win[0] for win in wins), dtype=numpy.int64)
+    years = numpy.fromiter((win[2] for win in wins), dtype=numpy.int64)
+
+    intervals = years[1:] - years[:-1]
+    consecutive = producer_ids[1:] == producer_ids[:-1]
+    if not consecutive.any():
+        return {"min": [], "max": []}
+
+    valid = intervals[consecutive]
+    data = {}
+    for key, extreme in (("min", valid.min()), ("max", valid.max())):
+        positions = numpy.flatnonzero(consecutive & (intervals == extreme))
+        data[key] = [
+            _interval(wins[i + 1][1], int(years[i]), int(years[i + 1]))
+            for i in positions
+        ]
+    return data
+
+
+def producer_intervals() -> dict:
+    """
+    Shortest and longest intervals between consecutive wins of the same producer.
+    """
+    return min_max_intervals(winning_years())
+
+
+def stored_interval_rows():
+    """
+    Queries the shortest and longest intervals of the ProducerWinInterval table.
+
+    Both extremes come from indexed MIN/MAX lookups on `interval`, in one query.
+    """
+    intervals = ProducerWinInterval.objects.values("interval")
+    return (
+        ProducerWinInterval.objects.filter(
+            Q(interval=Subquery(intervals.order_by("interval")[:1]))
+            | Q(interval=Subquery(intervals.order_by("-interval")[:1]))
+        )
+        .order_by("producer_id", "previous_win")
+        .values(
+            "interval",
+            name=F("producer__name"),
+            award_last_year=F("previous_win"),
+            award_year=F("following_win"),
+        )
+    )
+
+
+def split_extremes(rows: list) -> dict:
+    """
+    Splits the rows of `stored_interval_rows` into `{"min": [...], "max": [...]}`.
+    """
+    data = {"min": [], "max": []}
+    if rows:
+        shortest = min(row["interval"] for row in rows)
+        longest = max(row["interval"] for row in rows)
+        data["min"] = [row for row in rows if row["interval"] == shortest]
+        data["max"] = [row for row in rows if row["interval"] == longest]
+    return data
+
+
+def stored_producer_intervals() -> dict:
+    """
+    Reads `producer_intervals` from the materialized ProducerWinInterval table.
+    """
+    return split_extremes(list(stored_interval_rows()))
+
+
+async def astored_producer_intervals() -> dict:
+    """
+    Async version of `stored_producer_intervals`.
+    """
+    return split_extremes([row async for row in stored_interval_rows()])
+
+
+def _interval_rows(wins) -> list:
+    return [
+        ProducerWinInterval(
+            producer_id=producer_id,
+            previous_win=previous_win,
+            following_win=following_win,
+            interval=following_win - previous_win,
+        )
+        for producer_id, previous_win, following_win in consecutive_intervals(wins)
+    ]
+
+
+def refresh_producer_intervals(producer_ids):
+    """
+    Recomputes the stored intervals of the given producers only.
+    """
+    producer_ids = set(producer_ids)
+    if not producer_ids:
+        return
+    with transaction.atomic():
+        ProducerWinInterval.objects.filter(producer_id__in=producer_ids).delete()
+        ProducerWinInterval.objects.bulk_create(
+            _interval_rows(winning_years(producer_ids))
+        )
+
+
+def rebuild_producer_intervals() -> int:
+    """
+    Recomputes the whole ProducerWinInterval table.
+
+    Returns:
+        int: Number of intervals stored.
+    """
+    with transaction.atomic():
+        ProducerWinInterval.objects.all().delete()
+        rows = ProducerWinInterval.objects.bulk_create(
+            _interval_rows(winning_years()), batch_size=5000
+        )
+    return len(rows)
+
+
+def producer_intervals_sql() -> dict:
+    """
+    Window function (LAG) implementation of `producer_intervals`.
+
+    It evaluates the window three times (aggregate, min and max filters); kept to
+    benchmark and cross-check the single-pass engine.
+    """
+    qs = (
+        Producer.objects.filter(movies__winner=True)
+        .annotate(
+            award_year=F("movies__year"),  # Current year award
+            award_last_year=Window(
+                expression=Lag("movies__year"),  # get the last year award
+                partition_by=[F("id")],  # annotate by producer
+                order_by=F("movies__year").asc(),
+            ),
+        )
+        .annotate(
+            interval=ExpressionWrapper(
+                F("award_year") - F("award_last_year"), output_field=IntegerField()
+            )
+        )
+        .exclude(award_last_year__isnull=True)
+        .values("name", "interval", "award_last_year", "award_year")
+    )
+
+    # using window and lag, isn't possible annotate min and max interval
+    interval = qs.aggregate(
+        max_interval=Max("interval"),
+        min_interval=Min("interval"),
+    )
+    return {
+        "min": list(qs.filter(interval=interval["min_interval"])),
+        "max": list(qs.filter(interval=interval["max_interval"])),
+    }
+
+
+# Relations whose win intervals can be analysed, by entity name.
+WIN_ENTITIES = {"producer": Movie.producer, "studio": Movie.studio}
+
+
+def entity_winning_years(entity: str) -> list:
+    """
+    `winning_years` of producers or studios.
+
+    Args:
+        entity (str): A key of WIN_ENTITIES.
+    """
+    relation = WIN_ENTITIES[entity]
+    field = relation.field.m2m_reverse_field_name()
+    return list(
+        relation.through.objects.filter(movie__winner=True)
+        .order_by(f"{field}_id", "movie__year")
+        .values_list(f"{field}_id", f"{field}__name", "movie__year")
+    )
+
+
+class WinIndex:
+    """
+    Consecutive win pairs of every producer or studio, built once per data version
+    and held by `win_indexes`.
+
+    The pairs are sorted by their first win year, so each query bisects them to the
+    year window and keeps the k shortest and longest interval lengths in bounded
+    heaps as it walks that slice once, instead of running a new window function
+    scan.
+    """
+
+    def __init__(self, wins):
+        """
+        Args:
+            wins (iterable): `(id, name, year)` tuples sorted by id and year, as
+              returned by `entity_winning_years`.
+        """
+        self.names = {}
+        self.pairs = []
+        previous_id = previous_year = None
+        for pk, name, year in wins:
+            if pk == previous_id:
+                self.names[pk] = name
+                self.pairs.append((pk, previous_year, year))
+            previous_id, previous_year = pk, year
+        self.pairs.sort(key=lambda pair: pair[1])
+        self.starts = [pair[1] for pair in self.pairs]
+
+    def intervals(self, year_from=None, year_to=None):
+        """
+        Yields `(id, previous year, following year)` of every pair of consecutive
+          wins within the window, by first win year.
+        """
+        start = 0 if year_from is None else bisect_left(self.starts, year_from)
+        if year_to is None:
+            yield from self.pairs[start:]
+            return
+        # Pairs starting within the window may still end after it.
+        for pair in self.pairs[start : bisect_right(self.starts, year_to)]:
+            if pair[2] <= year_to:
+                yield pair
+
+    def extremes(self, year_from=None, year_to=None, k=1) -> dict:
+        """
+        Finds the intervals of the k shortest and k longest lengths.
+
+        Args:
+            year_from (int, optional): First year of the window, inclusive.
+            year_to (int, optional): Last year of the window, inclusive; both wins
+              of an interval must be within the window.
+            k (int): Number of distinct lengths at each end; every interval of
+              those lengths is returned, so k=1 gives `producer_intervals`.
+
+        Returns:
+            dict: `min` and `max` lists of intervals, shortest (longest) first, then
+              in id and year order.
+        """
+        shortest, longest = _KSmallest(k), _KSmallest(k)
+        for pair in self.intervals(year_from, year_to):
+            # Most lengths fall between both bounds and are skipped here.
+            length = pair[2] - pair[1]
+            if length <= shortest.bound:
+                shortest.add(length, pair)
+            if -length <= longest.bound:
+                longest.add(-length, pair)
+        return {
+            key: [
+                _interval(self.names[pk], previous, following)
+                for pk, previous, following in extremes.pairs()
+            ]
+            for key, extremes in (("min", shortest), ("max", longest))
+        }
+
+
+class _KSmallest:
+    """
+    The pairs of the k smallest distinct keys added so far.
+
+    A max-heap bounded to k keys gives the largest kept key, the one to evict, in
+    O(1); keys above it are dropped as they come.
+
+    Attributes:
+        bound (float): Largest key `add` may keep, infinite until k keys are kept.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.bound = math.inf
+        self._heap = []  # Negated keys.
+        self._pairs = {}
+
+    def add(self, key: int, pair):
+        pairs = self._pairs.get(key)
+        if pairs is not None:
+            pairs.append(pair)
+            return
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, -key)
+        elif key < self.bound:
+            del self._pairs[-heapq.heappushpop(self._heap, -key)]
+        else:
+            return
+        self._pairs[key] = [pair]
+        if len(self._heap) == self.k:
+            self.bound = -self._heap[0]
+
+    def pairs(self):
+        """
+        Yields the kept pairs by key, then in id and year order.
+        """
+        for key in sorted(self._pairs):
+            yield from sorted(self._pairs[key])
+
+
+class WinIndexStore:
+    """
+    Holds the WinIndex of each entity for the current data version, in process
+    memory.
+
+    The Django cache would pickle the whole index on every set and unpickle it on
+    every get, which costs as much as the wins it holds.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def get(self, entity: str, version) -> WinIndex:
+        """
+        Returns the index of `entity` at the given DataVersion, building it on the
+        first call after the version changes.
+        """
+        token, index = self._indexes.get(entity, (None, None))
+        if token != version.token:
+            with self._lock:
+                token, index = self._indexes.get(entity, (None, None))
+                if token != version.token:
+                    index = WinIndex(entity_winning_years(entity))
+                    self._indexes[entity] = (version.token, index)
+        return index
+
+    def clear(self):
+        self._indexes = {}
+
+
+win_indexes = WinIndexStore()
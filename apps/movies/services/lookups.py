@@ -0,0 +1,97 @@
+"""
+Denormalized studio and producer names on Movie.lookups.
+
+The relations stay the source of truth: these helpers recompute the column from
+the through tables. Model signals refresh the movies a write touches, the bulk
+ingestor fills it as it inserts and `check_movie_lookups` finds and repairs
+drift.
+"""
+
+from django.db import transaction
+
+from apps.movies.models import Movie
+
+from .ingestion import DEFAULT_CHUNK_SIZE, build_lookups
+
+# Movie relation of each lookups key.
+LOOKUP_RELATIONS = {"studios": "studio", "producers": "producer"}
+
+
+def compute_lookups(movie_model, movie_ids) -> dict:
+    """
+    Reads the lookups of the given movies from the through tables, with one query
+    per relation.
+
+    Returns:
+        dict: Lookups by movie id; movies without relations get empty lists.
+    """
+    pairs = {pk: {key: [] for key in LOOKUP_RELATIONS} for pk in movie_ids}
+    for key, field in LOOKUP_RELATIONS.items():
+        through = movie_model._meta.get_field(field).remote_field.through
+        rows = through.objects.filter(movie_id__in=movie_ids).values_list(
+            "movie_id", f"{field}_id", f"{field}__name"
+        )
+        for movie_id, pk, name in rows:
+            pairs[movie_id][key].append((pk, name))
+    return {pk: build_lookups(**related) for pk, related in pairs.items()}
+
+
+def _write_lookups(model, lookups: dict, chunk_size=DEFAULT_CHUNK_SIZE):
+    with transaction.atomic():
+        model.objects.bulk_update(
+            [model(pk=pk, lookups=value) for pk, value in lookups.items()],
+            ["lookups"],
+            batch_size=chunk_size,
+        )
+
+
+def fill_lookups(queryset, chunk_size=DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Recomputes the lookups of the given movies, one chunk per transaction.
+
+    Returns:
+        int: Number of movies updated.
+    """
+    model = queryset.model
+    pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(pks), chunk_size):
+        chunk = pks[start : start + chunk_size]
+        _write_lookups(model, compute_lookups(model, chunk), chunk_size)
+    return len(pks)
+
+
+def refresh_movie_lookups(movie_ids) -> dict:
+    """
+    Recomputes the lookups of the given movies only.
+
+    Returns:
+        dict: The new lookups, by movie id.
+    """
+    movie_ids = set(movie_ids)
+    if not movie_ids:
+        return {}
+    lookups = compute_lookups(Movie, list(movie_ids))
+    _write_lookups(Movie, lookups)
+    return lookups
+
+
+def check_lookups(queryset, chunk_size=DEFAULT_CHUNK_SIZE) -> tuple:
+    """
+    Compares the stored lookups of the given movies with their relations.
+
+    Returns:
+        tuple: Ids of the movies whose lookups differ from the relations, and of
+          those whose lookups were never computed.
+    """
+    model = queryset.model
+    stale, missing = [], []
+    stored = list(queryset.order_by("pk").values_list("pk", "lookups"))
+    for start in range(0, len(stored), chunk_size):
+        chunk = stored[start : start + chunk_size]
+        expected = compute_lookups(model, [pk for pk, lookups in chunk])
+        for pk, lookups in chunk:
+            if lookups is None:
+                missing.append(pk)
+            elif lookups != expected[pk]:
+                stale.append(pk)
+    return stale, missing
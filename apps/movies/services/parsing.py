@@ -0,0 +1,129 @@
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator
+
+import django
+
+from .ingestion import MovieRow, ParsedBatch, split_names
+
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=65536)
+def normalize_names(names: str) -> tuple:
+    """
+    Memoized `split_names`; producer and studio cells repeat a lot across rows.
+    """
+    return tuple(split_names(names))
+
+
+def byte_ranges(csv_path, range_size=DEFAULT_RANGE_SIZE) -> tuple:
+    """
+    Splits the data section of a movie list file into byte ranges.
+
+    Returns:
+        tuple: The header fields and a list of `(start, end)` offsets. A line
+          belongs to the range its first byte falls in.
+    """
+    with open(csv_path, "rb") as csv_file:
+        header_line = csv_file.readline()
+        data_start = csv_file.tell()
+        size = os.fstat(csv_file.fileno()).st_size
+
+    header = next(csv.reader([header_line.decode("utf-8")], delimiter=";"))
+    ranges = [
+        (start, min(start + range_size, size))
+        for start in range(data_start, size, range_size)
+    ]
+    return header, ranges
+
+
+def parse_range(csv_path, header, start, end, data_start) -> ParsedBatch:
+    """
+    Parses the lines whose first byte is within `[start, end)`.
+
+    Runs inside the worker processes of `parse_csv_parallel`.
+    """
+    with open(csv_path, "rb") as csv_file:
+        if start > data_start:
+            # The line that crosses `start` belongs to the previous range.
+            csv_file.seek(start - 1)
+            csv_file.readline()
+        else:
+            csv_file.seek(start)
+        position = csv_file.tell()
+        lines = []
+        while position < end:
+            line = csv_file.readline()
+            if not line:
+                break
+            lines.append(line)
+            position += len(line)
+
+    text = io.StringIO(b"".join(lines).decode("utf-8"), newline="")
+    rows = []
+    for row in csv.DictReader(text, fieldnames=header, delimiter=";"):
+        rows.append(
+            MovieRow(
+                year=int(row["year"]),
+                title=row["title"],
+                winner=row["winner"] == "yes",
+                studios=list(normalize_names(row["studios"])),
+                producers=list(normalize_names(row["producers"])),
+            )
+        )
+    return ParsedBatch.from_rows(rows)
+
+
+def parse_csv_parallel(
+    csv_path, workers=None, range_size=DEFAULT_RANGE_SIZE, skip=0
+) -> Iterator[ParsedBatch]:
+    """
+    Parses a movie list file across a process pool, yielding batches in file order.
+
+    The file is split into byte ranges that are parsed independently, so it must
+    not contain quoted fields spanning several lines (movielist.csv never does).
+    Only a bounded number of ranges is in flight at a time, which keeps memory
+    flat whatever the size of the file.
+
+    Args:
+        csv_path (str): Path of the `;`-delimited file.
+        workers (int, optional): Number of worker processes. Defaults to the CPU
+          count.
+        range_size (int): Size in bytes of the range parsed by each task.
+        skip (int): Number of leading data rows to drop, used to resume.
+
+    Yields:
+        ParsedBatch: One batch per byte range, skipping empty ones.
+    """
+    header, ranges = byte_ranges(csv_path, range_size)
+    data_start = ranges[0][0] if ranges else 0
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+        pending = deque()
+        tasks = iter(ranges)
+        for start, end in islice(tasks, workers * 2):
+            pending.append(
+                pool.submit(parse_range, csv_path, header, start, end, data_start)
+            )
+
+        while pending:
+            batch = pending.popleft().result()
+            for start, end in islice(tasks, 1):
+                pending.append(
+                    pool.submit(parse_range, csv_path, header, start, end, data_start)
+                )
+
+            if skip >= len(batch.rows):
+                skip -= len(batch.rows)
+                continue
+            if skip:
+                batch = ParsedBatch.from_rows(batch.rows[skip:])
+                skip = 0
+            yield batch
@@ -0,0 +1,161 @@
+"""
+Rollup tables behind the aggregates endpoint.
+
+Per-year, per-producer and per-studio nomination and win counts are stored in
+YearRollup, ProducerRollup and StudioRollup, so every facet is an indexed read of
+a few rows instead of a GROUP BY over the movie joins. Model signals recompute the
+rows of the years, producers and studios a write touches; bulk imports rebuild the
+tables.
+"""
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from apps.movies.models import (
+    Movie,
+    ProducerRollup,
+    StudioRollup,
+    YearRollup,
+)
+
+# Rollup model of each relation, by entity name.
+ROLLUP_ENTITIES = {
+    "producer": (Movie.producer, ProducerRollup),
+    "studio": (Movie.studio, StudioRollup),
+}
+
+
+def year_counts(years=None):
+    """
+    Counts the movies and winning movies of each year.
+
+    Args:
+        years (iterable of int, optional): Restricts the result to these years.
+
+    Returns:
+        QuerySet: `{"year", "nominations", "wins"}` dicts.
+    """
+    qs = Movie.objects.all()
+    if years is not None:
+        qs = qs.filter(year__in=years)
+    return (
+        qs.order_by()
+        .values("year")
+        .annotate(nominations=Count("id"), wins=Count("id", filter=Q(winner=True)))
+    )
+
+
+def entity_counts(entity: str, ids=None):
+    """
+    Counts the movies and winning movies of each producer or studio.
+
+    Args:
+        entity (str): A key of ROLLUP_ENTITIES.
+        ids (iterable of int, optional): Restricts the result to these entities.
+
+    Returns:
+        QuerySet: `{"<entity>_id", "nominations", "wins"}` dicts.
+    """
+    relation, _ = ROLLUP_ENTITIES[entity]
+    qs = relation.through.objects.all()
+    if ids is not None:
+        qs = qs.filter(**{f"{entity}_id__in": ids})
+    return (
+        qs.order_by()
+        .values(f"{entity}_id")
+        .annotate(
+            nominations=Count("movie_id"),
+            wins=Count("movie_id", filter=Q(movie__winner=True)),
+        )
+    )
+
+
+def refresh_year_rollups(years):
+    """
+    Recomputes the rollup rows of the given years only.
+    """
+    years = set(years)
+    if not years:
+        return
+    with transaction.atomic():
+        YearRollup.objects.filter(year__in=years).delete()
+        YearRollup.objects.bulk_create(
+            [YearRollup(**row) for row in year_counts(years)]
+        )
+
+
+def refresh_entity_rollups(entity: str, ids):
+    """
+    Recomputes the rollup rows of the given producers or studios only.
+    """
+    ids = set(ids)
+    if not ids:
+        return
+    _, model = ROLLUP_ENTITIES[entity]
+    with transaction.atomic():
+        model.objects.filter(pk__in=ids).delete()
+        model.objects.bulk_create([model(**row) for row in entity_counts(entity, ids)])
+
+
+def refresh_movie_rollups(years=(), producer_ids=(), studio_ids=()):
+    """
+    Recomputes the rollup rows a movie write touched.
+    """
+    with transaction.atomic():
+        refresh_year_rollups(years)
+        refresh_entity_rollups("producer", producer_ids)
+        refresh_entity_rollups("studio", studio_ids)
+
+
+def rebuild_rollups() -> int:
+    """
+    Recomputes the three rollup tables.
+
+    Returns:
+        int: Number of rows stored.
+    """
+    count = 0
+    with transaction.atomic():
+        YearRollup.objects.all().delete()
+        count += len(
+            YearRollup.objects.bulk_create(
+                [YearRollup(**row) for row in year_counts()], batch_size=5000
+            )
+        )
+        for entity, (_, model) in ROLLUP_ENTITIES.items():
+            model.objects.all().delete()
+            count += len(
+                model.objects.bulk_create(
+                    [model(**row) for row in entity_counts(entity).iterator()],
+                    batch_size=5000,
+                )
+            )
+    return count
+
+
+def aggregates(year_from=None, year_to=None, limit=10) -> dict:
+    """
+    Reads the dashboard facets from the rollup tables.
+
+    Args:
+        year_from (int, optional): First year of the `years` facet, inclusive.
+        year_to (int, optional): Last year of the `years` facet, inclusive.
+        limit (int): Number of producers and studios to return.
+
+    Returns:
+        dict: `years` counts in year order, and the `producers` and `studios` with
+          the most wins, ties in id order.
+    """
+    years = YearRollup.objects.all()
+    if year_from is not None:
+        years = years.filter(year__gte=year_from)
+    if year_to is not None:
+        years = years.filter(year__lte=year_to)
+    data = {"years": list(years.values("year", "nominations", "wins"))}
+    for entity, (_, model) in ROLLUP_ENTITIES.items():
+        data[f"{entity}s"] = list(
+            model.objects.values(
+                "nominations", "wins", id=F(f"{entity}_id"), name=F(f"{entity}__name")
+            )[:limit]
+        )
+    return data
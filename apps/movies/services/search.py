@@ -0,0 +1,113 @@
+import logging
+
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+TITLE_INDEX = "movies_movie_fts"
+
+# External content FTS5 table: it stores only the index, reading titles from
+# movies_movie, and the triggers keep it in sync with inserts, updates and deletes
+# (including bulk_create and QuerySet.update).
+TITLE_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TITLE_INDEX} USING fts5(
+        title, content='movies_movie', content_rowid='id'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TITLE_INDEX}_insert AFTER INSERT ON movies_movie
+    BEGIN
+        INSERT INTO {TITLE_INDEX}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TITLE_INDEX}_delete AFTER DELETE ON movies_movie
+    BEGIN
+        INSERT INTO {TITLE_INDEX}({TITLE_INDEX}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TITLE_INDEX}_update
+    AFTER UPDATE OF title ON movies_movie
+    BEGIN
+        INSERT INTO {TITLE_INDEX}({TITLE_INDEX}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+        INSERT INTO {TITLE_INDEX}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+]
+
+_available = {}
+
+
+def title_index_available(using="default") -> bool:
+    """
+    Indicates if the FTS5 title index exists on the given database.
+    """
+    if using not in _available:
+        connection = connections[using]
+        _available[using] = (
+            connection.vendor == "sqlite"
+            and TITLE_INDEX in connection.introspection.table_names()
+        )
+    return _available[using]
+
+
+def install_title_index(using="default") -> bool:
+    """
+    Creates the FTS5 title index and its triggers if they are missing.
+
+    Table rebuilds done by SQLite migrations drop the triggers of movies_movie, so
+    this runs after every `migrate` and rebuilds the index whenever a trigger had to
+    be recreated.
+
+    Returns:
+        bool: False when the database does not support FTS5.
+    """
+    connection = connections[using]
+    _available.pop(using, None)
+    if connection.vendor != "sqlite":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' "
+            "AND name LIKE %s",
+            [f"{TITLE_INDEX}_%"],
+        )
+        triggers = cursor.fetchone()[0]
+        try:
+            for sql in TITLE_INDEX_SQL:
+                cursor.execute(sql)
+        except DatabaseError as e:
+            logger.warning(f"FTS5 indisponível, busca por título usará LIKE: {e}")
+            return False
+        if triggers < len(TITLE_INDEX_SQL) - 1:
+            cursor.execute(
+                f"INSERT INTO {TITLE_INDEX}({TITLE_INDEX}) VALUES ('rebuild')"
+            )
+    return True
+
+
+def match_expression(terms) -> str:
+    """
+    Builds an FTS5 query matching every term as a token prefix.
+    """
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def title_ranks(terms, using="default") -> dict:
+    """
+    Queries the FTS5 rank of every movie whose title matches the search terms.
+
+    Returns:
+        dict: Rank by movie id, lower is better.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, rank FROM {TITLE_INDEX} WHERE {TITLE_INDEX} MATCH %s",
+            [match_expression(terms)],
+        )
+        return dict(cursor.fetchall())
@@ -0,0 +1,227 @@
+import csv
+import random
+from dataclasses import dataclass
+from typing import Iterator
+
+from .ingestion import MovieRow
+
+# split_names() splits on "," and " and ", and drops every "and" it finds, so no
+# generated name may contain it.
+FIRST_NAMES = [
+    "Alan",
+    "Barbara",
+    "Carl",
+    "Diane",
+    "Edward",
+    "Fiona",
+    "George",
+    "Helen",
+    "Irene",
+    "Jerry",
+    "Karen",
+    "Louis",
+    "Martha",
+    "Neil",
+    "Olivia",
+    "Peter",
+    "Quentin",
+    "Rita",
+    "Steve",
+    "Teresa",
+    "Ulrich",
+    "Vera",
+    "Walter",
+    "Yvonne",
+]
+LAST_NAMES = [
+    "Abbott",
+    "Becker",
+    "Carr",
+    "Dietz",
+    "Ellis",
+    "Fisher",
+    "Gordon",
+    "Hughes",
+    "Ivers",
+    "Jensen",
+    "Keller",
+    "Lowe",
+    "Moreau",
+    "Novak",
+    "Owens",
+    "Price",
+    "Quinn",
+    "Reyes",
+    "Silver",
+    "Tucker",
+    "Ueda",
+    "Vaughn",
+    "Weiss",
+    "Young",
+]
+STUDIO_WORDS = [
+    "Paramount",
+    "Columbia",
+    "Universal",
+    "Orion",
+    "Cannon",
+    "Tristar",
+    "Carolco",
+    "Summit",
+    "Lionsgate",
+    "Miramax",
+    "Dimension",
+    "Republic",
+]
+STUDIO_SUFFIXES = ["Pictures", "Films", "Studios", "Entertainment", "Media"]
+TITLE_ADJECTIVES = [
+    "Last",
+    "Dark",
+    "Final",
+    "Lost",
+    "Silent",
+    "Wild",
+    "Broken",
+    "Golden",
+    "Hidden",
+    "Burning",
+    "Frozen",
+    "Crimson",
+    "Endless",
+    "Savage",
+    "Secret",
+]
+TITLE_NOUNS = [
+    "Night",
+    "Empire",
+    "Island",
+    "Mission",
+    "Horizon",
+    "Legacy",
+    "Storm",
+    "Kingdom",
+    "Warrior",
+    "Planet",
+    "Voyage",
+    "Shadow",
+    "Return",
+    "Code",
+    "Ghost",
+]
+SEQUELS = ["", "", "", "", " II", " III", ": Part 2", ": Reloaded"]
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """
+    Parameters of a generated movie list.
+
+    Attributes:
+        movies (int): Number of movies.
+        producers_per_movie (float): Average producers of a movie, at least 1.
+        winner_ratio (float): Fraction of movies that won the award.
+        year_from (int): First year of the list.
+        year_to (int): Last year of the list.
+        seed (int): Seed of the random generator; a spec always generates the
+          same rows.
+    """
+
+    movies: int = 10_000
+    producers_per_movie: float = 1.5
+    winner_ratio: float = 0.2
+    year_from: int = 1980
+    year_to: int = 2025
+    seed: int = 42
+
+    @property
+    def producer_pool(self) -> int:
+        return max(self.movies // 4, 1)
+
+    @property
+    def studio_pool(self) -> int:
+        return max(self.movies // 50, 1)
+
+
+def _person(index: int) -> str:
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    rest, last = divmod(index // len(FIRST_NAMES), len(LAST_NAMES))
+    name = f"{first} {LAST_NAMES[last]}"
+    return f"{name} {rest + 1}" if rest else name
+
+
+def _studio(index: int) -> str:
+    word = STUDIO_WORDS[index % len(STUDIO_WORDS)]
+    rest, suffix = divmod(index // len(STUDIO_WORDS), len(STUDIO_SUFFIXES))
+    name = f"{word} {STUDIO_SUFFIXES[suffix]}"
+    return f"{name} {rest + 1}" if rest else name
+
+
+def _popular(rng: random.Random, pool: int) -> int:
+    # Skewed towards low indexes: a few names appear very often (and win again
+    # years later), most appear once or twice, as in the real list.
+    return int(pool * rng.random() ** 2)
+
+
+def _names(rng: random.Random, count: int, pool: int, name) -> list:
+    indexes = []
+    for _ in range(min(count, pool)):
+        index = _popular(rng, pool)
+        while index in indexes:
+            index = rng.randrange(pool)
+        indexes.append(index)
+    return [name(index) for index in indexes]
+
+
+def generate_rows(spec: SyntheticSpec) -> Iterator[MovieRow]:
+    """
+    Generates the movies of `spec` lazily, ordered by year like movielist.csv.
+
+    Memory use does not depend on the number of movies.
+    """
+    rng = random.Random(spec.seed)
+    years = spec.year_to - spec.year_from + 1
+    extra_producers = max(spec.producers_per_movie - 1, 0)
+
+    for i in range(spec.movies):
+        producers = 1
+        if extra_producers:
+            producers += min(int(rng.expovariate(1 / extra_producers)), 9)
+        yield MovieRow(
+            year=spec.year_from + i * years // spec.movies,
+            title=(
+                f"The {rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+                f"{rng.choice(SEQUELS)}"
+            ),
+            winner=rng.random() < spec.winner_ratio,
+            studios=_names(rng, rng.choice((1, 1, 2)), spec.studio_pool, _studio),
+            producers=_names(rng, producers, spec.producer_pool, _person),
+        )
+
+
+def _join_names(names: list) -> str:
+    if len(names) == 1:
+        return names[0]
+    return f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def write_csv(rows, file) -> int:
+    """
+    Writes rows to an open text file in the `;`-delimited movielist.csv format.
+
+    Returns:
+        int: Number of rows written.
+    """
+    writer = csv.writer(file, delimiter=";", lineterminator="\n")
+    writer.writerow(["year", "title", "studios", "producers", "winner"])
+    count = 0
+    for count, row in enumerate(rows, 1):
+        writer.writerow(
+            [
+                row.year,
+                row.title,
+                _join_names(row.studios),
+                _join_names(row.producers),
+                "yes" if row.winner else "",
+            ]
+        )
+    return count
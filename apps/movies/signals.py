@@ -0,0 +1,206 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.movies.models import DataVersion, Movie, Producer, Studio
+from apps.movies.services.ingestion import build_lookups
+from apps.movies.services.intervals import refresh_producer_intervals
+from apps.movies.services.lookups import refresh_movie_lookups
+from apps.movies.services.rollups import refresh_entity_rollups, refresh_movie_rollups
+from apps.movies.services.search import install_title_index
+
+# Bulk writes (bulk_create, QuerySet.update/delete) do not send these signals; the
+# import services rebuild the derived tables and bump the data version themselves
+# after writing.
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_save, sender=Producer)
+@receiver(post_save, sender=Studio)
+@receiver(post_delete, sender=Movie)
+@receiver(post_delete, sender=Producer)
+@receiver(post_delete, sender=Studio)
+def bump_data_version(sender, raw=False, **kwargs):
+    """
+    Invalidates cached responses derived from the award data.
+    """
+    if not raw:
+        DataVersion.bump()
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+@receiver(m2m_changed, sender=Movie.studio.through)
+def bump_data_version_on_m2m_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        DataVersion.bump()
+
+
+@receiver(post_save, sender=Movie)
+def refresh_intervals_on_movie_save(sender, instance, created, raw=False, **kwargs):
+    """
+    A changed year or winner flag moves the intervals of the movie's producers.
+    """
+    if created or raw:
+        return
+    refresh_producer_intervals(instance.producer.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Movie)
+def collect_producers_on_movie_delete(sender, instance, **kwargs):
+    instance._deleted_producer_ids = list(
+        instance.producer.values_list("pk", flat=True)
+    )
+    instance._deleted_studio_ids = list(instance.studio.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Movie)
+def refresh_intervals_on_movie_delete(sender, instance, **kwargs):
+    refresh_producer_intervals(getattr(instance, "_deleted_producer_ids", []))
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+def refresh_intervals_on_producers_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Keeps intervals in sync when producers are linked to or unlinked from movies.
+    """
+    if action == "pre_clear":
+        if reverse:
+            instance._cleared_producer_ids = [instance.pk]
+        else:
+            instance._cleared_producer_ids = list(
+                instance.producer.values_list("pk", flat=True)
+            )
+    elif action == "post_clear":
+        refresh_producer_intervals(getattr(instance, "_cleared_producer_ids", []))
+    elif action in ("post_add", "post_remove"):
+        if reverse:
+            refresh_producer_intervals([instance.pk])
+        elif instance.winner:
+            refresh_producer_intervals(pk_set or [])
+
+
+@receiver(pre_save, sender=Movie)
+def collect_year_on_movie_save(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    instance._previous_year = (
+        Movie.objects.filter(pk=instance.pk).values_list("year", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Movie)
+def refresh_rollups_on_movie_save(sender, instance, created, raw=False, **kwargs):
+    """
+    A new movie counts in its year; a changed year or winner flag also moves the
+    counts of the movie's producers and studios.
+    """
+    if raw:
+        return
+    if created:
+        refresh_movie_rollups(years=[instance.year])
+        return
+    refresh_movie_rollups(
+        years={instance.year, getattr(instance, "_previous_year", instance.year)},
+        producer_ids=instance.producer.values_list("pk", flat=True),
+        studio_ids=instance.studio.values_list("pk", flat=True),
+    )
+
+
+@receiver(post_delete, sender=Movie)
+def refresh_rollups_on_movie_delete(sender, instance, **kwargs):
+    refresh_movie_rollups(
+        years=[instance.year],
+        producer_ids=getattr(instance, "_deleted_producer_ids", []),
+        studio_ids=getattr(instance, "_deleted_studio_ids", []),
+    )
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+@receiver(m2m_changed, sender=Movie.studio.through)
+def refresh_rollups_on_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keeps the producer and studio counts in sync when they are linked to or
+    unlinked from movies.
+    """
+    entity = "producer" if sender is Movie.producer.through else "studio"
+    attribute = f"_cleared_{entity}_rollup_ids"
+    if action == "pre_clear":
+        if reverse:
+            setattr(instance, attribute, [instance.pk])
+        else:
+            related = getattr(instance, entity)
+            setattr(instance, attribute, list(related.values_list("pk", flat=True)))
+    elif action == "post_clear":
+        refresh_entity_rollups(entity, getattr(instance, attribute, []))
+    elif action in ("post_add", "post_remove"):
+        refresh_entity_rollups(entity, [instance.pk] if reverse else pk_set or [])
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+@receiver(m2m_changed, sender=Movie.studio.through)
+def refresh_lookups_on_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keeps Movie.lookups in sync when producers and studios are linked to or
+    unlinked from movies.
+    """
+    if reverse:
+        if action == "pre_clear":
+            instance._cleared_movie_ids = list(
+                instance.movies.values_list("pk", flat=True)
+            )
+        elif action == "post_clear":
+            refresh_movie_lookups(getattr(instance, "_cleared_movie_ids", []))
+        elif action in ("post_add", "post_remove"):
+            refresh_movie_lookups(pk_set or [])
+    elif action in ("post_add", "post_remove", "post_clear"):
+        # Also updates the instance, so saving it later keeps the new lookups.
+        instance.lookups = refresh_movie_lookups([instance.pk])[instance.pk]
+
+
+@receiver(pre_save, sender=Movie)
+def init_lookups_on_movie_create(sender, instance, raw=False, **kwargs):
+    # A new movie has no relations yet.
+    if not raw and instance._state.adding and instance.lookups is None:
+        instance.lookups = build_lookups([], [])
+
+
+@receiver(post_save, sender=Movie)
+def refresh_lookups_on_movie_save(sender, instance, created, raw=False, **kwargs):
+    """
+    An instance loaded before its relations changed saves outdated lookups.
+    """
+    if not created and not raw:
+        instance.lookups = refresh_movie_lookups([instance.pk])[instance.pk]
+
+
+@receiver(post_save, sender=Producer)
+@receiver(post_save, sender=Studio)
+def refresh_lookups_on_rename(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        refresh_movie_lookups(instance.movies.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Producer)
+@receiver(pre_delete, sender=Studio)
+def collect_movies_on_delete(sender, instance, **kwargs):
+    instance._deleted_movie_ids = list(instance.movies.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Producer)
+@receiver(post_delete, sender=Studio)
+def refresh_lookups_on_delete(sender, instance, **kwargs):
+    refresh_movie_lookups(getattr(instance, "_deleted_movie_ids", []))
+
+
+def install_search_index(sender, using="default", **kwargs):
+    """
+    Connected to post_migrate; (re)creates the FTS5 title index where supported.
+    """
+    install_title_index(using)
@@ -0,0 +1,276 @@
+"""
+Read-only in-memory snapshot of the award data.
+
+The catalogue is small and changes only on imports, so with
+settings.MOVIES_SNAPSHOT_SERVING the read endpoints answer from a snapshot of
+movies, producers, studios and their links held in memory, instead of querying the
+database. Each snapshot records the DataVersion it was loaded at; once the version
+moves on, a new snapshot is loaded in a background thread and swapped in with a
+single assignment, while requests fall back to the database meanwhile.
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from django.db import close_old_connections, connections, router
+
+from apps.movies.db import read_transaction
+from apps.movies.models import DataVersion, Movie, Producer, Studio
+from apps.movies.services.intervals import split_extremes
+
+logger = logging.getLogger(__name__)
+
+
+class MovieRecord:
+    """
+    A movie of the snapshot, with the ids of its studios and producers.
+    """
+
+    __slots__ = ("id", "year", "title", "winner", "studios", "producers")
+
+    def __init__(self, id, year, title, winner):
+        self.id = id
+        self.year = year
+        self.title = title
+        self.winner = winner
+        self.studios = ()
+        self.producers = ()
+
+
+def _names_by_id(rows) -> list:
+    rows = list(rows)
+    names = [None] * (max((pk for pk, name in rows), default=0) + 1)
+    for pk, name in rows:
+        names[pk] = name
+    return names
+
+
+def _ids_by_name(names: list) -> dict:
+    ids = defaultdict(list)
+    for pk, name in enumerate(names):
+        if name is not None:
+            ids[name].append(pk)
+    return dict(ids)
+
+
+def _links(relation, using) -> dict:
+    # Sorted by related id, as the prefetch queries return them: they read the
+    # (movie_id, related_id) unique index.
+    through = relation.through
+    related = relation.field.m2m_reverse_field_name()
+    rows = (
+        through.objects.using(using)
+        .order_by("movie_id", f"{related}_id")
+        .values_list("movie_id", f"{related}_id")
+    )
+    links = defaultdict(list)
+    for movie_id, related_id in rows.iterator(chunk_size=10_000):
+        links[movie_id].append(related_id)
+    return links
+
+
+class Snapshot:
+    """
+    Movies indexed by id, by (year, id), by winner flag and by producer and studio.
+
+    Attributes:
+        token (str): DataVersion token the snapshot was loaded at.
+        movies (list of MovieRecord): Every movie, in (year, id) order.
+        winners (list of MovieRecord): Winning movies, in (year, id) order.
+        awards_intervals (dict): `min` and `max` producer intervals.
+    """
+
+    def __init__(self, token, movies, producer_names, studio_names):
+        self.token = token
+        self.movies = movies
+        self.years = [movie.year for movie in movies]
+        self.winners = [movie for movie in movies if movie.winner]
+        self.winner_years = [movie.year for movie in self.winners]
+        self.nominees = [movie for movie in movies if not movie.winner]
+        self.nominee_years = [movie.year for movie in self.nominees]
+
+        self._by_id = [None] * (max((m.id for m in movies), default=0) + 1)
+        by_producer, by_studio = defaultdict(list), defaultdict(list)
+        for movie in movies:
+            self._by_id[movie.id] = movie
+            for pk in movie.producers:
+                by_producer[pk].append(movie)
+            for pk in movie.studios:
+                by_studio[pk].append(movie)
+        self._by_producer = dict(by_producer)
+        self._by_studio = dict(by_studio)
+
+        self.producer_names = producer_names
+        self.studio_names = studio_names
+        self._producers_by_name = _ids_by_name(producer_names)
+        self._studios_by_name = _ids_by_name(studio_names)
+        self.awards_intervals = self._awards_intervals()
+
+    @classmethod
+    def load(cls, using=None) -> "Snapshot":
+        """
+        Reads the whole catalogue in one read transaction.
+        """
+        using = using or router.db_for_read(Movie)
+        with read_transaction(using):
+            token = (
+                DataVersion.objects.using(using).get(pk=DataVersion.SINGLETON_ID).token
+            )
+            rows = Movie.objects.using(using).values_list(
+                "id", "year", "title", "winner"
+            )
+            movies = [MovieRecord(*row) for row in rows.iterator(chunk_size=10_000)]
+            producers = _links(Movie.producer, using)
+            studios = _links(Movie.studio, using)
+            producer_names = _names_by_id(
+                Producer.objects.using(using).values_list("id", "name")
+            )
+            studio_names = _names_by_id(
+                Studio.objects.using(using).values_list("id", "name")
+            )
+
+        for movie in movies:
+            movie.producers = tuple(producers.get(movie.id, ()))
+            movie.studios = tuple(studios.get(movie.id, ()))
+        return cls(token, movies, producer_names, studio_names)
+
+    def get(self, pk: int):
+        """
+        Returns the movie with the given id, or None.
+        """
+        if 0 <= pk < len(self._by_id):
+            return self._by_id[pk]
+        return None
+
+    def between(self, year_from=None, year_to=None, winner=None) -> list:
+        """
+        Movies released between two years, inclusive, in (year, id) order.
+        """
+        movies, years = self.movies, self.years
+        if winner is not None:
+            movies = self.winners if winner else self.nominees
+            years = self.winner_years if winner else self.nominee_years
+        start = 0 if year_from is None else bisect_left(years, year_from)
+        stop = len(years) if year_to is None else bisect_right(years, year_to)
+        return movies[start:stop]
+
+    def producer_movies(self, pk: int) -> list:
+        return self._by_producer.get(pk, [])
+
+    def studio_movies(self, pk: int) -> list:
+        return self._by_studio.get(pk, [])
+
+    def producer_ids(self, name: str) -> list:
+        return self._producers_by_name.get(name, [])
+
+    def studio_ids(self, name: str) -> list:
+        return self._studios_by_name.get(name, [])
+
+    def serialize_movies(self, movies) -> list:
+        """
+        Serializes movies as MovieSerializer does.
+        """
+        producer_names, studio_names = self.producer_names, self.studio_names
+        return [
+            {
+                "id": movie.id,
+                "year": movie.year,
+                "title": movie.title,
+                "winner": movie.winner,
+                "studios": [
+                    {"id": pk, "name": studio_names[pk]} for pk in movie.studios
+                ],
+                "producers": [
+                    {"id": pk, "name": producer_names[pk]} for pk in movie.producers
+                ],
+            }
+            for movie in movies
+        ]
+
+    def _awards_intervals(self) -> dict:
+        """
+        Shortest and longest intervals between consecutive wins of the same
+        producer, as `stored_producer_intervals` reads them.
+        """
+        wins = defaultdict(list)
+        for movie in self.winners:
+            for pk in movie.producers:
+                wins[pk].append(movie.year)
+
+        return split_extremes(
+            [
+                {
+                    "interval": following - previous,
+                    "name": self.producer_names[pk],
+                    "award_last_year": previous,
+                    "award_year": following,
+                }
+                for pk in sorted(wins)
+                for previous, following in zip(wins[pk], wins[pk][1:])
+            ]
+        )
+
+
+class SnapshotStore:
+    """
+    Holds the current snapshot and reloads it when the data version changes.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._loader = None
+
+    def get(self, version: DataVersion):
+        """
+        Returns the snapshot of the given data version, or None after starting
+        to load it.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.token == version.token:
+            return snapshot
+        self.refresh_in_background()
+        return None
+
+    def refresh(self) -> Snapshot:
+        """
+        Loads a snapshot of the current data and swaps it in.
+        """
+        with self._lock:
+            snapshot = Snapshot.load()
+            self._snapshot = snapshot
+        logger.info(
+            f"Snapshot {snapshot.token} carregado: {len(snapshot.movies)} filmes."
+        )
+        return snapshot
+
+    def refresh_in_background(self):
+        """
+        Runs `refresh` in a daemon thread, unless a load is already running.
+
+        Returns:
+            threading.Thread: The started thread, or None.
+        """
+        if self._loader is not None and self._loader.is_alive():
+            return None
+
+        def run():
+            close_old_connections()
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Erro ao carregar o snapshot dos filmes.")
+            finally:
+                connections.close_all()
+
+        self._loader = threading.Thread(target=run, name="movies-snapshot", daemon=True)
+        self._loader.start()
+        return self._loader
+
+    def clear(self):
+        self._snapshot = None
+
+
+snapshots = SnapshotStore()
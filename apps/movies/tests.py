@@ -1,8 +1,61 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Q
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
 
-from .models import Movie, Producer, Studio
+from movies_awards.schema import generate_schema, precomputed_schema, read_artifact
+
+from . import query_plans, timing
+from .api.filters import MovieFilterSet
+from .api.pagination import MovieKeysetPagination
+from .api.serializers.movie import MAX_BATCH_SIZE
+from .cache import SingleFlight, get_cache
+from .models import (
+    DataVersion,
+    ImportCheckpoint,
+    Movie,
+    Producer,
+    ProducerRollup,
+    ProducerWinInterval,
+    Studio,
+    StudioRollup,
+    YearRollup,
+)
+from .services import (
+    BulkIngestor,
+    MovieRow,
+    SyntheticSpec,
+    generate_rows,
+    import_csv,
+    import_rows,
+    intervals,
+    lookups,
+    parse_csv_parallel,
+    rollups,
+    sync_csv,
+    write_csv,
+)
+from .snapshot import Snapshot, snapshots
+from .urls import async_urlpatterns, router
 
 
 class MovieModelTest(TestCase):
@@ -99,6 +152,8 @@ class MovieViewSetTest(APITestCase):
                 movie.studio.add(self.studio2)
 
         Movie.objects.filter(pk__in=[1, 3, 7, 10]).update(winner=True)
+        # QuerySet.update() bypasses the signals that maintain the interval table.
+        intervals.rebuild_producer_intervals()
 
     def test_list_pagination(self):
         """
@@ -110,6 +165,45 @@ class MovieViewSetTest(APITestCase):
         self.assertTrue("results" in response.data)
         self.assertEqual(len(response.data["results"]), 10)  # Default page size
 
+    def test_cursor_pagination(self):
+        """
+        Test keyset pagination walks every movie in (year, id) order without
+          counting.
+        """
+        for i in range(12):
+            Movie.objects.create(year=2005, title=f"Sequel {i}")
+        expected = list(
+            Movie.objects.order_by("year", "id").values_list("id", flat=True)
+        )
+
+        ids = []
+        url = reverse("movie-list") + "?pagination=cursor"
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(
+                any("COUNT(" in query["sql"] for query in context.captured_queries)
+            )
+            self.assertNotIn("count", response.data)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(ids, expected)
+
+        response = self.client.get(reverse("movie-list") + "?cursor=invalid")
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_pagination_uses_index(self):
+        """
+        Test that a keyset page seeks through the (year, id) index.
+        """
+        queryset = Movie.objects.filter(
+            Q(year__gte=2005) & (Q(year__gt=2005) | Q(id__gt=6))
+        ).order_by("year", "id")[:11]
+        plan = queryset.explain()
+        self.assertIn("USING INDEX", plan)
+        self.assertNotIn("USE TEMP B-TREE", plan)
+
     def test_awards_interval_endpoint(self):
         """
         Test the awards interval endpoint with complex data.
@@ -149,8 +243,1926 @@ class MovieViewSetTest(APITestCase):
         response = self.client.put(url, {})
         self.assertEqual(response.status_code, 405)
 
+    def test_export_ndjson(self):
+        """
+        Test the NDJSON export streams one list-shaped object per movie.
+        """
+        response = self.client.get(reverse("movie-export"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 15)
+
+        detail = self.client.get(reverse("movie-detail", args=[1]))
+        self.assertEqual(json.loads(lines[0]), json.loads(detail.content))
+
+    def test_export_csv(self):
+        """
+        Test the CSV export reads back with the movielist.csv importer format.
+        """
+        response = self.client.get(reverse("movie-export"), {"output": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("movielist.csv", response["Content-Disposition"])
+        content = b"".join(response.streaming_content).decode()
+        rows = [
+            MovieRow.from_csv(row)
+            for row in csv.DictReader(content.splitlines(), delimiter=";")
+        ]
+        self.assertEqual(len(rows), 15)
+        self.assertEqual(
+            rows[1], (2001, "Movie 1", False, ["Test Studio 2"], ["Test Producer 2"])
+        )
+
+    def test_export_filters(self):
+        """
+        Test the export honours the list filters and rejects unknown formats.
+        """
+        response = self.client.get(
+            reverse("movie-export"), {"winner": "true", "year_from": "2005"}
+        )
+        titles = [
+            json.loads(line)["title"]
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(titles, ["Movie 6", "Movie 9"])
+
+        response = self.client.get(reverse("movie-export"), {"output": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch_retrieve(self):
+        """
+        Test that the batch endpoint returns the requested movies in order, as
+        detail does, and reports the unknown ids.
+        """
+        url = reverse("movie-batch")
+        response = self.client.get(url, {"ids": "5, 2,999,5"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["notFound"], [999])
+        self.assertEqual(
+            response.json()["results"],
+            [
+                self.client.get(reverse("movie-detail", args=[pk])).json()
+                for pk in (5, 2)
+            ],
+        )
+
+        posted = self.client.post(url, {"ids": [5, 2, 999, 5]}, format="json")
+        self.assertEqual(posted.content, response.content)
+        with self.settings(MOVIES_FAST_SERIALIZATION=True):
+            fast = self.client.get(url, {"ids": "5,2,999,5"})
+        self.assertEqual(fast.content, response.content)
+
+    def test_batch_validation(self):
+        """
+        Test that missing, invalid and too many ids are rejected.
+        """
+        url = reverse("movie-batch")
+        for params in ({}, {"ids": ""}, {"ids": "1,x"}, {"ids": "0"}):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn("ids", response.data)
+
+        ids = list(range(1, MAX_BATCH_SIZE + 2))
+        response = self.client.post(url, {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, 400)
+
     def movies_search_by_title(self):
         url = reverse("movie-list") + "?search=Alpha"
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTrue(all(item["title"] == "Alpha" for item in response.data))
+
+
+class MovieFilterSetTest(APITestCase):
+    """
+    APITestCase for MovieFilterSet on the movie list endpoint.
+
+    This suite covers:
+        - Year range, winner, producer and studio filters
+        - Query plans using indexes for every filter combination
+    """
+
+    COMBINATIONS = [
+        {"year": "1990"},
+        {"year_from": "1990", "year_to": "2000"},
+        {"winner": "true"},
+        {"winner": "false", "year_from": "1990"},
+        {"producer": "1"},
+        {"producer_name": "Producer A"},
+        {"studio": "1"},
+        {"studio_name": "Studio X"},
+        {"winner": "true", "producer_name": "Producer A"},
+        {"producer": "1", "studio": "1", "year_to": "2000"},
+    ]
+
+    def setUp(self):
+        """
+        Set up movies spread across years, producers and studios.
+        """
+        self.producer1 = Producer.objects.create(name="Producer A")
+        self.producer2 = Producer.objects.create(name="Producer B")
+        self.studio1 = Studio.objects.create(name="Studio X")
+        self.studio2 = Studio.objects.create(name="Studio Y")
+        for i in range(12):
+            movie = Movie.objects.create(
+                year=1985 + i * 2, title=f"Movie {i}", winner=i % 3 == 0
+            )
+            movie.producer.add(self.producer1 if i % 2 else self.producer2)
+            movie.studio.add(self.studio1 if i < 6 else self.studio2)
+
+    def get_titles(self, **params):
+        response = self.client.get(reverse("movie-list"), params)
+        self.assertEqual(response.status_code, 200)
+        return [item["title"] for item in response.data["results"]]
+
+    def test_filters(self):
+        """
+        Test each filter against the equivalent ORM query.
+        """
+        self.assertEqual(self.get_titles(year=1989), ["Movie 2"])
+        self.assertEqual(
+            self.get_titles(year_from=1990, year_to=1995),
+            ["Movie 3", "Movie 4", "Movie 5"],
+        )
+        self.assertEqual(
+            self.get_titles(winner="true"), ["Movie 0", "Movie 3", "Movie 6", "Movie 9"]
+        )
+        self.assertEqual(
+            self.get_titles(producer=self.producer1.pk, winner="true"),
+            ["Movie 3", "Movie 9"],
+        )
+        self.assertEqual(
+            self.get_titles(producer_name="Producer B", studio_name="Studio Y"),
+            ["Movie 6", "Movie 8", "Movie 10"],
+        )
+        self.assertEqual(
+            self.get_titles(studio=self.studio1.pk, year_to=1988),
+            ["Movie 0", "Movie 1"],
+        )
+
+    def test_filters_use_indexes(self):
+        """
+        Test that no filter combination scans the movie or M2M tables.
+        """
+        for params in self.COMBINATIONS:
+            queryset = MovieFilterSet(params, queryset=Movie.objects.all()).qs
+            plan = queryset[:10].explain()
+            with self.subTest(params=params):
+                self.assertNotRegex(plan, r"\bSCAN movies_movie")
+
+
+class MovieSearchTest(APITestCase):
+    """
+    APITestCase for the FTS5 title search on the movie list endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up movies with overlapping title words.
+        """
+        for year, title in [
+            (1980, "Friday the 13th"),
+            (1981, "Friday Night"),
+            (1982, "Night Shift"),
+            (1983, "The Formula"),
+        ]:
+            Movie.objects.create(year=year, title=title)
+
+    def search(self, term):
+        response = self.client.get(reverse("movie-list"), {"search": term})
+        self.assertEqual(response.status_code, 200)
+        return [item["title"] for item in response.data["results"]]
+
+    def test_prefix_search(self):
+        """
+        Test that every term matches as a word prefix.
+        """
+        self.assertEqual(self.search("fri 13"), ["Friday the 13th"])
+        self.assertEqual(self.search("nig"), ["Friday Night", "Night Shift"])
+        self.assertEqual(self.search("ula"), [])
+        self.assertEqual(self.search('"'), [])
+
+    def test_index_follows_writes(self):
+        """
+        Test that the index follows inserts, title updates and deletes.
+        """
+        movie = Movie.objects.get(title="The Formula")
+        movie.title = "The Equation"
+        movie.save()
+        Movie.objects.bulk_create([Movie(year=1984, title="Formula One")])
+        Movie.objects.filter(title="Night Shift").delete()
+
+        self.assertEqual(self.search("formula"), ["Formula One"])
+        self.assertEqual(self.search("equa"), ["The Equation"])
+        self.assertEqual(self.search("night"), ["Friday Night"])
+
+    def test_fallback_without_index(self):
+        """
+        Test that databases without FTS5 keep the LIKE-based search.
+        """
+        with mock.patch(
+            "apps.movies.api.filters.title_index_available", return_value=False
+        ):
+            self.assertEqual(self.search("ula"), ["The Formula"])
+
+
+class AwardsIntervalEngineTest(TestCase):
+    """
+    TestCase for the single-pass awards interval engine.
+    """
+
+    def setUp(self):
+        """
+        Set up producers with tied shortest and longest intervals.
+        """
+        wins = {
+            "Producer A": [1990, 1991, 2000],
+            "Producer B": [1995, 1996],
+            "Producer C": [1980, 1989, 1990],
+            "Producer D": [2001],
+        }
+        for name, years in wins.items():
+            producer = Producer.objects.create(name=name)
+            for year in years:
+                movie = Movie.objects.create(year=year, title=f"{name} {year}")
+                movie.producer.add(producer)
+        Movie.objects.update(winner=True)
+        Movie.objects.create(year=1992, title="Nominee").producer.add(
+            Producer.objects.get(name="Producer A")
+        )
+
+    def test_matches_window_function(self):
+        """
+        Test that the single-pass engine returns the window function result.
+        """
+        expected = intervals.producer_intervals_sql()
+        self.assertEqual(intervals.producer_intervals(), expected)
+
+        with mock.patch.object(intervals, "numpy", None):
+            data = intervals.producer_intervals()
+        self.assertEqual(data, expected)
+        self.assertEqual(
+            [(item["name"], item["interval"]) for item in data["min"]],
+            [("Producer A", 1), ("Producer B", 1), ("Producer C", 1)],
+        )
+        self.assertEqual(
+            [(item["name"], item["interval"]) for item in data["max"]],
+            [("Producer A", 9), ("Producer C", 9)],
+        )
+
+    def test_without_intervals(self):
+        """
+        Test that no consecutive wins produce empty lists.
+        """
+        Movie.objects.filter(year__gt=1980).update(winner=False)
+        self.assertEqual(intervals.producer_intervals(), {"min": [], "max": []})
+
+    def win_intervals(self, data):
+        return {
+            key: [
+                (item["name"], item["award_last_year"], item["award_year"])
+                for item in data[key]
+            ]
+            for key in ("min", "max")
+        }
+
+    def test_win_index(self):
+        """
+        Test year windows and top-k lengths of the producer win index.
+        """
+        index = intervals.WinIndex(intervals.entity_winning_years("producer"))
+        self.assertEqual(index.extremes(), intervals.producer_intervals())
+        self.assertEqual(
+            self.win_intervals(index.extremes(k=2))["min"],
+            [
+                ("Producer A", 1990, 1991),
+                ("Producer B", 1995, 1996),
+                ("Producer C", 1989, 1990),
+                ("Producer A", 1991, 2000),
+                ("Producer C", 1980, 1989),
+            ],
+        )
+        self.assertEqual(
+            self.win_intervals(index.extremes(year_from=1990)),
+            {
+                "min": [("Producer A", 1990, 1991), ("Producer B", 1995, 1996)],
+                "max": [("Producer A", 1991, 2000)],
+            },
+        )
+        self.assertEqual(
+            self.win_intervals(index.extremes(year_to=1995))["max"],
+            [("Producer C", 1980, 1989)],
+        )
+        self.assertEqual(index.extremes(year_from=2001), {"min": [], "max": []})
+
+    def test_awards_intervals_endpoint(self):
+        """
+        Test the awards intervals endpoint for studios, with both serializers.
+        """
+        studio = Studio.objects.create(name="Studio X")
+        for movie in Movie.objects.filter(
+            Q(producer__name="Producer A", winner=True) | Q(year=1980)
+        ):
+            movie.studio.add(studio)
+
+        url = reverse("movie-awards-intervals")
+        responses = []
+        for fast in (False, True):
+            with self.settings(MOVIES_FAST_SERIALIZATION=fast):
+                responses.append(self.client.get(url, {"entity": "studio", "k": 2}))
+        self.assertEqual(responses[0].content, responses[1].content)
+        self.assertEqual(
+            responses[0].json(),
+            {
+                "min": [
+                    {
+                        "name": "Studio X",
+                        "interval": 1,
+                        "previousWin": 1990,
+                        "followingWin": 1991,
+                    },
+                    {
+                        "name": "Studio X",
+                        "interval": 9,
+                        "previousWin": 1991,
+                        "followingWin": 2000,
+                    },
+                ],
+                "max": [
+                    {
+                        "name": "Studio X",
+                        "interval": 10,
+                        "previousWin": 1980,
+                        "followingWin": 1990,
+                    },
+                    {
+                        "name": "Studio X",
+                        "interval": 9,
+                        "previousWin": 1991,
+                        "followingWin": 2000,
+                    },
+                ],
+            },
+        )
+
+        for params in ({"entity": "movie"}, {"k": 0}, {"year_from": "x"}):
+            self.assertEqual(self.client.get(url, params).status_code, 400)
+
+    def test_win_index_built_once_per_version(self):
+        """
+        Test that the index is kept in process memory and only rebuilt when the
+        data version changes.
+        """
+        intervals.win_indexes.clear()
+        get_cache().clear()
+        url = reverse("movie-awards-intervals")
+        with mock.patch.object(
+            intervals, "WinIndex", wraps=intervals.WinIndex
+        ) as build:
+            for k in (1, 2, 3):
+                self.assertEqual(self.client.get(url, {"k": k}).status_code, 200)
+            self.assertEqual(build.call_count, 1)
+
+            Movie.objects.create(year=2010, title="New movie")
+            self.client.get(url, {"k": 1})
+            self.assertEqual(build.call_count, 2)
+
+        # Only the responses reach the (pickling) Django cache.
+        cached = list(get_cache()._cache.values())
+        self.assertTrue(cached)
+        self.assertFalse(any(b"WinIndex" in value for value in cached))
+
+
+class ProducerWinIntervalTest(TestCase):
+    """
+    TestCase for the incrementally maintained ProducerWinInterval table.
+
+    Every write below must leave the table equal to a full recomputation.
+    """
+
+    def setUp(self):
+        """
+        Set up two producers sharing some winning movies.
+        """
+        self.producer1 = Producer.objects.create(name="Producer A")
+        self.producer2 = Producer.objects.create(name="Producer B")
+        self.movies = []
+        for year in (1990, 1995, 2003, 2004):
+            movie = Movie.objects.create(year=year, title=f"Movie {year}", winner=True)
+            movie.producer.add(self.producer1)
+            self.movies.append(movie)
+        self.movies[1].producer.add(self.producer2)
+        self.movies[3].producer.add(self.producer2)
+
+    def assertIntervalsInSync(self):
+        stored = list(
+            ProducerWinInterval.objects.values_list(
+                "producer_id", "previous_win", "following_win", "interval"
+            )
+        )
+        expected = [
+            (producer_id, previous_win, following_win, following_win - previous_win)
+            for producer_id, previous_win, following_win in (
+                intervals.consecutive_intervals(intervals.winning_years())
+            )
+        ]
+        self.assertEqual(stored, expected)
+        self.assertEqual(
+            intervals.stored_producer_intervals(), intervals.producer_intervals()
+        )
+
+    def test_intervals_after_m2m_changes(self):
+        """
+        Test that adding, removing and clearing producers refreshes intervals.
+        """
+        self.assertEqual(ProducerWinInterval.objects.count(), 4)
+        self.assertIntervalsInSync()
+
+        self.movies[2].producer.remove(self.producer1)
+        self.assertIntervalsInSync()
+
+        self.producer2.movies.add(self.movies[0])
+        self.assertIntervalsInSync()
+
+        self.movies[3].producer.clear()
+        self.assertIntervalsInSync()
+
+        self.producer1.movies.clear()
+        self.assertIntervalsInSync()
+
+    def test_intervals_after_movie_changes(self):
+        """
+        Test that saving and deleting movies refreshes intervals.
+        """
+        self.movies[1].winner = False
+        self.movies[1].save()
+        self.assertIntervalsInSync()
+
+        self.movies[0].year = 2010
+        self.movies[0].save()
+        self.assertIntervalsInSync()
+
+        self.movies[3].delete()
+        self.assertIntervalsInSync()
+
+        self.producer2.delete()
+        self.assertIntervalsInSync()
+
+    def test_rebuild_command(self):
+        """
+        Test that the rebuild command restores intervals after bulk updates.
+        """
+        Movie.objects.filter(year=1995).update(winner=False)
+        version = DataVersion.current().token
+        call_command("rebuild_win_intervals", stdout=mock.Mock())
+        self.assertIntervalsInSync()
+        self.assertNotEqual(DataVersion.current().token, version)
+
+
+class RollupTest(APITestCase):
+    """
+    TestCase for the incrementally maintained rollup tables and the aggregates
+    endpoint.
+
+    Every write below must leave the tables equal to a full recomputation.
+    """
+
+    def setUp(self):
+        """
+        Set up movies sharing producers and studios across two years.
+        """
+        self.producer1 = Producer.objects.create(name="Producer A")
+        self.producer2 = Producer.objects.create(name="Producer B")
+        self.studio = Studio.objects.create(name="Studio A")
+        self.movies = []
+        for i, year in enumerate((1990, 1990, 1995, 1995)):
+            movie = Movie.objects.create(
+                year=year, title=f"Movie {i}", winner=i % 2 == 0
+            )
+            movie.producer.add(self.producer1)
+            movie.studio.add(self.studio)
+            self.movies.append(movie)
+        self.movies[2].producer.add(self.producer2)
+
+    def assertRollupsInSync(self):
+        self.assertEqual(
+            list(YearRollup.objects.values("year", "nominations", "wins")),
+            sorted(rollups.year_counts(), key=lambda row: row["year"]),
+        )
+        for entity, model in (("producer", ProducerRollup), ("studio", StudioRollup)):
+            self.assertEqual(
+                sorted(
+                    model.objects.values(f"{entity}_id", "nominations", "wins"), key=str
+                ),
+                sorted(rollups.entity_counts(entity), key=str),
+            )
+
+    def test_rollups_after_m2m_changes(self):
+        """
+        Test that adding, removing and clearing producers and studios refreshes the
+        rollups.
+        """
+        self.assertEqual(
+            list(
+                ProducerRollup.objects.values_list("producer_id", "nominations", "wins")
+            ),
+            [(self.producer1.pk, 4, 2), (self.producer2.pk, 1, 1)],
+        )
+        self.assertRollupsInSync()
+
+        self.movies[0].producer.remove(self.producer1)
+        self.assertRollupsInSync()
+
+        self.producer2.movies.add(self.movies[1])
+        self.assertRollupsInSync()
+
+        self.movies[2].producer.clear()
+        self.assertRollupsInSync()
+
+        self.studio.movies.clear()
+        self.assertRollupsInSync()
+        self.assertFalse(StudioRollup.objects.exists())
+
+    def test_rollups_after_movie_changes(self):
+        """
+        Test that saving and deleting movies refreshes the rollups.
+        """
+        self.movies[1].winner = True
+        self.movies[1].save()
+        self.assertRollupsInSync()
+
+        self.movies[0].year = 2000
+        self.movies[0].save()
+        self.assertRollupsInSync()
+        self.assertEqual(
+            list(YearRollup.objects.values_list("year", flat=True)), [1990, 1995, 2000]
+        )
+
+        self.movies[2].delete()
+        self.assertRollupsInSync()
+
+        self.producer2.delete()
+        self.assertRollupsInSync()
+
+        Movie.objects.create(year=2010, title="New movie")
+        self.assertRollupsInSync()
+
+    def test_rebuild_command_and_import(self):
+        """
+        Test that the rebuild command and bulk imports restore the rollups.
+        """
+        Movie.objects.filter(year=1995).update(winner=False)
+        version = DataVersion.current().token
+        call_command("rebuild_rollups", stdout=mock.Mock())
+        self.assertRollupsInSync()
+        self.assertNotEqual(DataVersion.current().token, version)
+
+        import_rows(generate_rows(SyntheticSpec(movies=200)))
+        self.assertRollupsInSync()
+
+    def test_delta_import(self):
+        """
+        Test that a delta import refreshes only the rollup rows it touched.
+        """
+        handle, csv_path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, csv_path)
+        with os.fdopen(handle, "w", encoding="utf-8") as csv_file:
+            csv_file.write(
+                "year;title;studios;producers;winner\n"
+                "1990;Movie 0;Studio A;Producer A;\n"
+                "1995;Movie 2;Studio A;Producer A and Producer B;yes\n"
+                "2001;Movie 4;Studio B;Producer C;yes\n"
+            )
+
+        with mock.patch("apps.movies.services.importer.rebuild_rollups") as rebuild:
+            result = sync_csv(csv_path)
+        rebuild.assert_not_called()
+        self.assertEqual(result.years, {1990, 1995, 2001})
+        self.assertRollupsInSync()
+
+    def test_aggregates_endpoint(self):
+        """
+        Test the facets, their parameters and the fast serialization path.
+        """
+        url = reverse("movie-aggregates")
+        response = self.client.get(url, {"year_from": 1991, "limit": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "years": [{"year": 1995, "nominations": 2, "wins": 1}],
+                "producers": [
+                    {
+                        "id": self.producer1.pk,
+                        "name": "Producer A",
+                        "nominations": 4,
+                        "wins": 2,
+                    }
+                ],
+                "studios": [
+                    {
+                        "id": self.studio.pk,
+                        "name": "Studio A",
+                        "nominations": 4,
+                        "wins": 2,
+                    }
+                ],
+            },
+        )
+
+        with self.settings(MOVIES_FAST_SERIALIZATION=False):
+            slow = self.client.get(url, {"limit": 5})
+        with self.settings(MOVIES_FAST_SERIALIZATION=True):
+            fast = self.client.get(url, {"limit": 5})
+        self.assertEqual(slow.json(), fast.json())
+        self.assertEqual(len(fast.json()["producers"]), 2)
+
+        response = self.client.get(url, {"limit": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("limit", response.json())
+
+
+class MovieLookupsTest(APITestCase):
+    """
+    TestCase for the denormalized Movie.lookups and the reads that use them.
+
+    Every write below must leave the column equal to a recomputation from the
+    relations.
+    """
+
+    def setUp(self):
+        """
+        Set up two movies sharing a producer and a studio.
+        """
+        self.producer1 = Producer.objects.create(name="Producer A")
+        self.producer2 = Producer.objects.create(name="Producer B")
+        self.studio = Studio.objects.create(name="Studio A")
+        self.movie1 = Movie.objects.create(year=1990, title="Movie 1", winner=True)
+        self.movie2 = Movie.objects.create(year=1991, title="Movie 2")
+        self.movie1.producer.add(self.producer2, self.producer1)
+        self.movie1.studio.add(self.studio)
+        self.movie2.producer.add(self.producer1)
+
+    def assertLookupsInSync(self):
+        self.assertEqual(lookups.check_lookups(Movie.objects.all()), ([], []))
+
+    def test_lookups_after_writes(self):
+        """
+        Test that relation changes, renames and deletes refresh the lookups.
+        """
+        self.movie1.refresh_from_db()
+        self.assertEqual(
+            self.movie1.lookups,
+            {
+                "studios": [{"id": self.studio.pk, "name": "Studio A"}],
+                "producers": [
+                    {"id": self.producer1.pk, "name": "Producer A"},
+                    {"id": self.producer2.pk, "name": "Producer B"},
+                ],
+            },
+        )
+        self.assertLookupsInSync()
+
+        self.studio.movies.add(self.movie2)
+        self.assertLookupsInSync()
+
+        self.producer1.name = "Producer C"
+        self.producer1.save()
+        self.assertLookupsInSync()
+
+        self.movie1.producer.remove(self.producer2)
+        self.producer1.movies.clear()
+        self.assertLookupsInSync()
+
+        # An instance loaded before its relations changed saves outdated lookups.
+        stale = Movie.objects.get(pk=self.movie2.pk)
+        self.movie2.studio.clear()
+        stale.winner = True
+        stale.save()
+        self.assertLookupsInSync()
+
+        self.studio.delete()
+        self.assertLookupsInSync()
+
+    def test_bulk_import_fills_lookups(self):
+        """
+        Test that the bulk ingestor writes the lookups with the movies.
+        """
+        import_rows(generate_rows(SyntheticSpec(movies=200)))
+        self.assertFalse(Movie.objects.filter(lookups__isnull=True).exists())
+        self.assertLookupsInSync()
+
+    def test_check_command(self):
+        """
+        Test that the check command fails on outdated lookups and --fix repairs
+        them.
+        """
+        call_command("check_movie_lookups", stdout=mock.Mock())
+
+        Movie.objects.filter(pk=self.movie1.pk).update(
+            lookups={"studios": [], "producers": []}
+        )
+        Movie.objects.filter(pk=self.movie2.pk).update(lookups=None)
+        with self.assertRaisesMessage(CommandError, "1 filmes"):
+            call_command("check_movie_lookups", stdout=mock.Mock())
+
+        version = DataVersion.current().token
+        call_command("check_movie_lookups", "--fix", stdout=mock.Mock())
+        self.assertLookupsInSync()
+        self.assertNotEqual(DataVersion.current().token, version)
+
+    def test_reads_without_joins(self):
+        """
+        Test that list and detail return the same responses without relation
+        queries, and fall back to them for movies without lookups.
+        """
+        Movie.objects.filter(pk=self.movie2.pk).update(lookups=None)
+        urls = [
+            reverse("movie-list"),
+            reverse("movie-async-list"),
+            reverse("movie-detail", args=[self.movie1.pk]),
+            reverse("movie-async-detail", args=[self.movie2.pk]),
+        ]
+        for url in urls:
+            with self.settings(MOVIES_DENORMALIZED_LOOKUPS=False):
+                expected = self.client.get(url).content
+            with self.settings(MOVIES_DENORMALIZED_LOOKUPS=True):
+                self.assertEqual(self.client.get(url).content, expected)
+
+        lookups.fill_lookups(Movie.objects.all())
+        url = reverse("movie-detail", args=[self.movie1.pk])
+        with self.settings(MOVIES_DENORMALIZED_LOOKUPS=True):
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(url)
+        tables = " ".join(query["sql"] for query in context.captured_queries)
+        self.assertNotIn("movies_movie_producer", tables)
+        self.assertNotIn("movies_movie_studio", tables)
+
+
+class FastSerializationTest(APITestCase):
+    """
+    APITestCase asserting the fast serialization path returns the same bytes as
+    the DRF serializers.
+    """
+
+    def setUp(self):
+        """
+        Set up movies with unicode titles and several producers and studios.
+        """
+        producers = [Producer.objects.create(name=f"Producer {i}") for i in range(4)]
+        studios = [Studio.objects.create(name=f"Estúdio {i}") for i in range(3)]
+        for i in range(23):
+            movie = Movie.objects.create(
+                year=1990 + i % 7, title=f"Filme nº {i}\u2028", winner=i % 4 == 0
+            )
+            movie.producer.add(producers[i % 4], producers[(i + 1) % 4])
+            movie.studio.add(studios[i % 3])
+        Movie.objects.create(year=2001, title="No relations")
+
+    def assertSameResponse(self, url):
+        responses = []
+        for enabled in (False, True):
+            get_cache().clear()
+            with self.settings(MOVIES_FAST_SERIALIZATION=enabled):
+                responses.append(self.client.get(url))
+        drf, fast = responses
+        self.assertEqual(fast.status_code, drf.status_code)
+        self.assertEqual(fast.content, drf.content)
+        return fast
+
+    def test_list_is_identical(self):
+        """
+        Test list pages, filters, search and keyset pagination.
+        """
+        url = reverse("movie-list")
+        for query in (
+            "",
+            "?page=2",
+            "?page=3",
+            "?winner=true&year_from=1992",
+            "?search=Filme",
+            "?pagination=cursor",
+            "?page=99",
+        ):
+            self.assertSameResponse(url + query)
+
+        response = self.assertSameResponse(url + "?pagination=cursor")
+        self.assertSameResponse(response.data["next"])
+
+    def test_detail_is_identical(self):
+        """
+        Test movie details, including a missing movie.
+        """
+        for movie in Movie.objects.all():
+            self.assertSameResponse(reverse("movie-detail", args=[movie.pk]))
+        self.assertSameResponse(reverse("movie-detail", args=[9999]))
+
+    def test_awards_interval_is_identical(self):
+        """
+        Test the awards interval endpoint.
+        """
+        intervals.rebuild_producer_intervals()
+        response = self.assertSameResponse(reverse("movie-awards-interval-by-producer"))
+        self.assertTrue(response.data["min"])
+
+    def test_renderer_escapes_line_separators(self):
+        """
+        Test the orjson renderer escapes U+2028 as JSONRenderer does.
+        """
+        with self.settings(MOVIES_FAST_SERIALIZATION=True):
+            response = self.client.get(reverse("movie-list"))
+        self.assertIn(b"\\u2028", response.content)
+        self.assertIn("Estúdio".encode(), response.content)
+
+    def test_query_budget(self):
+        """
+        Test the fast path keeps one query per relation.
+        """
+        with self.settings(MOVIES_FAST_SERIALIZATION=True):
+            with self.assertNumQueries(5):
+                self.client.get(reverse("movie-list"))
+            with self.assertNumQueries(4):
+                self.client.get(reverse("movie-detail", args=[1]))
+
+
+class ConditionalGetTest(APITestCase):
+    """
+    APITestCase for the ETag and Last-Modified headers of the read endpoints.
+    """
+
+    URL_NAMES = ["movie-list", "movie-awards-interval-by-producer"]
+
+    def setUp(self):
+        """
+        Set up two winning movies of the same producer.
+        """
+        producer = Producer.objects.create(name="Producer")
+        for year in (1990, 1995):
+            movie = Movie.objects.create(year=year, title=f"Movie {year}", winner=True)
+            movie.producer.add(producer)
+        self.urls = [reverse(name) for name in self.URL_NAMES] + [
+            reverse("movie-detail", args=[movie.pk])
+        ]
+
+    def test_if_none_match(self):
+        """
+        Test that a matching ETag returns 304 after a single query.
+        """
+        for url in self.urls:
+            response = self.client.get(url)
+            etag = response["ETag"]
+            self.assertFalse(etag.startswith("W/"))
+            self.assertIn("Last-Modified", response)
+
+            with self.assertNumQueries(1):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response["ETag"], etag)
+            self.assertEqual(response.content, b"")
+
+    def test_if_modified_since(self):
+        """
+        Test that an up to date Last-Modified returns 304.
+        """
+        for url in self.urls:
+            last_modified = self.client.get(url)["Last-Modified"]
+            with self.assertNumQueries(1):
+                response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_data_and_url(self):
+        """
+        Test that writes and different query strings change the ETag.
+        """
+        url = reverse("movie-list")
+        etag = self.client.get(url)["ETag"]
+        self.assertNotEqual(self.client.get(url + "?year=1990")["ETag"], etag)
+
+        Movie.objects.create(year=2000, title="New movie")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["count"], 3)
+
+    def test_browsable_api_has_no_etag(self):
+        """
+        Test that HTML responses, which vary per request, get no strong ETag.
+        """
+        response = self.client.get(reverse("movie-list"), HTTP_ACCEPT="text/html")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+
+class AsyncMovieViewsTest(APITestCase):
+    """
+    APITestCase for the native async read endpoints.
+
+    They must return the same documents as the MovieViewSet endpoints, within the
+    same query budgets.
+    """
+
+    URLS = [
+        ("movie-list", ""),
+        ("movie-list", "?page=2"),
+        ("movie-list", "?page=last"),
+        ("movie-list", "?page=9"),
+        ("movie-list", "?winner=true&year_from=1985"),
+        ("movie-list", "?search=Movie 1"),
+        ("movie-list", "?pagination=cursor&year_to=1990"),
+        ("movie-list", "?year=abc"),
+        ("movie-awards-interval-by-producer", ""),
+    ]
+
+    def setUp(self):
+        """
+        Set up 25 movies with two producers and one studio each.
+        """
+        producers = [Producer.objects.create(name=f"Producer {i}") for i in range(5)]
+        studio = Studio.objects.create(name="Studio")
+        for i in range(25):
+            movie = Movie.objects.create(
+                year=1980 + i % 12, title=f"Movie {i}", winner=i % 3 == 0
+            )
+            movie.producer.add(producers[i % 5], producers[(i + 1) % 5])
+            movie.studio.add(studio)
+
+    def get_async(self, url, **headers):
+        return async_to_sync(self.async_client.get)(url, headers=headers)
+
+    def async_url(self, name, *args):
+        return reverse(name.replace("movie-", "movie-async-"), args=args)
+
+    def test_same_responses(self):
+        """
+        Test list, detail and awards interval against their sync counterparts.
+        """
+        urls = [(reverse(name), self.async_url(name), q) for name, q in self.URLS]
+        for pk in (1, 25, 999):
+            urls.append(
+                (
+                    reverse("movie-detail", args=[pk]),
+                    self.async_url("movie-detail", pk),
+                    "",
+                )
+            )
+        for sync_url, async_url, query in urls:
+            get_cache().clear()
+            expected = self.client.get(sync_url + query)
+            get_cache().clear()
+            response = self.get_async(async_url + query)
+            self.assertEqual(response.status_code, expected.status_code)
+            self.assertEqual(
+                response.content,
+                expected.content.replace(sync_url.encode(), async_url.encode()),
+            )
+
+    def test_query_budgets(self):
+        """
+        Test the async endpoints run as many queries as the sync ones.
+        """
+        budgets = QueryBudgetTest.QUERY_BUDGETS
+        for name, args in (
+            ("movie-list", []),
+            ("movie-detail", [1]),
+            ("movie-awards-interval-by-producer", []),
+        ):
+            with CaptureQueriesContext(connection) as context:
+                response = self.get_async(self.async_url(name, *args))
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(context), budgets[name])
+
+    def test_conditional_get(self):
+        """
+        Test ETag revalidation and the methods allowed.
+        """
+        url = self.async_url("movie-list")
+        etag = self.get_async(url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.get_async(url, if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = async_to_sync(self.async_client.post)(url)
+        self.assertEqual(response.status_code, 405)
+
+
+class SnapshotServingTest(APITestCase):
+    """
+    APITestCase for serving the read endpoints from the in-memory snapshot.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a generated dataset, with a producer name shared by two producers
+          of the same movie.
+        """
+        import_rows(generate_rows(SyntheticSpec(movies=400, winner_ratio=0.3)))
+        cls.movie = Movie.objects.order_by("id")[10]
+        cls.producer = cls.movie.producer.first()
+        cls.studio = cls.movie.studio.first()
+        cls.movie.producer.add(Producer.objects.create(name=cls.producer.name))
+
+    def setUp(self):
+        snapshots.clear()
+        self.addCleanup(snapshots.clear)
+        # Loads inline, within the test transaction.
+        patcher = mock.patch.object(
+            snapshots, "refresh_in_background", side_effect=snapshots.refresh
+        )
+        self.refresh = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, url, snapshot):
+        get_cache().clear()
+        with self.settings(MOVIES_SNAPSHOT_SERVING=snapshot):
+            if "/async/" in url:
+                return async_to_sync(self.async_client.get)(url)
+            return self.client.get(url)
+
+    def assertSameResponse(self, url):
+        database = self.get(url, snapshot=False)
+        self.get(url, snapshot=True)
+        snapshot = self.get(url, snapshot=True)
+        self.assertEqual(snapshot.status_code, database.status_code, url)
+        self.assertEqual(snapshot.content, database.content, url)
+        return snapshot
+
+    def test_responses_are_identical(self):
+        """
+        Test list filters, search, both paginations, details and awards intervals.
+        """
+        cursor = MovieKeysetPagination().encode_cursor(2000, self.movie.id)
+        queries = [
+            "",
+            "?page=3",
+            "?page=last",
+            "?page=999",
+            "?winner=true&year_from=1995",
+            "?winner=false&year_to=2001.9",
+            "?year=2003",
+            "?year=abc",
+            f"?producer={self.producer.id}",
+            f"?producer_name={self.producer.name}",
+            f"?producer_name={self.producer.name}&studio_name={self.studio.name}",
+            f"?studio={self.studio.id}&winner=true",
+            "?search=frozen",
+            "?search=frozen shadow&page=2",
+            "?search=frozen&pagination=cursor",
+            f"?cursor={cursor}",
+            f"?cursor={cursor}&year_to=2010",
+            "?cursor=invalid",
+        ]
+        for name in ("movie-list", "movie-async-list"):
+            for query in queries:
+                self.assertSameResponse(reverse(name) + query)
+        response = self.assertSameResponse(
+            reverse("movie-list") + f"?producer_name={self.producer.name}"
+        )
+        ids = [movie["id"] for movie in response.data["results"]]
+        self.assertEqual(ids.count(self.movie.id), 2)
+
+        for name in ("movie-detail", "movie-async-detail"):
+            for pk, query in [
+                (self.movie.id, ""),
+                (self.movie.id, "?winner=true"),
+                (self.movie.id, "?search=frozen"),
+                (9999, ""),
+            ]:
+                self.assertSameResponse(reverse(name, args=[pk]) + query)
+        for name in (
+            "movie-awards-interval-by-producer",
+            "movie-async-awards-interval-by-producer",
+        ):
+            response = self.assertSameResponse(reverse(name))
+            self.assertTrue(json.loads(response.content)["max"])
+
+    def test_answers_from_memory(self):
+        """
+        Test that a loaded snapshot only reads the data version.
+        """
+        url = reverse("movie-list")
+        self.get(url, snapshot=True)
+        with self.assertNumQueries(1):
+            self.get(url + "?winner=true", snapshot=True)
+        with self.assertNumQueries(1):
+            self.get(reverse("movie-detail", args=[self.movie.id]), snapshot=True)
+
+    def test_swapped_on_data_change(self):
+        """
+        Test that a write moves requests to the database until the new snapshot
+          is loaded.
+        """
+        url = reverse("movie-detail", args=[self.movie.id])
+        self.get(url, snapshot=True)
+        self.assertEqual(self.refresh.call_count, 1)
+        old = snapshots.get(DataVersion.current())
+
+        self.movie.title = "Renamed"
+        self.movie.save()
+        response = self.get(url, snapshot=True)
+        self.assertEqual(response.data["title"], "Renamed")
+        self.assertEqual(self.refresh.call_count, 2)
+
+        response = self.get(url, snapshot=True)
+        self.assertEqual(response.data["title"], "Renamed")
+        self.assertEqual(self.refresh.call_count, 2)
+        self.assertIsNot(snapshots.get(DataVersion.current()), old)
+
+
+class SnapshotLoadTest(TransactionTestCase):
+    """
+    TransactionTestCase for the read transaction of Snapshot.load, outside of the
+    transaction every TestCase runs in.
+    """
+
+    def test_load_in_deferred_transaction(self):
+        """
+        Test that the snapshot is read in a plain BEGIN, not in an atomic block,
+          which the production profile begins with IMMEDIATE, taking the write lock.
+        """
+        DataVersion.current()
+        movie = Movie.objects.create(year=2000, title="Movie")
+
+        with mock.patch.object(
+            connection,
+            "_start_transaction_under_autocommit",
+            side_effect=AssertionError("atomic() used"),
+        ), CaptureQueriesContext(connection) as context:
+            snapshot = Snapshot.load()
+
+        self.assertEqual(snapshot.get(movie.pk).title, "Movie")
+        self.assertEqual(context.captured_queries[0]["sql"], "BEGIN")
+        self.assertEqual(context.captured_queries[-1]["sql"], "COMMIT")
+        self.assertFalse(connection.connection.in_transaction)
+
+
+class ServerTimingTest(APITestCase):
+    """
+    APITestCase for the Server-Timing instrumentation.
+    """
+
+    def setUp(self):
+        """
+        Set up a few movies and restore the timing switch after each test.
+        """
+        producer = Producer.objects.create(name="Producer")
+        for i in range(3):
+            Movie.objects.create(year=2000 + i, title=f"Movie {i}").producer.add(
+                producer
+            )
+        self.addCleanup(timing.switch.reset)
+
+    def get_timings(self, response) -> dict:
+        metrics = {}
+        for metric in response["Server-Timing"].split(", "):
+            name, *params = metric.split(";")
+            metrics[name] = dict(param.split("=", 1) for param in params)
+        return metrics
+
+    def test_disabled(self):
+        """
+        Test that requests are not measured while the switch is off.
+        """
+        timing.switch.set(False)
+        response = self.client.get(reverse("movie-list"))
+        self.assertNotIn("Server-Timing", response)
+
+    def test_header_and_log(self):
+        """
+        Test the header and log line of a measured request.
+        """
+        timing.switch.set(True)
+        with self.assertLogs("apps.movies.timing", "INFO") as logs:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(reverse("movie-list"))
+
+        metrics = self.get_timings(response)
+        self.assertEqual(set(metrics), {"db", "serialize", "render", "total"})
+        self.assertEqual(metrics["db"]["desc"], f'"{len(context)} queries"')
+        self.assertGreater(float(metrics["serialize"]["dur"]), 0)
+        self.assertGreater(float(metrics["render"]["dur"]), 0)
+
+        record = logs.records[0].timings
+        self.assertEqual(record["queries"], len(context))
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(json.loads(logs.records[0].getMessage()), record)
+
+    def test_async_view_queries(self):
+        """
+        Test that queries run by async views in worker threads are counted.
+        """
+        timing.switch.set(True)
+        with self.assertLogs("apps.movies.timing", "INFO"):
+            response = async_to_sync(self.async_client.get)(reverse("movie-async-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_timings(response)["db"]["desc"], '"5 queries"')
+
+    def test_command_needs_shared_cache(self):
+        """
+        Test that the command refuses to switch through a process-local cache and
+          works with a shared one.
+        """
+        with self.assertRaisesMessage(CommandError, "local a cada processo"):
+            call_command("server_timing", "on", stdout=mock.Mock())
+        call_command("server_timing", "status", stdout=mock.Mock())
+
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        backend = "django.core.cache.backends.filebased.FileBasedCache"
+        with override_settings(
+            CACHES={"default": {"BACKEND": backend, "LOCATION": location}}
+        ):
+            call_command("server_timing", "on", stdout=mock.Mock())
+            self.assertTrue(timing.switch.is_enabled())
+            timing.switch.reset()
+
+
+class QueryPlanRegressionTest(TestCase):
+    """
+    TestCase comparing the query plans of every endpoint with golden plans.
+
+    Runs on a generated dataset, analyzed so the planner sees its statistics. A
+    table read through an index in the golden plan must not become a scan. After
+    an intended change, regenerate the golden file with
+    `MOVIES_UPDATE_QUERY_PLANS=1 python manage.py test`.
+    """
+
+    GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "query_plans.json")
+
+    CASES = [
+        ("api-root", [], ""),
+        ("movie-list", [], ""),
+        ("movie-list", [], "?page=500"),
+        ("movie-list", [], "?pagination=cursor"),
+        ("movie-list", [], "?cursor=MjAwMDoxMDAwMA=="),
+        ("movie-list", [], "?winner=true"),
+        ("movie-list", [], "?winner=false&year_from=2000"),
+        ("movie-list", [], "?year_from=1990&year_to=1995"),
+        ("movie-list", [], "?producer=1"),
+        ("movie-list", [], "?producer_name=Alan Abbott"),
+        ("movie-list", [], "?studio=1"),
+        ("movie-list", [], "?studio_name=Paramount Pictures"),
+        ("movie-list", [], "?search=frozen shadow"),
+        ("movie-detail", [1000], ""),
+        ("movie-awards-interval-by-producer", [], ""),
+        ("movie-awards-intervals", [], "?entity=studio&year_from=1990&k=3"),
+        ("movie-aggregates", [], "?year_from=1990&limit=10"),
+        ("movie-batch", [], "?ids=10,20,30,40,50"),
+        ("movie-export", [], "?year=2000"),
+        ("movie-async-list", [], "?winner=true"),
+        ("movie-async-detail", [1000], ""),
+        ("movie-async-awards-interval-by-producer", [], ""),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Generate 20,000 movies and analyze them.
+        """
+        import_rows(generate_rows(SyntheticSpec(movies=20_000)))
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def get(self, url):
+        if "-async-" in url:
+            response = async_to_sync(self.async_client.get)(url)
+        else:
+            response = self.client.get(url)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200, url)
+
+    def test_plans_match_golden(self):
+        """
+        Test that no endpoint query lost an index since the golden plans.
+        """
+        plans = {}
+        for name, args, query in self.CASES:
+            url = reverse(name, args=args) + query
+            get_cache().clear()
+            plans[f"{name}{query}"] = query_plans.capture_plans(lambda: self.get(url))
+
+        if os.environ.get("MOVIES_UPDATE_QUERY_PLANS") == "1":
+            query_plans.write_golden(self.GOLDEN_PATH, plans)
+            return
+
+        golden = query_plans.load_golden(self.GOLDEN_PATH)
+        failures = []
+        for case, current in plans.items():
+            if case not in golden:
+                failures.append(f"{case}: no golden plans")
+                continue
+            failures.extend(
+                f"{case}: {message}"
+                for message in query_plans.compare_plans(golden[case], current)
+            )
+        self.assertEqual(failures, [], "\n".join(failures))
+
+    def test_every_endpoint_has_case(self):
+        """
+        Test that every endpoint is covered by a query plan case.
+        """
+        names = {url.name for url in router.urls} | {
+            url.name for url in async_urlpatterns
+        }
+        self.assertEqual(names - {name for name, args, query in self.CASES}, set())
+
+
+class QueryPlanComparisonTest(SimpleTestCase):
+    """
+    SimpleTestCase for the query plan comparison rules.
+    """
+
+    SQL = (
+        'SELECT * FROM "movies_movie" WHERE "movies_movie"."id" IN '
+        '(SELECT U0."movie_id" FROM "movies_movie_producer" U0)'
+    )
+
+    def compare(self, golden, current):
+        return query_plans.regressions(
+            {"sql": self.SQL, "plan": golden}, {"sql": self.SQL, "plan": current}
+        )
+
+    def test_scan_regressions(self):
+        """
+        Test that losing an index is reported, through aliases too.
+        """
+        search = "SEARCH movies_movie USING INTEGER PRIMARY KEY (rowid=?)"
+        self.assertEqual(self.compare([search], [search]), [])
+        self.assertTrue(self.compare([search], ["SCAN movies_movie"]))
+        self.assertTrue(
+            self.compare(
+                [search, "SCAN U0 USING COVERING INDEX movies_idx"],
+                [search, "SCAN U0"],
+            )
+        )
+
+    def test_improvements_and_other_tables(self):
+        """
+        Test that gaining an index or scanning unwatched tables is accepted.
+        """
+        self.assertEqual(
+            self.compare(["SCAN movies_movie"], ["SEARCH movies_movie USING INDEX i"]),
+            [],
+        )
+        self.assertEqual(
+            self.compare([], ["SCAN movies_movie_fts VIRTUAL TABLE INDEX 0:M1"]), []
+        )
+
+
+class AwardsIntervalCacheTest(APITestCase):
+    """
+    APITestCase for the versioned cache of the awards interval endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a producer with two winning movies.
+        """
+        self.url = reverse("movie-awards-interval-by-producer")
+        self.producer = Producer.objects.create(name="Producer A")
+        for year in (2000, 2004):
+            movie = Movie.objects.create(year=year, title=f"Movie {year}", winner=True)
+            movie.producer.add(self.producer)
+
+    def test_cached_until_data_changes(self):
+        """
+        Test that hits skip the computation and writes invalidate the entry.
+        """
+        self.assertEqual(self.client.get(self.url).data["min"][0]["interval"], 4)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        generation = DataVersion.current().generation
+        movie = Movie.objects.create(year=2001, title="Movie 2001", winner=True)
+        movie.producer.add(self.producer)
+        self.assertGreater(DataVersion.current().generation, generation)
+        self.assertEqual(self.client.get(self.url).data["min"][0]["interval"], 1)
+
+        self.producer.name = "Producer Z"
+        self.producer.save()
+        self.assertEqual(
+            self.client.get(self.url).data["max"][0]["producer"], "Producer Z"
+        )
+
+    def test_single_flight(self):
+        """
+        Test that concurrent calls for the same key run the function once.
+        """
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        def request():
+            results.append(single_flight.do("key", compute))
+
+        threads = [threading.Thread(target=request) for _ in range(50)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 50)
+
+
+class QueryBudgetTest(APITestCase):
+    """
+    APITestCase asserting a fixed query budget for every movie endpoint.
+
+    The budgets must hold whatever the number of rows a response contains, so
+    reintroducing per-row queries (N+1) makes these tests fail.
+    """
+
+    # Maximum number of queries per URL name registered in the router.
+    QUERY_BUDGETS = {
+        "api-root": 0,
+        # One DataVersion read for the ETag, then the page and its relations
+        "movie-list": 5,
+        "movie-detail": 4,
+        "movie-batch": 4,
+        "movie-awards-interval-by-producer": 2,
+        "movie-awards-intervals": 2,
+        # One read per facet
+        "movie-aggregates": 4,
+        "movie-export": 3,
+    }
+
+    def setUp(self):
+        """
+        Set up 25 movies with several producers and studios each.
+        """
+        producers = [Producer.objects.create(name=f"Producer {i}") for i in range(5)]
+        studios = [Studio.objects.create(name=f"Studio {i}") for i in range(5)]
+        for i in range(25):
+            movie = Movie.objects.create(
+                year=1980 + i, title=f"Movie {i}", winner=i % 3 == 0
+            )
+            movie.producer.add(producers[i % 5], producers[(i + 1) % 5])
+            movie.studio.add(studios[i % 5], studios[(i + 2) % 5])
+
+    def assertWithinBudget(self, name, url):
+        """
+        Requests the URL and asserts it ran at most the budget of queries.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+            if response.streaming:
+                # Streaming responses only query while their content is consumed.
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        queries = "\n".join(query["sql"] for query in context.captured_queries)
+        self.assertLessEqual(
+            len(context),
+            self.QUERY_BUDGETS[name],
+            f"{url} exceeded its query budget:\n{queries}",
+        )
+        return response
+
+    def test_every_endpoint_has_budget(self):
+        """
+        Test that no endpoint is registered without a query budget.
+        """
+        names = {url.name for url in router.urls}
+        self.assertEqual(names - set(self.QUERY_BUDGETS), set())
+
+    def test_list_budget(self):
+        """
+        Test that every list page costs the same number of queries.
+        """
+        for page in (1, 2, 3):
+            url = reverse("movie-list") + f"?page={page}"
+            response = self.assertWithinBudget("movie-list", url)
+            self.assertTrue(response.data["results"][0]["producers"])
+
+    def test_detail_budget(self):
+        """
+        Test the query budget of the detail endpoint.
+        """
+        url = reverse("movie-detail", args=[Movie.objects.first().pk])
+        self.assertWithinBudget("movie-detail", url)
+
+    def test_batch_budget(self):
+        """
+        Test that a batch costs the same queries whatever the number of ids.
+        """
+        url = reverse("movie-batch")
+        all_ids = list(Movie.objects.values_list("pk", flat=True))
+        for ids in (all_ids[:2], all_ids):
+            response = self.assertWithinBudget(
+                "movie-batch", f"{url}?ids={','.join(map(str, ids))}"
+            )
+            self.assertEqual(len(response.data["results"]), len(ids))
+
+    def test_awards_interval_budget(self):
+        """
+        Test the query budget of the awards interval endpoint.
+        """
+        url = reverse("movie-awards-interval-by-producer")
+        self.assertWithinBudget("movie-awards-interval-by-producer", url)
+
+    def test_awards_intervals_budget(self):
+        """
+        Test the query budget of the awards intervals endpoint.
+        """
+        url = reverse("movie-awards-intervals") + "?entity=studio&year_from=1990&k=3"
+        self.assertWithinBudget("movie-awards-intervals", url)
+
+    def test_aggregates_budget(self):
+        """
+        Test the query budget of the aggregates endpoint.
+        """
+        url = reverse("movie-aggregates") + "?year_from=1990&limit=3"
+        self.assertWithinBudget("movie-aggregates", url)
+
+    def test_export_budget(self):
+        """
+        Test that the export queries per chunk, not per movie.
+        """
+        self.assertWithinBudget("movie-export", reverse("movie-export"))
+
+    def test_api_root_budget(self):
+        """
+        Test that the API root does not query the database.
+        """
+        self.assertWithinBudget("api-root", reverse("api-root"))
+
+
+class BulkIngestorTest(TestCase):
+    """
+    TestCase for the set-based CSV ingestion engine.
+
+    This suite covers:
+        - Name normalization and deduplication
+        - Reuse of producers and studios already stored
+        - Chunked writes of movies and their relationships
+    """
+
+    def setUp(self):
+        """
+        Set up CSV rows spread across several chunks.
+        """
+        self.existing = Producer.objects.create(name="Allan Carr")
+        self.rows = [
+            {
+                "year": "1980",
+                "title": "Can't Stop the Music",
+                "studios": "Associated Film Distribution",
+                "producers": "Allan Carr",
+                "winner": "yes",
+            },
+            {
+                "year": "1980",
+                "title": "Cruising",
+                "studios": "Lorimar Productions, United Artists",
+                "producers": "Jerry Weintraub",
+                "winner": "",
+            },
+            {
+                "year": "1981",
+                "title": "Mommie Dearest",
+                "studios": "Paramount Pictures",
+                "producers": "Frank Yablans and Frank Yablans",
+                "winner": "yes",
+            },
+        ]
+
+    def test_ingest_rows(self):
+        """
+        Test that rows, names and relationships are written as the CSV describes.
+        """
+        ingestor = BulkIngestor(Movie, Producer, Studio, chunk_size=2)
+        result = ingestor.ingest(MovieRow.from_csv(row) for row in self.rows)
+
+        self.assertEqual(result.rows, 3)
+        self.assertEqual(Movie.objects.count(), 3)
+        self.assertEqual(Movie.objects.filter(winner=True).count(), 2)
+        self.assertEqual(Producer.objects.filter(name="Allan Carr").count(), 1)
+        self.assertEqual(Studio.objects.count(), 4)
+
+        movie = Movie.objects.get(title="Can't Stop the Music")
+        self.assertEqual(list(movie.producer.all()), [self.existing])
+
+        movie = Movie.objects.get(title="Cruising")
+        self.assertEqual(
+            sorted(movie.studio.values_list("name", flat=True)),
+            ["Lorimar Productions", "United Artists"],
+        )
+
+        movie = Movie.objects.get(title="Mommie Dearest")
+        self.assertEqual(
+            list(movie.producer.values_list("name", flat=True)), ["Frank Yablans"]
+        )
+
+
+class ParallelParsingTest(SimpleTestCase):
+    """
+    SimpleTestCase for the multi-process CSV parser.
+    """
+
+    def test_parallel_matches_sequential(self):
+        """
+        Test that byte-range parsing yields the same rows as the sequential reader.
+        """
+        with open(settings.MOVIES_CSV_PATH, newline="", encoding="utf-8") as f:
+            expected = [
+                MovieRow.from_csv(row) for row in csv.DictReader(f, delimiter=";")
+            ]
+
+        batches = list(
+            parse_csv_parallel(
+                settings.MOVIES_CSV_PATH, workers=2, range_size=512, skip=5
+            )
+        )
+        self.assertGreater(len(batches), 2)
+        self.assertEqual([row for batch in batches for row in batch.rows], expected[5:])
+        for batch in batches:
+            self.assertEqual(
+                sorted(batch.producers),
+                sorted({name for row in batch.rows for name in row.producers}),
+            )
+
+
+class ImportMoviesCommandTest(TestCase):
+    """
+    TestCase for the checkpointed `import_movies` command.
+
+    This suite covers:
+        - Chunked import of a CSV file
+        - Resuming an interrupted import from its checkpoint
+        - Skipping files that were already imported
+    """
+
+    def setUp(self):
+        """
+        Write a small movie list to a temporary file.
+        """
+        handle, self.csv_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as csv_file:
+            csv_file.write(
+                "year;title;studios;producers;winner\n"
+                "1980;Movie A;Studio X;Producer A;yes\n"
+                "1981;Movie B;Studio Y;Producer A and Producer B;\n"
+                "1982;Movie C;Studio X, Studio Y;Producer B;yes\n"
+            )
+        self.addCleanup(os.remove, self.csv_path)
+
+    def test_import_command(self):
+        """
+        Test that the command imports every row and marks the file as finished.
+        """
+        call_command("import_movies", self.csv_path, chunk_size=2, stdout=mock.Mock())
+        self.assertEqual(Movie.objects.count(), 3)
+        self.assertEqual(Producer.objects.count(), 2)
+        self.assertEqual(
+            intervals.stored_producer_intervals(), intervals.producer_intervals()
+        )
+        checkpoint = ImportCheckpoint.objects.get()
+        self.assertTrue(checkpoint.finished)
+        self.assertEqual(checkpoint.rows, 3)
+
+        self.assertIsNone(import_csv(self.csv_path))
+        self.assertEqual(Movie.objects.count(), 3)
+
+    def test_restart_replaces_imported_rows(self):
+        """
+        Test that a restart deletes the rows of the previous run instead of
+          importing them again.
+        """
+        call_command("import_movies", self.csv_path, stdout=mock.Mock())
+        version = DataVersion.current().token
+        call_command("import_movies", self.csv_path, restart=True, stdout=mock.Mock())
+
+        self.assertEqual(
+            list(Movie.objects.values_list("title", flat=True)),
+            ["Movie A", "Movie B", "Movie C"],
+        )
+        self.assertEqual(Producer.objects.count(), 2)
+        self.assertEqual(Movie.producer.through.objects.count(), 4)
+        self.assertEqual(
+            intervals.stored_producer_intervals(), intervals.producer_intervals()
+        )
+        self.assertTrue(ImportCheckpoint.objects.get().finished)
+        self.assertNotEqual(DataVersion.current().token, version)
+
+    def test_database_loaded_without_checkpoint(self):
+        """
+        Test that a database loaded by the old 0002 migration, with movies but no
+          checkpoint, is not imported again.
+        """
+        BulkIngestor(Movie, Producer, Studio).ingest_csv(self.csv_path)
+        self.assertFalse(ImportCheckpoint.objects.exists())
+
+        with self.assertRaisesMessage(CommandError, "delta"):
+            call_command("import_movies", self.csv_path, stdout=mock.Mock())
+        self.assertEqual(Movie.objects.count(), 3)
+
+        call_command("import_movies", self.csv_path, delta=True, stdout=mock.Mock())
+        self.assertEqual(Movie.objects.count(), 3)
+        self.assertIsNone(import_csv(self.csv_path))
+
+    def test_import_from_another_path(self):
+        """
+        Test that the same file reached through another path, such as a symlink,
+          is not appended on top of the imported rows.
+        """
+        call_command("import_movies", self.csv_path, stdout=mock.Mock())
+        link = f"{self.csv_path}.link.csv"
+        os.symlink(self.csv_path, link)
+        self.addCleanup(os.remove, link)
+
+        with self.assertRaisesMessage(CommandError, "delta"):
+            call_command("import_movies", link, stdout=mock.Mock())
+        self.assertEqual(Movie.objects.count(), 3)
+        self.assertEqual(ImportCheckpoint.objects.count(), 1)
+
+    def test_resume_interrupted_import(self):
+        """
+        Test that a failed chunk keeps earlier chunks and the import resumes after
+          them.
+        """
+        write_batch = BulkIngestor._write_batch
+        calls = []
+
+        def failing_write_batch(ingestor, batch):
+            calls.append(batch)
+            if len(calls) == 2:
+                raise RuntimeError("interrupted")
+            write_batch(ingestor, batch)
+
+        with mock.patch.object(BulkIngestor, "_write_batch", failing_write_batch):
+            with self.assertRaises(RuntimeError):
+                import_csv(self.csv_path, chunk_size=1)
+
+        self.assertEqual(Movie.objects.count(), 1)
+        self.assertEqual(ImportCheckpoint.objects.get().rows, 1)
+
+        result = import_csv(self.csv_path, chunk_size=1)
+        self.assertEqual(result.rows, 2)
+        self.assertEqual(
+            list(Movie.objects.values_list("title", flat=True)),
+            ["Movie A", "Movie B", "Movie C"],
+        )
+
+    def test_delta_import(self):
+        """
+        Test that a delta import only inserts, updates and deletes changed rows.
+        """
+        import_csv(self.csv_path)
+        kept = Movie.objects.get(title="Movie A")
+
+        with open(self.csv_path, "w", encoding="utf-8") as csv_file:
+            csv_file.write(
+                "year;title;studios;producers;winner\n"
+                "1980;Movie A;Studio X;Producer A;yes\n"
+                "1981;Movie B;Studio Y;Producer A and Producer B;yes\n"
+                "1983;Movie D;Studio Z;Producer C;\n"
+            )
+
+        result = sync_csv(self.csv_path)
+        self.assertEqual(
+            (result.inserted, result.updated, result.deleted, result.unchanged),
+            (1, 1, 1, 1),
+        )
+        self.assertEqual(Movie.objects.get(title="Movie A").pk, kept.pk)
+        self.assertTrue(Movie.objects.get(title="Movie B").winner)
+        self.assertFalse(Movie.objects.filter(title="Movie C").exists())
+        self.assertEqual(
+            Movie.objects.get(title="Movie D").fingerprint,
+            MovieRow(1983, "Movie D", False, ["Studio Z"], ["Producer C"]).fingerprint,
+        )
+        self.assertTrue(ImportCheckpoint.objects.get().finished)
+        self.assertIsNone(import_csv(self.csv_path))
+
+        result = sync_csv(self.csv_path)
+        self.assertEqual(result.unchanged, 3)
+        self.assertEqual(
+            intervals.stored_producer_intervals()["min"][0]["name"], "Producer A"
+        )
+
+    def test_parallel_import(self):
+        """
+        Test that importing with several parser processes writes the same rows.
+        """
+        call_command("import_movies", self.csv_path, workers=2, stdout=mock.Mock())
+        self.assertEqual(
+            list(Movie.objects.values_list("title", "winner")),
+            [("Movie A", True), ("Movie B", False), ("Movie C", True)],
+        )
+        self.assertEqual(Studio.objects.count(), 2)
+
+
+class GenerateMoviesCommandTest(TestCase):
+    """
+    TestCase for the synthetic dataset generator and `generate_movies` command.
+    """
+
+    def test_rows_are_seeded(self):
+        """
+        Test that a spec always generates the same rows, within its parameters.
+        """
+        spec = SyntheticSpec(movies=500, winner_ratio=0.3, year_from=1990)
+        rows = list(generate_rows(spec))
+        self.assertEqual(rows, list(generate_rows(spec)))
+        self.assertNotEqual(rows, list(generate_rows(SyntheticSpec(movies=500))))
+
+        self.assertEqual(len(rows), 500)
+        self.assertEqual([row.year for row in rows], sorted(row.year for row in rows))
+        self.assertEqual((rows[0].year, rows[-1].year), (1990, 2025))
+        self.assertAlmostEqual(sum(row.winner for row in rows) / 500, 0.3, delta=0.06)
+
+    def test_csv_round_trip(self):
+        """
+        Test that the written CSV parses back to the generated rows.
+        """
+        rows = list(generate_rows(SyntheticSpec(movies=300, producers_per_movie=3)))
+        output = io.StringIO()
+        self.assertEqual(write_csv(rows, output), 300)
+        output.seek(0)
+        parsed = [
+            MovieRow.from_csv(row) for row in csv.DictReader(output, delimiter=";")
+        ]
+        self.assertEqual(parsed, rows)
+
+    def test_command_loads_database(self):
+        """
+        Test that the command adds the movies and keeps derived data in sync.
+        """
+        call_command("generate_movies", movies=400, chunk_size=150, stdout=mock.Mock())
+        self.assertEqual(Movie.objects.count(), 400)
+        self.assertEqual(
+            intervals.stored_producer_intervals(), intervals.producer_intervals()
+        )
+        self.assertTrue(intervals.stored_producer_intervals()["max"])
+
+        with self.assertRaises(CommandError):
+            call_command("generate_movies", movies=0, stdout=mock.Mock())
+
+
+class SchemaArtifactTest(APITestCase):
+    """
+    APITestCase for the precomputed OpenAPI schema.
+    """
+
+    def setUp(self):
+        precomputed_schema.clear()
+        self.addCleanup(precomputed_schema.clear)
+
+    def test_artifact_is_up_to_date(self):
+        """
+        Test that the schema artifact matches the code; regenerate it with
+        `python manage.py build_schema`.
+        """
+        call_command("build_schema", check=True, stdout=mock.Mock())
+
+    def test_check_fails_when_stale(self):
+        """
+        Test that `build_schema --check` fails on an outdated artifact.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "openapi.yaml")
+            with self.settings(OPENAPI_SCHEMA_PATH=path):
+                with self.assertRaises(CommandError):
+                    call_command("build_schema", check=True, stdout=mock.Mock())
+                call_command("build_schema", stdout=mock.Mock())
+                call_command("build_schema", check=True, stdout=mock.Mock())
+
+    def test_schema_served_from_artifact(self):
+        """
+        Test that the schema is served from the artifact with caching headers.
+        """
+        url = reverse("schema")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, read_artifact())
+        self.assertIn("max-age", response["Cache-Control"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(url, {"format": "json"})
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertEqual(
+            response.json()["info"]["title"], "Golden Raspberry Awards API"
+        )
+
+    def test_schema_generated_without_artifact(self):
+        """
+        Test that without the artifact the schema is generated on first use.
+        """
+        with self.settings(OPENAPI_SCHEMA_PATH="/nonexistent/openapi.yaml"):
+            response = self.client.get(reverse("schema"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, generate_schema())
@@ -0,0 +1,211 @@
+"""
+Per-request performance instrumentation.
+
+While ServerTimingMiddleware is enabled it collects, for each request, the number
+and total duration of its database queries and the time spent serializing and
+rendering, then reports them in a `Server-Timing` header and a structured log
+line. When disabled the only cost is a clock read per request and a context
+variable lookup per query.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SWITCH_KEY = "movies:server-timing"
+# Seconds between two reads of the runtime switch in each process.
+SWITCH_TTL = 1.0
+
+
+class RequestTimings:
+    """
+    Durations, in seconds, accumulated during one request.
+    """
+
+    __slots__ = ("queries", "db", "serialize", "render")
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.render = 0.0
+
+    def header(self, total: float) -> str:
+        def metric(name, seconds, description=None):
+            value = f"{name};dur={seconds * 1000:.2f}"
+            return f'{value};desc="{description}"' if description else value
+
+        return ", ".join(
+            [
+                metric("db", self.db, f"{self.queries} queries"),
+                metric("serialize", self.serialize),
+                metric("render", self.render),
+                metric("total", total),
+            ]
+        )
+
+    def as_dict(self, total: float) -> dict:
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db * 1000, 3),
+            "serialize_ms": round(self.serialize * 1000, 3),
+            "render_ms": round(self.render * 1000, 3),
+            "total_ms": round(total * 1000, 3),
+        }
+
+
+_current: ContextVar = ContextVar("movies_request_timings", default=None)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Adds the duration of the block to the `serialize` or `render` timing of the
+    current request, if it is being measured.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timings, name, getattr(timings, name) + time.perf_counter() - started)
+
+
+def query_timer(execute, sql, params, many, context):
+    """
+    Database execute wrapper timing the queries of measured requests.
+
+    The context variable follows the request into sync_to_async threads, so the
+    queries of async views are counted as well.
+    """
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - started
+        timings.queries += 1
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """
+    Connected to connection_created; `connection.execute_wrapper()` scoped to the
+    whole life of the connection.
+    """
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+class TimingSwitch:
+    """
+    Runtime on/off switch stored in the movies cache, so every process sharing
+    the cache backend follows it. Defaults to settings.MOVIES_SERVER_TIMING.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._checked_at = None
+
+    def is_enabled(self) -> bool:
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at > SWITCH_TTL:
+            from apps.movies.cache import get_cache
+
+            self._enabled = get_cache().get(SWITCH_KEY, settings.MOVIES_SERVER_TIMING)
+            self._checked_at = now
+        return self._enabled
+
+    def is_shared(self) -> bool:
+        """
+        Whether other processes see the values `set` stores: local memory and dummy
+        caches keep them to the current process.
+        """
+        from django.core.cache.backends.dummy import DummyCache
+        from django.core.cache.backends.locmem import LocMemCache
+
+        from apps.movies.cache import get_cache
+
+        return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+    def set(self, enabled: bool):
+        from apps.movies.cache import get_cache
+
+        get_cache().set(SWITCH_KEY, enabled, None)
+        self._checked_at = None
+
+    def reset(self):
+        """
+        Drops the runtime value, going back to settings.MOVIES_SERVER_TIMING.
+        """
+        from apps.movies.cache import get_cache
+
+        get_cache().delete(SWITCH_KEY)
+        self._checked_at = None
+
+
+switch = TimingSwitch()
+
+
+class ServerTimingMiddleware:
+    """
+    Measures requests while the timing switch is on.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not switch.is_enabled():
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, timings, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if not switch.is_enabled():
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, timings, time.perf_counter() - started)
+
+    def report(self, request, response, timings: RequestTimings, total: float):
+        response["Server-Timing"] = timings.header(total)
+        record = {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "status": response.status_code,
+            **timings.as_dict(total),
+        }
+        logger.info(json.dumps(record), extra={"timings": record})
+        return response
@@ -1,9 +1,20 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from apps.movies.api.views import MovieViewSet
+from apps.movies.api.views import MovieViewSet, movie_async
 
 router = DefaultRouter()
 router.register("movie", MovieViewSet, basename="movie")
 
+# Native async versions of the read endpoints, for ASGI servers.
+async_urlpatterns = [
+    path("async/movie/", movie_async.movie_list, name="movie-async-list"),
+    path("async/movie/<int:pk>/", movie_async.movie_detail, name="movie-async-detail"),
+    path(
+        "async/movie/awards-interval-by-producer/",
+        movie_async.awards_interval_by_producer,
+        name="movie-async-awards-interval-by-producer",
+    ),
+]
 
-urlpatterns = router.urls
+urlpatterns = router.urls + async_urlpatterns
@@ -0,0 +1,58 @@
+"""
+Performance benchmarks for the movies API.
+
+Each module is a standalone script, run from the project root, for example:
+
+    python -m benchmarks.awards_interval
+
+Benchmarks run against a throwaway test database, never against db.sqlite3. The
+load tests are the exception: they drive a running server, which only reads its
+configured database.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "movies_awards.settings")
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database(name=None):
+    """
+    Creates and migrates a test database for the duration of the block.
+
+    Args:
+        name (str, optional): File of the test database; SQLite test databases
+          are in memory by default, which rules out journaling and concurrent
+          connections.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    if name is not None:
+        connection.settings_dict["TEST"]["NAME"] = name
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def best_of(function, repeat=3) -> float:
+    """
+    Returns the best wall-clock time, in seconds, of `repeat` calls.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
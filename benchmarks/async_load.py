@@ -0,0 +1,168 @@
+"""
+Load test comparing the sync (DRF) and native async read endpoints over ASGI.
+
+Usage:
+    python -m benchmarks.async_load [--connections 1000] [--duration 10]
+
+Starts uvicorn (`pip install uvicorn`) on movies_awards.asgi, unless `--url` points
+at a running server, then keeps every connection busy with keep-alive GET
+requests on the list, detail and awards interval endpoints of each stack in turn,
+reporting throughput and latency percentiles.
+
+It reads the configured database, so load the movie list first with
+`python manage.py import_movies`.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+STACKS = {
+    "sync": "/api/v1/movies/movie/",
+    "async": "/api/v1/movies/async/movie/",
+}
+ENDPOINTS = ["", "?page=2", "1/", "awards-interval-by-producer/"]
+
+
+async def read_response(reader) -> int:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def connection_worker(host, port, paths, deadline, latencies, errors):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append("connect")
+        return
+    requests = [
+        f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode() for path in paths
+    ]
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(requests[i % len(requests)])
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+            i += 1
+    except (OSError, ConnectionError, asyncio.IncompleteReadError):
+        errors.append("disconnected")
+    finally:
+        writer.close()
+
+
+async def load(host, port, prefix, connections, duration):
+    paths = [prefix + endpoint for endpoint in ENDPOINTS]
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            connection_worker(host, port, paths, deadline, latencies, errors)
+            for _ in range(connections)
+        )
+    )
+    return latencies, errors, time.perf_counter() - started
+
+
+def percentile(values, fraction) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def wait_for_server(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(asyncio.wait_for(asyncio.open_connection(host, port), 1))
+            return
+        except (OSError, asyncio.TimeoutError):
+            time.sleep(0.2)
+    raise RuntimeError(f"server did not start on {host}:{port}")
+
+
+def start_server(port):
+    try:
+        import uvicorn  # noqa: F401
+    except ImportError:
+        sys.exit("uvicorn is required to start the server: pip install uvicorn")
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "movies_awards.settings"}
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "movies_awards.asgi:application",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+            "--backlog",
+            "4096",
+        ],
+        env=env,
+    )
+
+
+def run(url, connections, duration):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+
+    print(
+        f"{'stack':>6} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>7}"
+    )
+    for stack, prefix in STACKS.items():
+        latencies, errors, elapsed = asyncio.run(
+            load(host, port, prefix, connections, duration)
+        )
+        print(
+            f"{stack:>6} {len(latencies):>9} {len(latencies) / elapsed:>8.0f} "
+            f"{percentile(latencies, 0.50) * 1000:>8.1f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.1f} {len(errors):>7}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="Running server to test, e.g. http://host:8000")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args.port)
+    try:
+        wait_for_server(urlsplit(url).hostname, urlsplit(url).port or 80)
+        run(url, args.connections, args.duration)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compares the window function (LAG), single-pass and materialized table
+implementations of the awards interval by producer.
+
+Usage:
+    python -m benchmarks.awards_interval [--scales 10000 100000 1000000]
+
+Each scale is a number of winning movies, spread over producers that win about
+four times each, with one producer per movie.
+"""
+
+import argparse
+import random
+
+from . import best_of, setup_django, test_database
+
+
+def populate(winners: int, seed: int):
+    from apps.movies.models import Movie, Producer
+
+    rng = random.Random(seed)
+    producers = Producer.objects.bulk_create(
+        [Producer(name=f"Producer {i}") for i in range(max(winners // 4, 1))],
+        batch_size=10000,
+    )
+    movies = Movie.objects.bulk_create(
+        [
+            Movie(year=rng.randint(1900, 2025), title=f"Movie {i}", winner=True)
+            for i in range(winners)
+        ],
+        batch_size=10000,
+    )
+    Through = Movie.producer.through
+    Through.objects.bulk_create(
+        [
+            Through(movie_id=movie.pk, producer_id=rng.choice(producers).pk)
+            for movie in movies
+        ],
+        batch_size=10000,
+    )
+
+
+def run(scales, repeat, seed):
+    from apps.movies.services import intervals
+
+    print(
+        f"{'winners':>10} {'window/LAG':>12} {'single-pass':>12} {'speedup':>8} "
+        f"{'materialized':>13}"
+    )
+    for winners in scales:
+        with test_database():
+            populate(winners, seed)
+            intervals.rebuild_producer_intervals()
+
+            expected = intervals.producer_intervals_sql()
+            for implementation in (
+                intervals.producer_intervals,
+                intervals.stored_producer_intervals,
+            ):
+                if implementation() != expected:
+                    raise AssertionError(
+                        f"{implementation.__name__} differs at {winners} winners"
+                    )
+
+            window = best_of(intervals.producer_intervals_sql, repeat)
+            single_pass = best_of(intervals.producer_intervals, repeat)
+            materialized = best_of(intervals.stored_producer_intervals, repeat)
+        print(
+            f"{winners:>10} {window:>11.3f}s {single_pass:>11.3f}s "
+            f"{window / single_pass:>7.1f}x {materialized:>12.4f}s"
+        )
+
+    engine = "NumPy" if intervals.numpy is not None else "pure Python"
+    print(f"single-pass engine: {engine}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.scales, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Measures read throughput while an import is writing, per database profile.
+
+Usage:
+    python -m benchmarks.concurrent_reads [--movies 20000] [--import-rows 50000]
+
+Each profile (MOVIES_DB_PROFILE) runs in its own process on a file-backed test
+database holding `--movies` movies. Reader threads then fetch list pages (a page
+of movies with their producers and studios) for as long as an import of
+`--import-rows` new movies, committed in chunks, takes to finish.
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from . import setup_django, test_database
+
+PROFILES = ["development", "production"]
+
+
+def reader(stop, latencies, errors, seed):
+    from django.db import OperationalError, connections
+
+    from apps.movies.models import Movie
+
+    rng = random.Random(seed)
+    queryset = Movie.objects.prefetch_related("studio", "producer")
+    try:
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                list(queryset.filter(year=rng.randint(1980, 2025))[:10])
+            except OperationalError:
+                errors.append(time.perf_counter() - started)
+                continue
+            latencies.append(time.perf_counter() - started)
+    finally:
+        connections.close_all()
+
+
+def run(profile, movies, import_count, readers, chunk_size, seed):
+    from django.db import connections
+
+    from apps.movies.services import SyntheticSpec, generate_rows, import_rows
+
+    with tempfile.TemporaryDirectory() as directory:
+        with test_database(os.path.join(directory, "benchmark.sqlite3")):
+            import_rows(generate_rows(SyntheticSpec(movies=movies, seed=seed)))
+            connections.close_all()
+
+            stop = threading.Event()
+            latencies, errors = [], []
+            threads = [
+                threading.Thread(target=reader, args=(stop, latencies, errors, i))
+                for i in range(readers)
+            ]
+            for thread in threads:
+                thread.start()
+
+            started = time.perf_counter()
+            import_rows(
+                generate_rows(SyntheticSpec(movies=import_count, seed=seed + 1)),
+                chunk_size=chunk_size,
+            )
+            elapsed = time.perf_counter() - started
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else float("nan")
+    print(
+        f"{profile:>12} {elapsed:>9.2f}s {len(latencies) / elapsed:>9.0f} "
+        f"{p99 * 1000:>8.1f} {len(errors):>7}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--movies", type=int, default=20_000)
+    parser.add_argument("--import-rows", type=int, default=50_000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        os.environ["MOVIES_DB_PROFILE"] = args.profile
+        setup_django()
+        run(
+            args.profile,
+            args.movies,
+            args.import_rows,
+            args.readers,
+            args.chunk_size,
+            args.seed,
+        )
+        return
+
+    # Settings are read once per process, so each profile gets its own.
+    print(f"{'profile':>12} {'import':>10} {'reads/s':>9} {'p99 ms':>8} {'errors':>7}")
+    for profile in PROFILES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.concurrent_reads", "--profile", profile]
+            + sys.argv[1:],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares list and detail reads with and without the denormalized Movie.lookups.
+
+Usage:
+    python -m benchmarks.denormalized_lookups [--movies 20000] [--repeat 20]
+
+Generates a dataset into a test database, then times each request through the
+fast serialization path with MOVIES_DENORMALIZED_LOOKUPS off (one query per
+relation) and on (no joins). Both responses are checked to be byte-for-byte equal
+first.
+"""
+
+import argparse
+
+from . import best_of, setup_django, test_database
+
+
+def run(movies, repeat, seed):
+    from django.conf import settings
+    from django.test import Client
+    from django.urls import reverse
+
+    from apps.movies.models import Movie
+    from apps.movies.services import SyntheticSpec, generate_rows, import_rows
+
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.MOVIES_FAST_SERIALIZATION = True
+    client = Client()
+
+    with test_database():
+        import_rows(generate_rows(SyntheticSpec(movies=movies, seed=seed)))
+        list_url = reverse("movie-list")
+        middle = Movie.objects.order_by("year", "id")[movies // 2]
+        requests = {
+            "list": list_url,
+            "list_middle_page": f"{list_url}?page={movies // 20}",
+            "list_cursor": f"{list_url}?pagination=cursor&year_from={middle.year}",
+            "list_filtered": f"{list_url}?winner=true&year_from=2000",
+            "detail": reverse("movie-detail", args=[middle.id]),
+            "async_list": f"{reverse('movie-async-list')}?page={movies // 20}",
+        }
+
+        def get(url):
+            response = client.get(url)
+            if response.status_code != 200:
+                raise AssertionError(f"{url} returned {response.status_code}")
+            return response.content
+
+        print(f"{movies} movies")
+        print(f"{'request':<18} {'joins ms':>10} {'lookups ms':>11} {'speedup':>8}")
+        for name, url in requests.items():
+            settings.MOVIES_DENORMALIZED_LOOKUPS = False
+            expected = get(url)
+            joins = best_of(lambda: get(url), repeat)
+            settings.MOVIES_DENORMALIZED_LOOKUPS = True
+            if get(url) != expected:
+                raise AssertionError(f"{name}: responses differ")
+            lookups = best_of(lambda: get(url), repeat)
+            print(
+                f"{name:<18} {joins * 1000:>10.2f} {lookups * 1000:>11.2f} "
+                f"{joins / lookups:>7.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--movies", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.movies, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Times ingestion and the read endpoints on generated datasets of growing size.
+
+Usage:
+    python -m benchmarks.scale [--scales 1000 10000 100000] [--output FILE]
+    python -m benchmarks.scale --compare OLD.json NEW.json
+
+Each scale is a number of movies generated by the `generate_movies` service into
+a fresh file-backed test database. The results, with the commit they were taken
+at, are written as JSON (by default to benchmarks/results/scale-<commit>.json),
+and `--compare` prints the ratio of every timing between two result files.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import best_of, setup_django, test_database
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment() -> dict:
+    import sqlite3
+
+    import django
+
+    return {
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "machine": platform.machine(),
+        "db_profile": os.environ.get("MOVIES_DB_PROFILE", "development"),
+    }
+
+
+def measure(spec, repeat) -> dict:
+    from django.test import Client
+    from django.urls import reverse
+
+    from apps.movies.api.pagination import MovieKeysetPagination
+    from apps.movies.cache import get_cache
+    from apps.movies.models import Movie
+    from apps.movies.services import generate_rows, import_rows
+
+    result = import_rows(generate_rows(spec))
+    metrics = {"ingest": result.elapsed}
+
+    client = Client()
+    list_url = reverse("movie-list")
+    middle = Movie.objects.order_by("year", "id")[spec.movies // 2]
+    cursor = MovieKeysetPagination().encode_cursor(middle.year, middle.id)
+    pages = max(spec.movies // 10, 1)
+    requests = {
+        "list_first_page": list_url,
+        "list_middle_page": f"{list_url}?page={pages // 2 + 1}",
+        "list_middle_cursor": f"{list_url}?cursor={cursor}",
+        "list_filtered": f"{list_url}?winner=true&year_from=2000",
+        "search": f"{list_url}?search=frozen shadow",
+        "detail": reverse("movie-detail", args=[middle.id]),
+    }
+
+    def get(url):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise AssertionError(f"{url} returned {response.status_code}")
+
+    for name, url in requests.items():
+        metrics[name] = best_of(lambda: get(url), repeat)
+
+    awards_url = reverse("movie-awards-interval-by-producer")
+
+    def awards_cold():
+        get_cache().clear()
+        get(awards_url)
+
+    metrics["awards_interval_cold"] = best_of(awards_cold, repeat)
+    metrics["awards_interval_warm"] = best_of(lambda: get(awards_url), repeat)
+    return metrics
+
+
+def run(scales, repeat, seed, output):
+    from dataclasses import asdict
+
+    from apps.movies.services import SyntheticSpec
+
+    results = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "scales": [],
+    }
+    for movies in scales:
+        spec = SyntheticSpec(movies=movies, seed=seed)
+        with tempfile.TemporaryDirectory() as directory:
+            with test_database(os.path.join(directory, "benchmark.sqlite3")):
+                metrics = measure(spec, repeat)
+        results["scales"].append({"spec": asdict(spec), "seconds": metrics})
+        print(f"{movies:>10} movies")
+        for name, seconds in metrics.items():
+            print(f"{'':>10} {name:<22} {seconds * 1000:>10.1f} ms")
+
+    output = Path(output or RESULTS_DIR / f"scale-{results['commit']}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"results written to {output}")
+
+
+def compare(old_path, new_path):
+    old, new = (json.loads(Path(path).read_text()) for path in (old_path, new_path))
+    old_scales = {scale["spec"]["movies"]: scale["seconds"] for scale in old["scales"]}
+
+    print(f"{old['commit']} -> {new['commit']} (ratio > 1 is slower)")
+    for scale in new["scales"]:
+        movies = scale["spec"]["movies"]
+        if movies not in old_scales:
+            continue
+        print(f"{movies:>10} movies")
+        for name, seconds in scale["seconds"].items():
+            before = old_scales[movies].get(name)
+            if before:
+                print(
+                    f"{'':>10} {name:<22} {before * 1000:>10.1f} ms "
+                    f"{seconds * 1000:>10.1f} ms {seconds / before:>6.2f}x"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Results file to write.")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two results."
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    setup_django()
+    run(args.scales, args.repeat, args.seed, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Compares the DRF serializers with the fast serialization path on movie pages.
+
+Usage:
+    python -m benchmarks.serialization [--movies 5000] [--page-sizes 10 100 1000]
+
+Each run serializes and renders the first page of the given size, the way the
+list endpoint does, and reports serialized rows per second for both paths. The
+two outputs are checked to be byte-for-byte equal first.
+"""
+
+import argparse
+import random
+
+from . import best_of, setup_django, test_database
+
+
+def populate(movies: int, seed: int):
+    from apps.movies.models import Movie, Producer, Studio
+
+    rng = random.Random(seed)
+    producers = Producer.objects.bulk_create(
+        [Producer(name=f"Producer {i}") for i in range(max(movies // 3, 1))]
+    )
+    studios = Studio.objects.bulk_create(
+        [Studio(name=f"Studio {i}") for i in range(max(movies // 50, 1))]
+    )
+    created = Movie.objects.bulk_create(
+        [
+            Movie(
+                year=rng.randint(1980, 2025),
+                title=f"Movie {i}",
+                winner=rng.random() < 0.2,
+            )
+            for i in range(movies)
+        ],
+        batch_size=5000,
+    )
+    for relation, choices, per_movie in (
+        (Movie.producer, producers, 3),
+        (Movie.studio, studios, 2),
+    ):
+        Through = relation.through
+        field = relation.field.m2m_reverse_field_name()
+        Through.objects.bulk_create(
+            [
+                Through(movie_id=movie.pk, **{f"{field}_id": related.pk})
+                for movie in created
+                for related in rng.sample(choices, min(per_movie, len(choices)))
+            ],
+            batch_size=5000,
+        )
+
+
+def run(movies, page_sizes, repeat, seed):
+    from django.conf import settings
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.movies.api.renderers import FastJSONRenderer, orjson
+    from apps.movies.api.serializers import MovieSerializer, fast
+    from apps.movies.models import Movie
+
+    settings.MOVIES_FAST_SERIALIZATION = True
+    queryset = Movie.objects.prefetch_related("studio", "producer")
+
+    def drf(size):
+        page = list(queryset[:size])
+        return JSONRenderer().render(MovieSerializer(page, many=True).data)
+
+    def fast_path(size):
+        rows = fast.movie_rows(queryset)[:size]
+        return FastJSONRenderer().render(fast.serialize_movies(rows))
+
+    with test_database():
+        populate(movies, seed)
+        print(
+            f"{'page size':>10} {'DRF rows/s':>12} {'fast rows/s':>12} {'speedup':>8}"
+        )
+        for size in page_sizes:
+            if drf(size) != fast_path(size):
+                raise AssertionError(f"outputs differ at page size {size}")
+            drf_time = best_of(lambda: drf(size), repeat)
+            fast_time = best_of(lambda: fast_path(size), repeat)
+            print(
+                f"{size:>10} {size / drf_time:>12,.0f} {size / fast_time:>12,.0f} "
+                f"{drf_time / fast_time:>7.1f}x"
+            )
+
+    encoder = "orjson" if orjson is not None else "json (orjson not installed)"
+    print(f"fast path encoder: {encoder}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--movies", type=int, default=5000)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.movies, args.page_sizes, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the database and in-memory snapshot paths of the read endpoints.
+
+Usage:
+    python -m benchmarks.snapshot_serving [--movies 20000] [--repeat 20]
+
+Generates a dataset into a test database, then times each request with
+MOVIES_SNAPSHOT_SERVING off (with the fast serialization path) and on. Both
+responses are checked to be byte-for-byte equal first.
+"""
+
+import argparse
+
+from . import best_of, setup_django, test_database
+
+
+def run(movies, repeat, seed):
+    from django.conf import settings
+    from django.test import Client
+    from django.urls import reverse
+
+    from apps.movies.api.pagination import MovieKeysetPagination
+    from apps.movies.cache import get_cache
+    from apps.movies.models import Movie
+    from apps.movies.services import SyntheticSpec, generate_rows, import_rows
+    from apps.movies.snapshot import snapshots
+
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.MOVIES_FAST_SERIALIZATION = True
+    client = Client()
+
+    with test_database():
+        import_rows(generate_rows(SyntheticSpec(movies=movies, seed=seed)))
+        list_url = reverse("movie-list")
+        middle = Movie.objects.order_by("year", "id")[movies // 2]
+        cursor = MovieKeysetPagination().encode_cursor(middle.year, middle.id)
+        requests = {
+            "list": list_url,
+            "list_middle_page": f"{list_url}?page={movies // 20}",
+            "list_cursor": f"{list_url}?cursor={cursor}",
+            "list_filtered": f"{list_url}?winner=true&year_from=2000",
+            "search": f"{list_url}?search=frozen shadow",
+            "detail": reverse("movie-detail", args=[middle.id]),
+            "awards_interval": reverse("movie-awards-interval-by-producer"),
+        }
+
+        def get(url):
+            # Responses would otherwise come from the awards interval cache.
+            get_cache().clear()
+            response = client.get(url)
+            if response.status_code != 200:
+                raise AssertionError(f"{url} returned {response.status_code}")
+            return response.content
+
+        loaded = best_of(snapshots.refresh, 1)
+        print(f"{movies} movies, snapshot loaded in {loaded * 1000:.0f} ms")
+        print(f"{'request':<18} {'database ms':>12} {'snapshot ms':>12} {'speedup':>8}")
+        for name, url in requests.items():
+            settings.MOVIES_SNAPSHOT_SERVING = False
+            expected = get(url)
+            database = best_of(lambda: get(url), repeat)
+            settings.MOVIES_SNAPSHOT_SERVING = True
+            if get(url) != expected:
+                raise AssertionError(f"{name}: responses differ")
+            snapshot = best_of(lambda: get(url), repeat)
+            print(
+                f"{name:<18} {database * 1000:>12.2f} {snapshot * 1000:>12.2f} "
+                f"{database / snapshot:>7.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--movies", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.movies, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
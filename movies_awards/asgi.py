@@ -9,8 +9,19 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'movies_awards.settings')
 
 application = get_asgi_application()
+
+if settings.MOVIES_IMPORT_ON_STARTUP:
+    from apps.movies.services import start_background_import
+
+    start_background_import(settings.MOVIES_CSV_PATH)
+
+if settings.MOVIES_SNAPSHOT_SERVING:
+    from apps.movies.snapshot import snapshots
+
+    snapshots.refresh_in_background()
@@ -0,0 +1,110 @@
+"""
+Precomputed OpenAPI schema.
+
+SpectacularAPIView introspects every view and serializer on each request. The
+schema only changes with the code, so it is generated at build time into
+settings.OPENAPI_SCHEMA_PATH (`python manage.py build_schema`) and served from
+memory, rendered once per format. Without the artifact it is generated on the
+first request instead.
+"""
+
+import hashlib
+import threading
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+
+# Seconds clients and proxies may reuse the schema before revalidating it.
+MAX_AGE = 60 * 60
+
+
+def generate_schema() -> bytes:
+    """
+    Generates the schema from the code, as `python manage.py spectacular`.
+    """
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    return OpenApiYamlRenderer().render(schema, renderer_context={})
+
+
+def read_artifact():
+    try:
+        with open(settings.OPENAPI_SCHEMA_PATH, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+class PrecomputedSchema:
+    """
+    The schema rendered in each format, with its ETag.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rendered = {}
+
+    def get(self, format: str):
+        """
+        Returns:
+            tuple: The rendered schema in `format` ("yaml" or "json") and its ETag.
+        """
+        rendered = self._rendered.get(format)
+        if rendered is None:
+            with self._lock:
+                if not self._rendered:
+                    self._load()
+                rendered = self._rendered[format]
+        return rendered
+
+    def clear(self):
+        with self._lock:
+            self._rendered = {}
+
+    def _load(self):
+        content = read_artifact() or generate_schema()
+        json_content = OpenApiJsonRenderer().render(
+            yaml.safe_load(content), renderer_context={}
+        )
+        self._rendered = {
+            "yaml": (content, self._etag(content)),
+            "json": (json_content, self._etag(json_content)),
+        }
+
+    @staticmethod
+    def _etag(content: bytes) -> str:
+        return f'"{hashlib.sha1(content).hexdigest()}"'
+
+
+precomputed_schema = PrecomputedSchema()
+
+
+class PrecomputedSchemaView(SpectacularAPIView):
+    """
+    SpectacularAPIView serving the precomputed schema, with caching headers.
+
+    The format is still selected through content negotiation.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        content, etag = precomputed_schema.get(renderer.format)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            content_type = request.accepted_media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            response = HttpResponse(content, content_type=content_type)
+            response["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, None)}"'
+            )
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=MAX_AGE)
+        return response
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.movies.timing.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -84,6 +86,60 @@ DATABASES = {
     }
 }
 
+# Pragmas run on every new SQLite connection (apps.movies.db), and the alias that
+# serves reads when a read-only connection is configured.
+MOVIES_SQLITE_PRAGMAS = {}
+MOVIES_READ_DATABASE = None
+
+# MOVIES_DB_PROFILE=production: WAL journaling, so readers never wait for an
+# import, plus memory-mapped I/O, a larger page cache and persistent connections.
+# MOVIES_DB_READ_REPLICA=1 adds a read-only alias on the same file for reads.
+MOVIES_DB_PROFILE = os.environ.get("MOVIES_DB_PROFILE", "development")
+
+if MOVIES_DB_PROFILE == "production":
+    DATABASES["default"].update(
+        CONN_MAX_AGE=600,
+        CONN_HEALTH_CHECKS=True,
+        OPTIONS={
+            # Seconds a writer waits for the lock; IMMEDIATE takes it at BEGIN,
+            # avoiding the deadlock of two transactions upgrading to writers.
+            "timeout": 20,
+            "transaction_mode": "IMMEDIATE",
+        },
+    )
+    MOVIES_SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # KiB
+        "temp_store": "MEMORY",
+    }
+    if os.environ.get("MOVIES_DB_READ_REPLICA") == "1":
+        DATABASES["replica"] = {
+            **DATABASES["default"],
+            "OPTIONS": {"timeout": 20},
+            "TEST": {"MIRROR": "default"},
+        }
+        DATABASE_ROUTERS = ["apps.movies.db.ReadReplicaRouter"]
+        MOVIES_READ_DATABASE = "replica"
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Cache used for computed API responses; point it to a shared backend (e.g.
+# Redis) to share entries between processes. Entries are keyed on the data
+# generation, so the timeout only bounds how long superseded entries linger.
+MOVIES_CACHE_ALIAS = "default"
+
+MOVIES_CACHE_TIMEOUT = 60 * 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -145,3 +201,40 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
 }
+
+# OpenAPI schema artifact served at /api/v1/schema/, generated at build time with
+# `python manage.py build_schema`; `build_schema --check` fails when it is stale.
+
+OPENAPI_SCHEMA_PATH = BASE_DIR / "openapi.yaml"
+
+# Movie list import
+# `python manage.py import_movies` loads MOVIES_CSV_PATH. With
+# MOVIES_IMPORT_ON_STARTUP the WSGI/ASGI application runs the same import in a
+# background thread, so the API starts serving before the load finishes.
+
+MOVIES_CSV_PATH = BASE_DIR / "movielist.csv"
+
+MOVIES_IMPORT_ON_STARTUP = os.environ.get("MOVIES_IMPORT_ON_STARTUP") == "1"
+
+# Read endpoints build responses from values_list() rows and render them with
+# orjson when installed, instead of going through the DRF serializers. Responses
+# are the same either way.
+MOVIES_FAST_SERIALIZATION = os.environ.get("MOVIES_FAST_SERIALIZATION") == "1"
+
+# List, retrieve, search and the awards interval answer from an in-memory snapshot
+# of the data (apps.movies.snapshot), loaded at startup and reloaded whenever the
+# data version changes. For read-only deployments, where data only changes on
+# imports. Responses are the same as from the database.
+MOVIES_SNAPSHOT_SERVING = os.environ.get("MOVIES_SNAPSHOT_SERVING") == "1"
+
+# List and retrieve read the studio and producer names denormalized on
+# Movie.lookups, one table and no joins, through the values_list() rows path.
+# Movies whose lookups are not computed yet fall back to the relations;
+# `python manage.py check_movie_lookups` verifies them against the relations.
+MOVIES_DENORMALIZED_LOOKUPS = os.environ.get("MOVIES_DENORMALIZED_LOOKUPS") == "1"
+
+# Server-Timing header and structured log line per request (apps.movies.timing).
+# `python manage.py server_timing on|off` switches it at runtime through the
+# movies cache, so it reaches the server processes with a shared cache backend;
+# with a process-local one, such as the default LocMemCache, the command fails.
+MOVIES_SERVER_TIMING = os.environ.get("MOVIES_SERVER_TIMING") == "1"